@@ -5,6 +5,8 @@ CodinGame API Wrapper
 Wrapper for the undocumented CodinGame API.
 """
 
+import importlib
+import typing
 from typing import NamedTuple
 
 VersionInfo = NamedTuple(
@@ -17,134 +19,232 @@ __title__ = "codingame"
 __author__ = "takos22"
 __version__ = "1.4.3"
 
-from .clash_of_code import ClashOfCode, Player
-from .client import Client
-from .codingamer import CodinGamer, PartialCodinGamer
-from .exceptions import (
-    ChallengeNotFound,
-    ClashOfCodeNotFound,
-    CodinGameAPIError,
-    CodinGamerNotFound,
-    EmailNotLinked,
-    EmailRequired,
-    IncorrectPassword,
-    LoginError,
-    LoginRequired,
-    MalformedEmail,
-    NotFound,
-    PasswordRequired,
-    PuzzleNotFound,
-    WrongCaptchaAnswer,
-)
-from .leaderboard import (
-    ChallengeLeaderboard,
-    ChallengeRankedCodinGamer,
-    GlobalLeaderboard,
-    GlobalRankedCodinGamer,
-    League,
-    PuzzleLeaderboard,
-    PuzzleRankedCodinGamer,
-)
-from .notification import (
-    AchievementUnlockedData,
-    CareerCandidateData,
-    ClashInviteData,
-    ClashOverData,
-    CommentType,
-    Contribution,
-    ContributionData,
-    ContributionModeratedActionType,
-    ContributionModeratedData,
-    ContributionType,
-    CustomData,
-    FeatureData,
-    FriendRegisteredData,
-    GenericData,
-    JobAcceptedData,
-    JobExpiredData,
-    LanguageMapping,
-    LeagueData,
-    NewBlogData,
-    NewCommentData,
-    NewHintData,
-    NewLevelData,
-    NewPuzzleData,
-    NewWorkBlogData,
-    Notification,
-    NotificationData,
-    NotificationType,
-    NotificationTypeGroup,
-    OfferApplyData,
-    PuzzleOfTheWeekData,
-    PuzzleSolution,
-    QuestCompletedData,
-    TestFinishedData,
-)
+# the public names are imported on first access to speed up the import of the
+# package, see PEP 562
+if typing.TYPE_CHECKING:
+    from .clash_of_code import ClashOfCode, Player
+    from .client import Client
+    from .codingamer import CodinGamer, PartialCodinGamer
+    from .exceptions import (
+        ChallengeNotFound,
+        ClashOfCodeNotFound,
+        CodinGameAPIError,
+        CodinGamerNotFound,
+        EmailNotLinked,
+        EmailRequired,
+        IncorrectPassword,
+        LoginError,
+        LoginRequired,
+        MalformedEmail,
+        NotFound,
+        PasswordRequired,
+        PuzzleNotFound,
+        WrongCaptchaAnswer,
+    )
+    from .leaderboard import (
+        ChallengeLeaderboard,
+        ChallengeRankedCodinGamer,
+        GlobalLeaderboard,
+        GlobalRankedCodinGamer,
+        League,
+        PuzzleLeaderboard,
+        PuzzleRankedCodinGamer,
+    )
+    from .notification import (
+        AchievementUnlockedData,
+        CareerCandidateData,
+        ClashInviteData,
+        ClashOverData,
+        CommentType,
+        Contribution,
+        ContributionData,
+        ContributionModeratedActionType,
+        ContributionModeratedData,
+        ContributionType,
+        CustomData,
+        FeatureData,
+        FriendRegisteredData,
+        GenericData,
+        JobAcceptedData,
+        JobExpiredData,
+        LanguageMapping,
+        LeagueData,
+        NewBlogData,
+        NewCommentData,
+        NewHintData,
+        NewLevelData,
+        NewPuzzleData,
+        NewWorkBlogData,
+        Notification,
+        NotificationData,
+        NotificationType,
+        NotificationTypeGroup,
+        OfferApplyData,
+        PuzzleOfTheWeekData,
+        PuzzleSolution,
+        QuestCompletedData,
+        TestFinishedData,
+    )
+
+_LAZY_IMPORTS = {
+    "ClashOfCode": ".clash_of_code",
+    "Player": ".clash_of_code",
+    "Client": ".client",
+    "CodinGamer": ".codingamer",
+    "PartialCodinGamer": ".codingamer",
+    "ChallengeNotFound": ".exceptions",
+    "ClashOfCodeNotFound": ".exceptions",
+    "CodinGameAPIError": ".exceptions",
+    "CodinGamerNotFound": ".exceptions",
+    "EmailNotLinked": ".exceptions",
+    "EmailRequired": ".exceptions",
+    "IncorrectPassword": ".exceptions",
+    "LoginError": ".exceptions",
+    "LoginRequired": ".exceptions",
+    "MalformedEmail": ".exceptions",
+    "NotFound": ".exceptions",
+    "PasswordRequired": ".exceptions",
+    "PuzzleNotFound": ".exceptions",
+    "WrongCaptchaAnswer": ".exceptions",
+    "ChallengeLeaderboard": ".leaderboard",
+    "ChallengeRankedCodinGamer": ".leaderboard",
+    "GlobalLeaderboard": ".leaderboard",
+    "GlobalRankedCodinGamer": ".leaderboard",
+    "League": ".leaderboard",
+    "PuzzleLeaderboard": ".leaderboard",
+    "PuzzleRankedCodinGamer": ".leaderboard",
+    "AchievementUnlockedData": ".notification",
+    "CareerCandidateData": ".notification",
+    "ClashInviteData": ".notification",
+    "ClashOverData": ".notification",
+    "CommentType": ".notification",
+    "Contribution": ".notification",
+    "ContributionData": ".notification",
+    "ContributionModeratedActionType": ".notification",
+    "ContributionModeratedData": ".notification",
+    "ContributionType": ".notification",
+    "CustomData": ".notification",
+    "FeatureData": ".notification",
+    "FriendRegisteredData": ".notification",
+    "GenericData": ".notification",
+    "JobAcceptedData": ".notification",
+    "JobExpiredData": ".notification",
+    "LanguageMapping": ".notification",
+    "LeagueData": ".notification",
+    "NewBlogData": ".notification",
+    "NewCommentData": ".notification",
+    "NewHintData": ".notification",
+    "NewLevelData": ".notification",
+    "NewPuzzleData": ".notification",
+    "NewWorkBlogData": ".notification",
+    "Notification": ".notification",
+    "NotificationData": ".notification",
+    "NotificationType": ".notification",
+    "NotificationTypeGroup": ".notification",
+    "OfferApplyData": ".notification",
+    "PuzzleOfTheWeekData": ".notification",
+    "PuzzleSolution": ".notification",
+    "QuestCompletedData": ".notification",
+    "TestFinishedData": ".notification",
+}
 
 __all__ = (
     # Client
-    Client,
+    "Client",
     # CodinGamer
-    CodinGamer,
-    PartialCodinGamer,
+    "CodinGamer",
+    "PartialCodinGamer",
     # Clash of Code
-    ClashOfCode,
-    Player,
+    "ClashOfCode",
+    "Player",
     # Notification
-    Notification,
-    NotificationType,
-    NotificationTypeGroup,
-    ContributionType,
-    CommentType,
-    ContributionModeratedActionType,
-    LanguageMapping,
-    NotificationData,
-    AchievementUnlockedData,
-    LeagueData,
-    NewBlogData,
-    ClashInviteData,
-    ClashOverData,
-    Contribution,
-    PuzzleSolution,
-    NewCommentData,
-    ContributionData,
-    FeatureData,
-    NewHintData,
-    ContributionModeratedData,
-    NewPuzzleData,
-    PuzzleOfTheWeekData,
-    QuestCompletedData,
-    FriendRegisteredData,
-    NewLevelData,
-    GenericData,
-    CustomData,
-    CareerCandidateData,
-    TestFinishedData,
-    JobAcceptedData,
-    JobExpiredData,
-    NewWorkBlogData,
-    OfferApplyData,
+    "Notification",
+    "NotificationType",
+    "NotificationTypeGroup",
+    "ContributionType",
+    "CommentType",
+    "ContributionModeratedActionType",
+    "LanguageMapping",
+    "NotificationData",
+    "AchievementUnlockedData",
+    "LeagueData",
+    "NewBlogData",
+    "ClashInviteData",
+    "ClashOverData",
+    "Contribution",
+    "PuzzleSolution",
+    "NewCommentData",
+    "ContributionData",
+    "FeatureData",
+    "NewHintData",
+    "ContributionModeratedData",
+    "NewPuzzleData",
+    "PuzzleOfTheWeekData",
+    "QuestCompletedData",
+    "FriendRegisteredData",
+    "NewLevelData",
+    "GenericData",
+    "CustomData",
+    "CareerCandidateData",
+    "TestFinishedData",
+    "JobAcceptedData",
+    "JobExpiredData",
+    "NewWorkBlogData",
+    "OfferApplyData",
     # Leaderboard
-    GlobalLeaderboard,
-    GlobalRankedCodinGamer,
-    League,
-    ChallengeLeaderboard,
-    ChallengeRankedCodinGamer,
-    PuzzleLeaderboard,
-    PuzzleRankedCodinGamer,
+    "GlobalLeaderboard",
+    "GlobalRankedCodinGamer",
+    "League",
+    "ChallengeLeaderboard",
+    "ChallengeRankedCodinGamer",
+    "PuzzleLeaderboard",
+    "PuzzleRankedCodinGamer",
     # Exceptions
-    CodinGameAPIError,
-    LoginError,
-    EmailRequired,
-    MalformedEmail,
-    PasswordRequired,
-    EmailNotLinked,
-    IncorrectPassword,
-    WrongCaptchaAnswer,
-    LoginRequired,
-    NotFound,
-    CodinGamerNotFound,
-    ClashOfCodeNotFound,
-    ChallengeNotFound,
-    PuzzleNotFound,
+    "CodinGameAPIError",
+    "LoginError",
+    "EmailRequired",
+    "MalformedEmail",
+    "PasswordRequired",
+    "EmailNotLinked",
+    "IncorrectPassword",
+    "WrongCaptchaAnswer",
+    "LoginRequired",
+    "NotFound",
+    "CodinGamerNotFound",
+    "ClashOfCodeNotFound",
+    "ChallengeNotFound",
+    "PuzzleNotFound",
+)
+
+
+_SUBMODULES = (
+    "abc",
+    "clash_of_code",
+    "client",
+    "codingamer",
+    "exceptions",
+    "http",
+    "leaderboard",
+    "notification",
+    "state",
+    "types",
+    "utils",
 )
+
+
+def __getattr__(name: str):
+    # the submodules used to be imported with the package
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,4 @@
+from .base import raw
 from .client import Client
 
-__all__ = ("Client",)
+__all__ = ("Client", "raw")
@@ -1,4 +1,6 @@
+import asyncio
 import typing
+from collections import deque
 from datetime import datetime
 
 from ..clash_of_code import ClashOfCode
@@ -6,9 +8,15 @@ from ..codingamer import CodinGamer
 from ..exceptions import LoginError, LoginRequired, NotFound
 from ..http import HTTPError
 from ..leaderboard import (
+    STREAM_PREFIXES,
     ChallengeLeaderboard,
+    ChallengeRankedCodinGamer,
     GlobalLeaderboard,
+    GlobalRankedCodinGamer,
     PuzzleLeaderboard,
+    PuzzleRankedCodinGamer,
+    create_streamed_leaderboard,
+    feed_streamed_leaderboard,
 )
 from ..notification import Notification
 from ..utils import (
@@ -18,7 +26,7 @@ from ..utils import (
     validate_leaderboard_group,
     validate_leaderboard_type,
 )
-from .base import BaseClient
+from .base import BaseClient, raw
 
 __all__ = ("AsyncClient",)
 
@@ -26,8 +34,8 @@ __all__ = ("AsyncClient",)
 class AsyncClient(BaseClient, doc_prefix="|coro|"):
     """Asynchronous client for the CodinGame API."""
 
-    def __init__(self):
-        super().__init__(is_async=True)
+    def __init__(self, **options):
+        super().__init__(is_async=True, **options)
 
     async def close(self):
         await self._state.http.close()
@@ -44,12 +52,14 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
         if remember_me_cookie is not None:
             # see issue #5
             self._state.http.set_cookie("rememberMe", remember_me_cookie)
-            self._state.logged_in = True
 
             codingamer_id = int(remember_me_cookie[:7])
-            self._state.codingamer = await self.get_codingamer(codingamer_id)
+            # the state needs the model, even in raw mode
+            with raw(False):
+                codingamer = await self.get_codingamer(codingamer_id)
+            self._state.set_logged_in(codingamer)
 
-            return self._state.codingamer
+            return codingamer
         else:
             raise LoginError(
                 "Email/password login is unavailable, use cookie authentication"
@@ -104,7 +114,35 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
             raise NotFound.from_type(
                 "codingamer", f"No CodinGamer with handle {handle!r}"
             )
-        return CodinGamer(self._state, data["codingamer"])
+        if self._is_raw():
+            return data["codingamer"]
+        with self._state.http.measure_model(
+            "CodinGamer", "findCodingamePointsStatsByHandle"
+        ):
+            return CodinGamer(self._state, data["codingamer"])
+
+    async def get_codingamers(
+        self,
+        codingamers: typing.Iterable[typing.Union[str, int]],
+        concurrency: int = 8,
+    ) -> typing.Dict[
+        typing.Union[str, int], typing.Union[CodinGamer, Exception]
+    ]:
+        if concurrency < 1:
+            raise ValueError("concurrency argument must be at least 1.")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_codingamer(codingamer: typing.Union[str, int]):
+            async with semaphore:
+                try:
+                    return await self.get_codingamer(codingamer)
+                except Exception as error:
+                    return error
+
+        codingamers = list(dict.fromkeys(codingamers))
+        results = await asyncio.gather(*map(get_codingamer, codingamers))
+        return dict(zip(codingamers, results))
 
     # --------------------------------------------------------------------------
     # Clash of Code
@@ -124,13 +162,21 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
                     "clash_of_code", f"No Clash of Code with handle {handle!r}"
                 ) from None
             raise  # pragma: no cover
-        return ClashOfCode(self._state, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model("ClashOfCode", "findClashByHandle"):
+            return ClashOfCode(self._state, data)
 
     async def get_pending_clash_of_code(self) -> typing.Optional[ClashOfCode]:
         data: list = await self._state.http.get_pending_clash_of_code()
         if not data:
             return None  # pragma: no cover
-        return ClashOfCode(self._state, data[0])  # pragma: no cover
+        if self._is_raw():  # pragma: no cover
+            return data[0]
+        with self._state.http.measure_model(
+            "ClashOfCode", "findPendingClashes"
+        ):  # pragma: no cover
+            return ClashOfCode(self._state, data[0])
 
     # --------------------------------------------------------------------------
     # Language IDs
@@ -154,8 +200,19 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
                 raise LoginRequired() from None
             raise  # pragma: no cover
 
-        for notification in data:
-            yield Notification(self._state, notification)
+        if self._is_raw():
+            for notification in data:
+                yield notification
+            return
+
+        with self._state.http.measure_model(
+            "Notification", "findUnseenNotifications"
+        ):
+            notifications = [
+                Notification(self._state, notification) for notification in data
+            ]
+        for notification in notifications:
+            yield notification
 
     async def get_unread_notifications(self) -> typing.Iterator[Notification]:
         if not self.logged_in:
@@ -170,8 +227,19 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
                 raise LoginRequired() from None
             raise  # pragma: no cover
 
-        for notification in data:
-            yield Notification(self._state, notification)
+        if self._is_raw():
+            for notification in data:
+                yield notification
+            return
+
+        with self._state.http.measure_model(
+            "Notification", "findUnreadNotifications"
+        ):
+            notifications = [
+                Notification(self._state, notification) for notification in data
+            ]
+        for notification in notifications:
+            yield notification
 
     async def get_read_notifications(self) -> typing.Iterator[Notification]:
         if not self.logged_in:
@@ -186,8 +254,19 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
                 raise LoginRequired() from None
             raise  # pragma: no cover
 
-        for notification in data:
-            yield Notification(self._state, notification)
+        if self._is_raw():
+            for notification in data:
+                yield notification
+            return
+
+        with self._state.http.measure_model(
+            "Notification", "findLastReadNotifications"
+        ):
+            notifications = [
+                Notification(self._state, notification) for notification in data
+            ]
+        for notification in notifications:
+            yield notification
 
     async def mark_notifications_as_seen(
         self, notifications: typing.List[typing.Union["Notification", int]]
@@ -260,7 +339,105 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
             group,
             self.codingamer.public_handle if self.logged_in else "",
         )
-        return GlobalLeaderboard(self._state, type, group, page, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model(
+            "Leaderboards", "getGlobalLeaderboard"
+        ):
+            return GlobalLeaderboard(self._state, type, group, page, data)
+
+    async def iter_global_leaderboard(
+        self,
+        type: str = "GENERAL",
+        group: str = "global",
+        start_page: int = 1,
+        stop_rank: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.AsyncIterator[GlobalRankedCodinGamer]:
+        type = validate_leaderboard_type(type)
+        group = validate_leaderboard_group(group, self.logged_in)
+
+        page = start_page
+        page_size = None
+        count = 0
+        next_page: typing.Optional[asyncio.Task] = asyncio.ensure_future(
+            self.get_global_leaderboard(page, type, group)
+        )
+        try:
+            while next_page is not None:
+                users = self._get_users(await next_page)
+                next_page = None
+                if not users:
+                    return
+
+                page_size = page_size or len(users)
+                if not self._is_last_page(
+                    users, page_size, count, stop_rank, limit
+                ):
+                    page += 1
+                    next_page = asyncio.ensure_future(
+                        self.get_global_leaderboard(page, type, group)
+                    )
+
+                for user in users:
+                    if (
+                        stop_rank is not None
+                        and self._get_rank(user) > stop_rank
+                    ):
+                        return
+                    if limit is not None and count >= limit:
+                        return
+                    count += 1
+                    yield user
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def iter_global_leaderboard_pages(
+        self,
+        pages: typing.Iterable[int],
+        type: str = "GENERAL",
+        group: str = "global",
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> typing.AsyncIterator[GlobalLeaderboard]:
+        type = validate_leaderboard_type(type)
+        group = validate_leaderboard_group(group, self.logged_in)
+        if concurrency < 1:
+            raise ValueError("concurrency argument must be at least 1.")
+
+        pages = iter(pages)
+        pending: typing.Deque[asyncio.Task] = deque()
+
+        def create_next_task():
+            page = next(pages, None)
+            if page is not None:
+                pending.append(
+                    asyncio.ensure_future(
+                        self.get_global_leaderboard(page, type, group)
+                    )
+                )
+
+        for _ in range(concurrency):
+            create_next_task()
+
+        try:
+            while pending:
+                if ordered:
+                    task = pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = done.pop()
+                    pending.remove(task)
+
+                leaderboard = await task
+                create_next_task()
+                yield leaderboard
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def get_challenge_leaderboard(
         self, challenge_id: str, group: str = "global"
@@ -283,7 +460,12 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
                 ) from None
             raise  # pragma: no cover
 
-        return ChallengeLeaderboard(self._state, challenge_id, group, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model(
+            "Leaderboards", "getFilteredChallengeLeaderboard"
+        ):
+            return ChallengeLeaderboard(self._state, challenge_id, group, data)
 
     async def get_puzzle_leaderboard(
         self, puzzle_id: str, group: str = "global"
@@ -303,4 +485,88 @@ class AsyncClient(BaseClient, doc_prefix="|coro|"):
                 ) from None
             raise  # pragma: no cover
 
-        return PuzzleLeaderboard(self._state, puzzle_id, group, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model(
+            "Leaderboards", "getFilteredPuzzleLeaderboard"
+        ):
+            return PuzzleLeaderboard(self._state, puzzle_id, group, data)
+
+    async def iter_challenge_leaderboard(
+        self, challenge_id: str, group: str = "global"
+    ) -> typing.AsyncIterator[ChallengeRankedCodinGamer]:
+        group = validate_leaderboard_group(group, self.logged_in)
+        leaderboard = None
+        prefixes = ("users.item",)
+        if not self._is_raw():
+            leaderboard = create_streamed_leaderboard(
+                ChallengeLeaderboard, self._state, challenge_id, group
+            )
+            prefixes = STREAM_PREFIXES
+
+        items = self._state.http.stream_challenge_leaderboard(
+            challenge_id,
+            group,
+            prefixes,
+            self.codingamer.public_handle if self.logged_in else "",
+        )
+
+        try:
+            async for prefix, value in items:
+                if leaderboard is None:
+                    yield value
+                    continue
+
+                with self._state.http.measure_model(
+                    "Leaderboards", "getFilteredChallengeLeaderboard"
+                ):
+                    user = feed_streamed_leaderboard(leaderboard, prefix, value)
+                if user is not None:
+                    yield user
+        except HTTPError as error:
+            if (
+                error.data.get("id") == 702
+                or error.data.get("code") == "NOT_FOUND"
+            ):  # see issue #26
+                raise NotFound.from_type(
+                    "challenge", f"No Challenge named {challenge_id!r}"
+                ) from None
+            raise  # pragma: no cover
+
+    async def iter_puzzle_leaderboard(
+        self, puzzle_id: str, group: str = "global"
+    ) -> typing.AsyncIterator[PuzzleRankedCodinGamer]:
+        group = validate_leaderboard_group(group, self.logged_in)
+        leaderboard = None
+        prefixes = ("users.item",)
+        if not self._is_raw():
+            leaderboard = create_streamed_leaderboard(
+                PuzzleLeaderboard, self._state, puzzle_id, group
+            )
+            prefixes = STREAM_PREFIXES
+
+        items = self._state.http.stream_puzzle_leaderboard(
+            puzzle_id,
+            group,
+            prefixes,
+            self.codingamer.public_handle if self.logged_in else "",
+        )
+
+        try:
+            async for prefix, value in items:
+                if leaderboard is None:
+                    yield value
+                    continue
+
+                with self._state.http.measure_model(
+                    "Leaderboards", "getFilteredPuzzleLeaderboard"
+                ):
+                    user = feed_streamed_leaderboard(leaderboard, prefix, value)
+                if user is not None:
+                    yield user
+        except HTTPError as error:
+            if error.data["code"] == "INVALID_PARAMETERS":
+                raise NotFound.from_type(
+                    "puzzle", f"No Puzzle named {puzzle_id!r}"
+                ) from None
+            raise  # pragma: no cover
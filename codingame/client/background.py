@@ -0,0 +1,452 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import inspect
+import threading
+import typing
+from datetime import datetime
+
+from .async_ import AsyncClient
+from .base import BaseClient
+
+if typing.TYPE_CHECKING:
+    from ..clash_of_code import ClashOfCode
+    from ..codingamer import CodinGamer
+    from ..leaderboard import (
+        ChallengeLeaderboard,
+        ChallengeRankedCodinGamer,
+        GlobalLeaderboard,
+        GlobalRankedCodinGamer,
+        PuzzleLeaderboard,
+        PuzzleRankedCodinGamer,
+    )
+    from ..notification import Notification
+
+__all__ = ("BackgroundClient",)
+
+T = typing.TypeVar("T")
+
+
+def _copy_result(future: concurrent.futures.Future, task: asyncio.Future):
+    if task.cancelled():
+        future.cancel()
+    elif not future.set_running_or_notify_cancel():
+        return
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+class BackgroundClient(BaseClient, trace=False):
+    """Synchronous client running an
+    :class:`~codingame.client.async_.AsyncClient` in an event loop on a
+    background thread.
+
+    Its methods block like the ones of
+    :class:`~codingame.client.sync.SyncClient` and can be called from many
+    threads at the same time, the event loop sending the requests of all the
+    threads concurrently. Use :meth:`submit` and :meth:`map` to send many
+    requests at the same time from a single thread.
+
+    The models returned by the client belong to the asynchronous client, so
+    their methods are coroutines, use :meth:`run` to wait for them.
+
+    Every keyword argument is passed to the asynchronous client, see
+    :class:`~codingame.Client` for the available options.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, **options):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="codingame-event-loop", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+
+        try:
+            # the aiohttp session must be created in the event loop
+            self._client: AsyncClient = self.run(self._create_client(options))
+        except BaseException:
+            self._stop_loop()
+            raise
+        self._state = self._client._state
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    def _stop_loop(self):
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    @staticmethod
+    async def _create_client(options: dict) -> AsyncClient:
+        return AsyncClient(**options)
+
+    def close(self):
+        """Closes the client session and stops the event loop."""
+
+        if self._closed:
+            return
+        try:
+            self.run(self._client.close())
+        finally:
+            self._stop_loop()
+
+    @property
+    def is_async(self) -> bool:
+        """:class:`bool`: Whether the client is asynchronous, always
+        ``False``."""
+        return False
+
+    @property
+    def client(self) -> AsyncClient:
+        """:class:`~codingame.client.async_.AsyncClient`: The asynchronous
+        client running in the event loop."""
+        return self._client
+
+    # --------------------------------------------------------------------------
+    # Event loop
+
+    def _submit(
+        self, awaitable: typing.Awaitable[T]
+    ) -> "concurrent.futures.Future[T]":
+        if self._closed:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("The client is closed.")
+
+        future: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+
+        def create_task():
+            task = asyncio.ensure_future(awaitable)
+            task.add_done_callback(lambda task: _copy_result(future, task))
+
+            def cancel_task(future: concurrent.futures.Future):
+                if future.cancelled():
+                    self._loop.call_soon_threadsafe(task.cancel)
+
+            future.add_done_callback(cancel_task)
+
+        # the task copies the context of the caller, like its deadline
+        self._loop.call_soon_threadsafe(
+            create_task, context=contextvars.copy_context()
+        )
+        return future
+
+    def run(self, awaitable: typing.Awaitable[T]) -> T:
+        """Run an awaitable in the event loop and wait for its result.
+
+        This is useful to call the methods of the models returned by the
+        client, like ``client.run(codingamer.get_followers_ids())``.
+
+        Parameters
+        -----------
+            awaitable: Awaitable
+                The coroutine or future to run.
+
+        Raises
+        ------
+            :exc:`RuntimeError`
+                The client is closed or this is called from the event loop.
+
+        Returns
+        -------
+            Any
+                The result of the awaitable.
+        """
+
+        if threading.current_thread() is self._thread:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("Can't wait for a result in the event loop.")
+
+        future = self._submit(awaitable)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _iterate(self, iterator: typing.AsyncIterator[T]) -> typing.Iterator[T]:
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed and hasattr(iterator, "aclose"):
+                self.run(iterator.aclose())
+
+    def _get_async_function(self, function: typing.Callable) -> typing.Callable:
+        # the blocking methods of this client are replaced by the coroutines of
+        # the asynchronous client
+        if getattr(function, "__self__", None) is self:
+            return getattr(self._client, function.__name__)
+        return function
+
+    @staticmethod
+    async def _call(
+        function: typing.Callable,
+        args: tuple,
+        kwargs: dict,
+        semaphore: typing.Optional[asyncio.Semaphore] = None,
+    ):
+        if semaphore is not None:
+            async with semaphore:
+                return await BackgroundClient._call(function, args, kwargs)
+
+        result = function(*args, **kwargs)
+        if inspect.isasyncgen(result):
+            return [item async for item in result]
+        return await result
+
+    @staticmethod
+    async def _create_semaphore(value: int) -> asyncio.Semaphore:
+        return asyncio.Semaphore(value)
+
+    def submit(
+        self, function: typing.Callable, *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """Call a method of the client without waiting for the result.
+
+        Parameters
+        -----------
+            function: Callable
+                A method of this client, or any coroutine function. The
+                methods returning iterators return a :class:`list` instead.
+            *args
+                The positional arguments of the function.
+            **kwargs
+                The keyword arguments of the function.
+
+        Raises
+        ------
+            :exc:`RuntimeError`
+                The client is closed.
+
+        Returns
+        -------
+            :class:`concurrent.futures.Future`
+                The future of the result of the function.
+
+        Example
+        -------
+            .. code-block:: python3
+
+                futures = [
+                    client.submit(client.get_codingamer, handle)
+                    for handle in handles
+                ]
+                codingamers = [future.result() for future in futures]
+        """
+
+        function = self._get_async_function(function)
+        return self._submit(self._call(function, args, kwargs))
+
+    def map(
+        self,
+        function: typing.Callable,
+        *iterables: typing.Iterable,
+        concurrency: typing.Optional[int] = None,
+    ) -> typing.Iterator:
+        """Call a method of the client with the arguments of each iterable at
+        the same time, like :meth:`concurrent.futures.Executor.map`.
+
+        Every call is submitted right away, the results are yielded in order
+        and the first error is raised when its result is reached. The calls
+        that are still pending are cancelled when the iterator is closed.
+
+        Parameters
+        -----------
+            function: Callable
+                A method of this client, or any coroutine function. The
+                methods returning iterators return a :class:`list` instead.
+            *iterables: Iterable
+                The arguments of the calls.
+            concurrency: Optional[int]
+                Maximum number of calls running at the same time, ``None`` for
+                no limit. Defaults to ``None``.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                ``concurrency`` is smaller than 1.
+
+            :exc:`RuntimeError`
+                The client is closed.
+
+        Yields
+        -------
+            Any
+                The result of each call.
+
+        Example
+        -------
+            .. code-block:: python3
+
+                for codingamer in client.map(client.get_codingamer, handles):
+                    print(codingamer.pseudo)
+        """
+
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency argument must be at least 1.")
+
+        function = self._get_async_function(function)
+        semaphore = (
+            None
+            if concurrency is None
+            else self.run(self._create_semaphore(concurrency))
+        )
+        futures = [
+            self._submit(self._call(function, args, {}, semaphore))
+            for args in zip(*iterables)
+        ]
+
+        def results():
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return results()
+
+    def request(
+        self, service: str, func: str, parameters: list = []
+    ) -> typing.Any:
+        return self.run(self._client.request(service, func, parameters))
+
+    # --------------------------------------------------------------------------
+    # CodinGamer
+
+    def login(
+        self,
+        email: typing.Optional[str] = None,
+        password: typing.Optional[str] = None,
+        remember_me_cookie: typing.Optional[str] = None,
+    ) -> typing.Optional["CodinGamer"]:
+        return self.run(self._client.login(email, password, remember_me_cookie))
+
+    def get_codingamer(
+        self, codingamer: typing.Union[str, int]
+    ) -> "CodinGamer":
+        return self.run(self._client.get_codingamer(codingamer))
+
+    def get_codingamers(
+        self,
+        codingamers: typing.Iterable[typing.Union[str, int]],
+        concurrency: int = 8,
+    ) -> typing.Dict[
+        typing.Union[str, int], typing.Union["CodinGamer", Exception]
+    ]:
+        return self.run(self._client.get_codingamers(codingamers, concurrency))
+
+    # --------------------------------------------------------------------------
+    # Clash of Code
+
+    def get_clash_of_code(self, handle: str) -> "ClashOfCode":
+        return self.run(self._client.get_clash_of_code(handle))
+
+    def get_pending_clash_of_code(self) -> typing.Optional["ClashOfCode"]:
+        return self.run(self._client.get_pending_clash_of_code())
+
+    # --------------------------------------------------------------------------
+    # Language IDs
+
+    def get_language_ids(self) -> typing.List[str]:
+        return self.run(self._client.get_language_ids())
+
+    # --------------------------------------------------------------------------
+    # Notifications
+
+    def get_unseen_notifications(self) -> typing.Iterator["Notification"]:
+        return self._iterate(self._client.get_unseen_notifications())
+
+    def get_unread_notifications(self) -> typing.Iterator["Notification"]:
+        return self._iterate(self._client.get_unread_notifications())
+
+    def get_read_notifications(self) -> typing.Iterator["Notification"]:
+        return self._iterate(self._client.get_read_notifications())
+
+    def mark_notifications_as_seen(
+        self, notifications: typing.List[typing.Union["Notification", int]]
+    ) -> datetime:
+        return self.run(self._client.mark_notifications_as_seen(notifications))
+
+    def mark_notifications_as_read(
+        self, notifications: typing.List[typing.Union["Notification", int]]
+    ) -> datetime:
+        return self.run(self._client.mark_notifications_as_read(notifications))
+
+    # --------------------------------------------------------------------------
+    # Leaderboards
+
+    def get_global_leaderboard(
+        self, page: int = 1, type: str = "GENERAL", group: str = "global"
+    ) -> "GlobalLeaderboard":
+        return self.run(self._client.get_global_leaderboard(page, type, group))
+
+    def iter_global_leaderboard(
+        self,
+        type: str = "GENERAL",
+        group: str = "global",
+        start_page: int = 1,
+        stop_rank: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Iterator["GlobalRankedCodinGamer"]:
+        return self._iterate(
+            self._client.iter_global_leaderboard(
+                type, group, start_page, stop_rank, limit
+            )
+        )
+
+    def iter_global_leaderboard_pages(
+        self,
+        pages: typing.Iterable[int],
+        type: str = "GENERAL",
+        group: str = "global",
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> typing.Iterator["GlobalLeaderboard"]:
+        return self._iterate(
+            self._client.iter_global_leaderboard_pages(
+                pages, type, group, concurrency, ordered
+            )
+        )
+
+    def get_challenge_leaderboard(
+        self, challenge_id: str, group: str = "global"
+    ) -> "ChallengeLeaderboard":
+        return self.run(
+            self._client.get_challenge_leaderboard(challenge_id, group)
+        )
+
+    def get_puzzle_leaderboard(
+        self, puzzle_id: str, group: str = "global"
+    ) -> "PuzzleLeaderboard":
+        return self.run(self._client.get_puzzle_leaderboard(puzzle_id, group))
+
+    def iter_challenge_leaderboard(
+        self, challenge_id: str, group: str = "global"
+    ) -> typing.Iterator["ChallengeRankedCodinGamer"]:
+        return self._iterate(
+            self._client.iter_challenge_leaderboard(challenge_id, group)
+        )
+
+    def iter_puzzle_leaderboard(
+        self, puzzle_id: str, group: str = "global"
+    ) -> typing.Iterator["PuzzleRankedCodinGamer"]:
+        return self._iterate(
+            self._client.iter_puzzle_leaderboard(puzzle_id, group)
+        )
@@ -1,24 +1,80 @@
+import contextlib
+import contextvars
+import inspect
 import typing
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from ..http.tracing import trace_method
 from ..state import ConnectionState
 
 if typing.TYPE_CHECKING:
     from ..clash_of_code import ClashOfCode
     from ..codingamer import CodinGamer
+    from ..http.middleware import Middleware
     from ..leaderboard import (
         ChallengeLeaderboard,
+        ChallengeRankedCodinGamer,
         GlobalLeaderboard,
+        GlobalRankedCodinGamer,
         PuzzleLeaderboard,
+        PuzzleRankedCodinGamer,
     )
     from ..notification import Notification
 
-__all__ = ("BaseClient",)
+__all__ = ("BaseClient", "raw")
+
+_raw: "contextvars.ContextVar[typing.Optional[bool]]" = contextvars.ContextVar(
+    "codingame_raw", default=None
+)
+
+
+@contextlib.contextmanager
+def raw(enabled: bool = True) -> typing.Iterator[None]:
+    """Context manager making the methods of the clients called in it return
+    the data decoded from the API instead of models, overriding the ``raw``
+    option of the clients. Creating no models is faster when only a few
+    fields of the data are needed.
+
+    The CodinGamers, Clash of Codes and notifications are returned as the
+    typed dictionaries of :mod:`codingame.types`, the leaderboards and their
+    users as :class:`dict`.
+
+    The mode applies to the current thread or task and to the tasks started
+    in it. The iterators returned by the methods must be iterated in it.
+
+    .. warning::
+        With a :class:`~codingame.http.MemoryCache`, the raw data can be the
+        cached data itself, shared with the next calls. It must be treated as
+        read-only, copy it before modifying it.
+
+    Parameters
+    ----------
+        enabled : bool
+            Whether the methods return the raw data. Defaults to ``True``.
+
+    Example
+    -------
+        .. code:: python
+
+            with codingame.client.raw():
+                for user in client.iter_global_leaderboard(limit=1000):
+                    print(user["codingamer"]["publicHandle"], user["score"])
+
+    .. versionadded:: 1.5
+    """
+
+    token = _raw.set(enabled)
+    try:
+        yield
+    finally:
+        _raw.reset(token)
 
 
 class BaseClient(ABC):
-    def __init_subclass__(cls, doc_prefix: str = "", **kwargs):
+    def __init_subclass__(
+        cls, doc_prefix: str = "", trace: bool = True, **kwargs
+    ):
         super().__init_subclass__(**kwargs)
 
         # Replaces the |maybe_coro| with a new prefix at the start of docstrings
@@ -26,10 +82,10 @@ class BaseClient(ABC):
         doc_prefix = doc_prefix.strip() + "\n\n" * (len(doc_prefix) > 0)
         prefix = "|maybe_coro|\n\n"
 
-        for name, method in cls.__dict__.items():
+        for name, method in list(cls.__dict__.items()):
             if not callable(method):
                 continue
-            if name.startswith("__"):
+            if name.startswith("_"):
                 continue
             if method.__doc__ is None:  # pragma: no cover
                 method.__doc__ = getattr(cls.__base__, name).__doc__
@@ -40,8 +96,13 @@ class BaseClient(ABC):
                 else method.__doc__
             )
 
-    def __init__(self, is_async: bool = False):
-        self._state = ConnectionState(is_async)
+            # a parent span for the requests sent by the public methods
+            if trace and name != "close" and inspect.isfunction(method):
+                setattr(cls, name, trace_method(method, name))
+
+    def __init__(self, is_async: bool = False, raw: bool = False, **options):
+        self._state = ConnectionState(is_async, **options)
+        self._raw = raw
 
     def __enter__(self):
         if self.is_async:
@@ -78,6 +139,12 @@ class BaseClient(ABC):
         """:class:`bool`: Whether the client is asynchronous."""
         return self._state.is_async
 
+    def _is_raw(self) -> bool:
+        """Whether the methods return the raw data, see :func:`raw`."""
+
+        enabled = _raw.get()
+        return self._raw if enabled is None else enabled
+
     @property
     def logged_in(self) -> bool:
         """:class:`bool`: Whether the client is logged in."""
@@ -140,6 +207,53 @@ class BaseClient(ABC):
 
         return self._state.http.request(service, func, parameters)
 
+    def add_middleware(self, middleware: "Middleware") -> "Middleware":
+        """Add a middleware at the end of the chain of middlewares, so it's
+        called after the middlewares already added, see the ``middlewares``
+        option of :class:`~codingame.Client`. It can be used as a decorator.
+
+        Parameters
+        ----------
+            middleware : Callable[[Request, Callable[[Request], Any]], Any]
+                The middleware, called with the
+                :class:`~codingame.http.Request` and the function calling the
+                next middleware, and returning the response. It's a coroutine
+                function for the asynchronous and background clients.
+
+        Raises
+        ------
+            :exc:`TypeError`
+                The middleware is a coroutine function for a synchronous client
+                or a function for an asynchronous client.
+
+        Returns
+        -------
+            Callable[[Request, Callable[[Request], Any]], Any]
+                The middleware.
+
+        .. versionadded:: 1.5
+        """
+
+        return self._state.http.add_middleware(middleware)
+
+    def remove_middleware(self, middleware: "Middleware"):
+        """Remove a middleware from the chain of middlewares.
+
+        Parameters
+        ----------
+            middleware : Callable[[Request, Callable[[Request], Any]], Any]
+                The middleware to remove.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                The middleware isn't in the chain of middlewares.
+
+        .. versionadded:: 1.5
+        """
+
+        self._state.http.remove_middleware(middleware)
+
     # --------------------------------------------------------------------------
     # CodinGamer
 
@@ -237,6 +351,49 @@ class BaseClient(ABC):
             Add searching with CodinGamer ID.
         """
 
+    @abstractmethod
+    def get_codingamers(
+        self,
+        codingamers: typing.Iterable[typing.Union[str, int]],
+        concurrency: int = 8,
+    ) -> typing.Dict[
+        typing.Union[str, int], typing.Union["CodinGamer", Exception]
+    ]:
+        """|maybe_coro|
+
+        Get many :class:`CodinGamers <codingame.CodinGamer>` from their public
+        handle, their ID or their pseudo, up to ``concurrency`` at the same
+        time.
+
+        Each CodinGamer is fetched like with :meth:`get_codingamer`, the
+        requests of a CodinGamer being sent as soon as the previous one is
+        done. Duplicates in ``codingamers`` are fetched only once.
+
+        Parameters
+        -----------
+            codingamers: Iterable of :class:`str` or :class:`int`
+                The CodinGamers' public handles, IDs or pseudos.
+
+            concurrency: Optional :class:`int`
+                The maximum number of CodinGamers fetched at the same time.
+                Default: ``8``.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                ``concurrency`` is less than ``1``.
+
+        Returns
+        --------
+            :class:`dict` of :class:`str` or :class:`int` to \
+            :class:`~codingame.CodinGamer` or :exc:`Exception`
+                The requested CodinGamers, in the order of ``codingamers``.
+                If a CodinGamer couldn't be fetched, the error is given instead,
+                like a :exc:`~codingame.CodinGamerNotFound`.
+
+        .. versionadded:: 1.5
+        """
+
     # --------------------------------------------------------------------------
     # Clash of Code
 
@@ -516,6 +673,173 @@ class BaseClient(ABC):
         .. versionadded:: 0.4
         """
 
+    @abstractmethod
+    def iter_global_leaderboard(
+        self,
+        type: str = "GENERAL",
+        group: str = "global",
+        start_page: int = 1,
+        stop_rank: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Iterator["GlobalRankedCodinGamer"]:
+        """|maybe_coro|
+
+        Iterate over the
+        :class:`ranked CodinGamers <codingame.GlobalRankedCodinGamer>` of the
+        :class:`global leaderboard <codingame.GlobalLeaderboard>` of CodinGame,
+        across pages.
+
+        The pages are fetched lazily, the next page being fetched in the
+        background while the users of the current page are consumed.
+
+        .. note::
+            This method is a generator.
+
+        Parameters
+        -----------
+            type: Optional :class:`str`
+                The type of global leaderboard to show.
+                One of ``"GENERAL"``, ``"CONTESTS"``, ``"BOT_PROGRAMMING"``,
+                ``"OPTIM"`` or ``"CODEGOLF"``.
+                Default: ``"GENERAL"``.
+
+            group: Optional :class:`str`
+                The group of users to rank. For every group except ``"global"``,
+                you need to be logged in.
+                One of ``"global"``, ``"country"``, ``"company"``, ``"school"``
+                or ``"following"``.
+                Default: ``"global"``.
+
+            start_page: Optional :class:`int`
+                The page of the leaderboard to start from.
+                Default: ``1``.
+
+            stop_rank: Optional :class:`int`
+                The last rank to yield, ``None`` to go to the end of the
+                leaderboard.
+                Default: ``None``.
+
+            limit: Optional :class:`int`
+                The maximum number of users to yield, ``None`` for no limit.
+                Default: ``None``.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                One of the arguments isn't one of the accepted arguments.
+
+            :exc:`~codingame.LoginRequired`
+                The client isn't logged in and the group is one of
+                ``"country"``, ``"company"``, ``"school"`` or ``"following"``.
+
+        Yields
+        -------
+            :class:`~codingame.GlobalRankedCodinGamer`
+                A ranked CodinGamer of the global leaderboard.
+
+        .. versionadded:: 1.5
+        """
+
+    @abstractmethod
+    def iter_global_leaderboard_pages(
+        self,
+        pages: typing.Iterable[int],
+        type: str = "GENERAL",
+        group: str = "global",
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> typing.Iterator["GlobalLeaderboard"]:
+        """|maybe_coro|
+
+        Get many pages of the
+        :class:`global leaderboard <codingame.GlobalLeaderboard>` of CodinGame,
+        fetching up to ``concurrency`` pages at the same time.
+
+        .. note::
+            This method is a generator.
+
+        Parameters
+        -----------
+            pages: Iterable of :class:`int`
+                The pages of the leaderboard to get, like ``range(1, 101)``.
+
+            type: Optional :class:`str`
+                The type of global leaderboard to show.
+                One of ``"GENERAL"``, ``"CONTESTS"``, ``"BOT_PROGRAMMING"``,
+                ``"OPTIM"`` or ``"CODEGOLF"``.
+                Default: ``"GENERAL"``.
+
+            group: Optional :class:`str`
+                The group of users to rank. For every group except ``"global"``,
+                you need to be logged in.
+                One of ``"global"``, ``"country"``, ``"company"``, ``"school"``
+                or ``"following"``.
+                Default: ``"global"``.
+
+            concurrency: Optional :class:`int`
+                The maximum number of pages fetched at the same time.
+                Default: ``8``.
+
+            ordered: Optional :class:`bool`
+                Whether to yield the pages in the order of ``pages``, or as
+                soon as they are fetched.
+                Default: ``True``.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                One of the arguments isn't one of the accepted arguments.
+
+            :exc:`~codingame.LoginRequired`
+                The client isn't logged in and the group is one of
+                ``"country"``, ``"company"``, ``"school"`` or ``"following"``.
+
+        Yields
+        -------
+            :class:`~codingame.GlobalLeaderboard`
+                A page of the global leaderboard.
+
+        .. versionadded:: 1.5
+        """
+
+    @staticmethod
+    def _get_users(
+        leaderboard: typing.Union["GlobalLeaderboard", dict]
+    ) -> typing.List[typing.Union["GlobalRankedCodinGamer", dict]]:
+        """Get the users of a page of the global leaderboard, raw or not."""
+
+        if isinstance(leaderboard, dict):
+            return leaderboard["users"]
+        return leaderboard.users
+
+    @staticmethod
+    def _get_rank(user: typing.Union["GlobalRankedCodinGamer", dict]) -> int:
+        """Get the rank of a user of the global leaderboard, raw or not."""
+
+        if isinstance(user, dict):
+            return user["rank"]
+        return user.rank
+
+    @staticmethod
+    def _is_last_page(
+        users: typing.List[typing.Union["GlobalRankedCodinGamer", dict]],
+        page_size: int,
+        count: int,
+        stop_rank: typing.Optional[int],
+        limit: typing.Optional[int],
+    ) -> bool:
+        """Whether there's no need to fetch the page after ``users``, ``count``
+        being the number of users yielded before this page."""
+
+        return (
+            len(users) < page_size
+            or (
+                stop_rank is not None
+                and BaseClient._get_rank(users[-1]) >= stop_rank
+            )
+            or (limit is not None and count + len(users) >= limit)
+        )
+
     @abstractmethod
     def get_challenge_leaderboard(
         self, challenge_id: str, group: str = "global"
@@ -600,3 +924,115 @@ class BaseClient(ABC):
 
         .. versionadded:: 0.4
         """
+
+    @abstractmethod
+    def iter_challenge_leaderboard(
+        self, challenge_id: str, group: str = "global"
+    ) -> typing.Iterator["ChallengeRankedCodinGamer"]:
+        """|maybe_coro|
+
+        Iterate over the
+        :class:`ranked CodinGamers <codingame.ChallengeRankedCodinGamer>` of
+        the :class:`leaderboard of a challenge <codingame.ChallengeLeaderboard>`
+        while the response is received, instead of waiting for the whole
+        leaderboard like :meth:`get_challenge_leaderboard`.
+
+        The response is parsed incrementally with ``ijson``, see
+        :ref:`installing_streaming`. The users aren't kept in
+        :attr:`~codingame.ChallengeLeaderboard.users` nor in
+        :attr:`~codingame.League.users`, and the other attributes of their
+        leaderboard are set when they are received.
+
+        .. note::
+            This method is a generator.
+
+        Parameters
+        -----------
+            challenge_id: :class:`str`
+                The string that identifies the challenge.
+
+            group: Optional :class:`str`
+                The group of users to rank. For every group except ``"global"``,
+                you need to be logged in.
+                One of ``"global"``, ``"country"``, ``"company"``, ``"school"``
+                or ``"following"``.
+                Default: ``"global"``.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                One of the arguments isn't one of the accepted arguments.
+
+            :exc:`~codingame.LoginRequired`
+                The client isn't logged in and the group is one of
+                ``"country"``, ``"company"``, ``"school"`` or ``"following"``.
+
+            :exc:`~codingame.ChallengeNotFound`
+                There is no challenge with the given ``challenge_id``.
+
+            :exc:`ImportError`
+                ``ijson`` isn't installed.
+
+        Yields
+        -------
+            :class:`~codingame.ChallengeRankedCodinGamer`
+                A ranked CodinGamer of the challenge leaderboard.
+
+        .. versionadded:: 1.5
+        """
+
+    @abstractmethod
+    def iter_puzzle_leaderboard(
+        self, puzzle_id: str, group: str = "global"
+    ) -> typing.Iterator["PuzzleRankedCodinGamer"]:
+        """|maybe_coro|
+
+        Iterate over the
+        :class:`ranked CodinGamers <codingame.PuzzleRankedCodinGamer>` of the
+        :class:`leaderboard of a puzzle <codingame.PuzzleLeaderboard>` while
+        the response is received, instead of waiting for the whole leaderboard
+        like :meth:`get_puzzle_leaderboard`.
+
+        The response is parsed incrementally with ``ijson``, see
+        :ref:`installing_streaming`. The users aren't kept in
+        :attr:`~codingame.PuzzleLeaderboard.users` nor in
+        :attr:`~codingame.League.users`, and the other attributes of their
+        leaderboard are set when they are received.
+
+        .. note::
+            This method is a generator.
+
+        Parameters
+        -----------
+            puzzle_id: :class:`str`
+                The string that identifies the puzzle.
+
+            group: Optional :class:`str`
+                The group of users to rank. For every group except ``"global"``,
+                you need to be logged in.
+                One of ``"global"``, ``"country"``, ``"company"``, ``"school"``
+                or ``"following"``.
+                Default: ``"global"``.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                One of the arguments isn't one of the accepted arguments.
+
+            :exc:`~codingame.LoginRequired`
+                The client isn't logged in and the group is one of
+                ``"country"``, ``"company"``, ``"school"`` or ``"following"``.
+
+            :exc:`~codingame.PuzzleNotFound`
+                There is no puzzle with the given ``puzzle_id``.
+
+            :exc:`ImportError`
+                ``ijson`` isn't installed.
+
+        Yields
+        -------
+            :class:`~codingame.PuzzleRankedCodinGamer`
+                A ranked CodinGamer of the puzzle leaderboard.
+
+        .. versionadded:: 1.5
+        """
@@ -10,6 +10,8 @@ class Client(BaseClient):
     ``False`` or not given.
     Instanciates a :class:`~codingame.client.async_.AsyncClient` if ``is_async``
     is ``True``.
+    Instanciates a :class:`~codingame.client.background.BackgroundClient` if
+    ``background`` is ``True``.
 
     .. note::
         There are docs for both :class:`~codingame.client.sync.SyncClient` and
@@ -19,14 +21,233 @@ class Client(BaseClient):
     ----------
         is_async : bool
             Whether the client is asynchronous. Defaults to ``False``.
+        background : bool
+            Whether the client is synchronous and runs an asynchronous client
+            in an event loop on a background thread, to send requests
+            concurrently. Defaults to ``False``.
+
+            .. versionadded:: 1.5
+
+    Other Parameters
+    ----------------
+        http2 : bool
+            Whether to send the requests with ``httpx`` over HTTP/2
+            connections, many requests sharing the same connection. Needs
+            ``httpx``, see :ref:`installing_http2`. Defaults to ``False``.
+
+            .. versionadded:: 1.5
+
+        max_connections : Optional[int]
+            HTTP/2 only. Maximum number of connections, ``None`` for no limit.
+            Defaults to ``10``.
+
+            .. versionadded:: 1.5
+
+        max_keepalive_connections : Optional[int]
+            HTTP/2 only. Maximum number of idle connections kept open,
+            ``None`` for no limit. Defaults to ``10``.
+
+            .. versionadded:: 1.5
+
+        keepalive_expiry : Optional[float]
+            HTTP/2 only. Number of seconds an idle connection is kept open.
+            Defaults to ``15``.
+
+            .. versionadded:: 1.5
+
+        timeout : Union[:class:`~codingame.http.Timeout`, float, None]
+            Timeout of the requests, either a :class:`~codingame.http.Timeout`,
+            a total number of seconds or ``None`` for no limit. Use
+            :func:`~codingame.http.deadline` to limit the duration of several
+            requests. Defaults to 30 seconds, with 10 seconds to connect.
+
+            .. versionadded:: 1.5
+
+        timeouts : Optional[Mapping[str, Union[Timeout, float, None]]]
+            Timeout of the requests by endpoint (``"Service/func"``) or by
+            service (``"Service"``), overriding ``timeout``.
+
+            .. versionadded:: 1.5
+
+        retry : Optional[:class:`~codingame.http.RetryPolicy`]
+            Policy used to retry the requests that failed because of a
+            connection error or an HTTP error like ``429 Too Many Requests`` or
+            ``503 Service Unavailable``. Defaults to no retries.
+
+            .. versionadded:: 1.5
+
+        rate_limiter : Optional[:class:`~codingame.http.RateLimiter`]
+            Rate limiter that every request waits for before being sent, it
+            can be shared between clients. Defaults to no rate limit.
+
+            .. versionadded:: 1.5
+
+        cache : Optional[:class:`~codingame.http.BaseCache`]
+            Cache of the responses of the read-only endpoints, like
+            :class:`~codingame.http.MemoryCache` or
+            :class:`~codingame.http.SQLiteCache`, it can be shared between
+            clients and isn't closed with the client. Defaults to no cache.
+
+            .. versionadded:: 1.5
+
+        coalesce : bool
+            Whether identical requests to the read-only endpoints that are sent
+            at the same time share a single HTTP request and its response.
+            Only the requests under the same :func:`~codingame.http.deadline`
+            are shared. Defaults to ``False``.
+
+            .. versionadded:: 1.5
+
+        circuit_breaker : Optional[:class:`~codingame.http.CircuitBreaker`]
+            Circuit breaker making the requests to a failing service raise
+            :exc:`~codingame.http.CircuitOpen` right away instead of waiting for
+            the service, it can be shared between clients. Defaults to no
+            circuit breaker.
+
+            .. versionadded:: 1.5
+
+        hedge : Optional[:class:`~codingame.http.HedgePolicy`]
+            Asynchronous client only. Policy sending the requests to the
+            read-only endpoints again when their response is slow, and using
+            the first response. Defaults to no hedged requests.
+
+            .. versionadded:: 1.5
+
+        metrics : Optional[:class:`~codingame.http.Metrics`]
+            Metrics of the requests to each endpoint: number of requests,
+            errors, bytes received and durations of the requests, of the
+            decoding and of the creation of the models. The creation of the
+            models is measured once per response, except for
+            :meth:`Client.iter_challenge_leaderboard` and
+            :meth:`Client.iter_puzzle_leaderboard` that measure it for each
+            value parsed from the response, and it isn't measured in raw
+            mode. They can be exported in the Prometheus or OpenMetrics text
+            format and shared between clients. Defaults to no metrics.
+
+            .. versionadded:: 1.5
+
+        raw : bool
+            Whether the methods return the data decoded from the API instead
+            of models, see :func:`~codingame.client.raw` to choose it for some
+            calls. :meth:`login` still returns a :class:`~codingame.CodinGamer`.
+            The raw data can be shared with the ``cache``, so it must be treated
+            as read-only. Defaults to ``False``.
+
+            .. versionadded:: 1.5
+
+        tracing : bool
+            Whether to trace the public methods of the client and the requests
+            they send in OpenTelemetry spans, if ``opentelemetry-api`` is
+            installed, see :ref:`installing_tracing`. Defaults to ``True``.
+
+            .. versionadded:: 1.5
+
+        tracer_provider : Optional[opentelemetry.trace.TracerProvider]
+            Tracer provider used instead of the global one.
+
+            .. versionadded:: 1.5
+
+        middlewares : Iterable[Callable[[Request, Callable], Any]]
+            Middlewares called with every :class:`~codingame.http.Request`
+            and the function calling the next middleware, returning the
+            response, before the cache and the network. They are coroutine
+            functions for the asynchronous client. More middlewares can be
+            added with :meth:`Client.add_middleware`.
+
+            .. versionadded:: 1.5
+
+        transport : Optional[:class:`~codingame.http.BaseTransport`]
+            Transport sending the requests instead of the connection of the
+            client, like a :class:`~codingame.http.RecordReplayTransport` to
+            record the responses of the API and replay them without network
+            access.
+
+            .. versionadded:: 1.5
+
+        pool_connections : int
+            Synchronous HTTP/1.1 client only. Number of connection pools to
+            cache. Defaults to ``10``.
+
+            .. versionadded:: 1.5
+
+        pool_maxsize : int
+            Synchronous HTTP/1.1 client only. Maximum number of connections kept
+            open in the pool, raise it to at least the number of threads using
+            the client. Defaults to ``10``.
+
+            .. versionadded:: 1.5
+
+        pool_block : bool
+            Synchronous HTTP/1.1 client only. Whether to wait for a free
+            connection when the pool is full instead of opening a connection
+            that won't be reused. Defaults to ``False``.
+
+            .. versionadded:: 1.5
+
+        keep_alive : bool
+            Synchronous HTTP/1.1 client only. Whether to keep the connections
+            open between requests. Defaults to ``True``.
+
+            .. versionadded:: 1.5
+
+        limit : int
+            Asynchronous HTTP/1.1 client only. Maximum number of simultaneous
+            connections, ``0`` for no limit. Defaults to ``100``.
+
+            .. versionadded:: 1.5
+
+        limit_per_host : int
+            Asynchronous HTTP/1.1 client only. Maximum number of simultaneous
+            connections to the same host, ``0`` for no limit. Defaults to ``0``.
+
+            .. versionadded:: 1.5
+
+        ttl_dns_cache : Optional[int]
+            Asynchronous HTTP/1.1 client only. Number of seconds the DNS
+            resolutions are cached, ``None`` to cache them forever. Defaults to
+            ``10``.
+
+            .. versionadded:: 1.5
+
+        keepalive_timeout : float
+            Asynchronous HTTP/1.1 client only. Number of seconds an idle
+            connection is kept open. Defaults to ``15``.
+
+            .. versionadded:: 1.5
+
+        connector : Optional[aiohttp.BaseConnector]
+            Asynchronous HTTP/1.1 client only. Connector to use instead of
+            creating one, the ``limit``, ``limit_per_host``, ``ttl_dns_cache``
+            and ``keepalive_timeout`` options are then ignored. It isn't closed
+            with the client.
+
+            .. versionadded:: 1.5
+
+        session : Optional[aiohttp.ClientSession]
+            Asynchronous HTTP/1.1 client only. Session to use instead of
+            creating one, every other connection option is then ignored. It
+            isn't closed with the client.
+
+            .. versionadded:: 1.5
     """
 
-    def __new__(cls, is_async: bool = False):
-        if is_async:
+    def __new__(
+        cls, is_async: bool = False, background: bool = False, **options
+    ):
+        if is_async and background:
+            raise ValueError(
+                "is_async and background arguments can't both be True."
+            )
+
+        if background:
+            from .background import BackgroundClient
+
+            return BackgroundClient(**options)
+        elif is_async:
             from .async_ import AsyncClient
 
-            return AsyncClient()
+            return AsyncClient(**options)
         else:
             from .sync import SyncClient
 
-            return SyncClient()
+            return SyncClient(**options)
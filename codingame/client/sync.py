@@ -1,4 +1,7 @@
+import contextvars
 import typing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 
 from ..clash_of_code import ClashOfCode
@@ -6,9 +9,15 @@ from ..codingamer import CodinGamer
 from ..exceptions import LoginError, LoginRequired, NotFound
 from ..http import HTTPError
 from ..leaderboard import (
+    STREAM_PREFIXES,
     ChallengeLeaderboard,
+    ChallengeRankedCodinGamer,
     GlobalLeaderboard,
+    GlobalRankedCodinGamer,
     PuzzleLeaderboard,
+    PuzzleRankedCodinGamer,
+    create_streamed_leaderboard,
+    feed_streamed_leaderboard,
 )
 from ..notification import Notification
 from ..utils import (
@@ -18,16 +27,31 @@ from ..utils import (
     validate_leaderboard_group,
     validate_leaderboard_type,
 )
-from .base import BaseClient
+from .base import BaseClient, raw
 
 __all__ = ("SyncClient",)
 
 
+def submit(executor: ThreadPoolExecutor, fn, *args) -> Future:
+    """Submit ``fn(*args)`` to the executor in a copy of the current context,
+    so that the current deadline also applies in the worker threads."""
+
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
 class SyncClient(BaseClient):
-    """Synchronous client for the CodinGame client."""
+    """Synchronous client for the CodinGame client.
+
+    The client can be shared between threads: each thread sends its requests
+    with its own session and all the sessions share the same connection pool,
+    so raise the ``pool_maxsize`` option to the number of threads.
 
-    def __init__(self):
-        super().__init__(is_async=False)
+    .. versionchanged:: 1.5
+        The client is thread-safe.
+    """
+
+    def __init__(self, **options):
+        super().__init__(is_async=False, **options)
 
     # --------------------------------------------------------------------------
     # CodinGamer
@@ -39,14 +63,19 @@ class SyncClient(BaseClient):
         remember_me_cookie: typing.Optional[str] = None,
     ) -> typing.Optional[CodinGamer]:
         if remember_me_cookie is not None:
-            # see issue #5
-            self._state.http.set_cookie("rememberMe", remember_me_cookie)
-            self._state.logged_in = True
-
-            codingamer_id = int(remember_me_cookie[:7])
-            self._state.codingamer = self.get_codingamer(codingamer_id)
-
-            return self._state.codingamer
+            # the lock prevents concurrent logins from mixing their cookie
+            # and their CodinGamer
+            with self._state.lock:
+                # see issue #5
+                self._state.http.set_cookie("rememberMe", remember_me_cookie)
+
+                codingamer_id = int(remember_me_cookie[:7])
+                # the state needs the model, even in raw mode
+                with raw(False):
+                    codingamer = self.get_codingamer(codingamer_id)
+                self._state.set_logged_in(codingamer)
+
+            return codingamer
         else:
             raise LoginError(
                 "Email/password login is unavailable, use cookie authentication"
@@ -99,7 +128,39 @@ class SyncClient(BaseClient):
             raise NotFound.from_type(
                 "codingamer", f"No CodinGamer with handle {handle!r}"
             )
-        return CodinGamer(self._state, data["codingamer"])
+        if self._is_raw():
+            return data["codingamer"]
+        with self._state.http.measure_model(
+            "CodinGamer", "findCodingamePointsStatsByHandle"
+        ):
+            return CodinGamer(self._state, data["codingamer"])
+
+    def get_codingamers(
+        self,
+        codingamers: typing.Iterable[typing.Union[str, int]],
+        concurrency: int = 8,
+    ) -> typing.Dict[
+        typing.Union[str, int], typing.Union[CodinGamer, Exception]
+    ]:
+        if concurrency < 1:
+            raise ValueError("concurrency argument must be at least 1.")
+
+        def get_codingamer(codingamer: typing.Union[str, int]):
+            try:
+                return self.get_codingamer(codingamer)
+            except Exception as error:
+                return error
+
+        codingamers = list(dict.fromkeys(codingamers))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                submit(executor, get_codingamer, codingamer)
+                for codingamer in codingamers
+            ]
+            return {
+                codingamer: future.result()
+                for codingamer, future in zip(codingamers, futures)
+            }
 
     # --------------------------------------------------------------------------
     # Clash of Code
@@ -119,13 +180,21 @@ class SyncClient(BaseClient):
                     "clash_of_code", f"No Clash of Code with handle {handle!r}"
                 ) from None
             raise  # pragma: no cover
-        return ClashOfCode(self._state, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model("ClashOfCode", "findClashByHandle"):
+            return ClashOfCode(self._state, data)
 
     def get_pending_clash_of_code(self) -> typing.Optional[ClashOfCode]:
         data: list = self._state.http.get_pending_clash_of_code()
         if not data:
             return None  # pragma: no cover
-        return ClashOfCode(self._state, data[0])  # pragma: no cover
+        if self._is_raw():  # pragma: no cover
+            return data[0]
+        with self._state.http.measure_model(
+            "ClashOfCode", "findPendingClashes"
+        ):  # pragma: no cover
+            return ClashOfCode(self._state, data[0])
 
     # --------------------------------------------------------------------------
     # Language IDs
@@ -147,8 +216,17 @@ class SyncClient(BaseClient):
                 raise LoginRequired() from None
             raise  # pragma: no cover
 
-        for notification in data:
-            yield Notification(self._state, notification)
+        if self._is_raw():
+            yield from data
+            return
+
+        with self._state.http.measure_model(
+            "Notification", "findUnseenNotifications"
+        ):
+            notifications = [
+                Notification(self._state, notification) for notification in data
+            ]
+        yield from notifications
 
     def get_unread_notifications(self) -> typing.Iterator[Notification]:
         if not self.logged_in:
@@ -161,8 +239,17 @@ class SyncClient(BaseClient):
                 raise LoginRequired() from None
             raise  # pragma: no cover
 
-        for notification in data:
-            yield Notification(self._state, notification)
+        if self._is_raw():
+            yield from data
+            return
+
+        with self._state.http.measure_model(
+            "Notification", "findUnreadNotifications"
+        ):
+            notifications = [
+                Notification(self._state, notification) for notification in data
+            ]
+        yield from notifications
 
     def get_read_notifications(self) -> typing.Iterator[Notification]:
         if not self.logged_in:
@@ -177,8 +264,17 @@ class SyncClient(BaseClient):
                 raise LoginRequired() from None
             raise  # pragma: no cover
 
-        for notification in data:
-            yield Notification(self._state, notification)
+        if self._is_raw():
+            yield from data
+            return
+
+        with self._state.http.measure_model(
+            "Notification", "findLastReadNotifications"
+        ):
+            notifications = [
+                Notification(self._state, notification) for notification in data
+            ]
+        yield from notifications
 
     def mark_notifications_as_seen(
         self, notifications: typing.List[typing.Union["Notification", int]]
@@ -251,7 +347,113 @@ class SyncClient(BaseClient):
             group,
             self.codingamer.public_handle if self.logged_in else "",
         )
-        return GlobalLeaderboard(self._state, type, group, page, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model(
+            "Leaderboards", "getGlobalLeaderboard"
+        ):
+            return GlobalLeaderboard(self._state, type, group, page, data)
+
+    def iter_global_leaderboard(
+        self,
+        type: str = "GENERAL",
+        group: str = "global",
+        start_page: int = 1,
+        stop_rank: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Iterator[GlobalRankedCodinGamer]:
+        type = validate_leaderboard_type(type)
+        group = validate_leaderboard_group(group, self.logged_in)
+
+        page = start_page
+        page_size = None
+        count = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page: typing.Optional[Future] = submit(
+                executor, self.get_global_leaderboard, page, type, group
+            )
+            try:
+                while next_page is not None:
+                    users = self._get_users(next_page.result())
+                    next_page = None
+                    if not users:
+                        return
+
+                    page_size = page_size or len(users)
+                    if not self._is_last_page(
+                        users, page_size, count, stop_rank, limit
+                    ):
+                        page += 1
+                        next_page = submit(
+                            executor,
+                            self.get_global_leaderboard,
+                            page,
+                            type,
+                            group,
+                        )
+
+                    for user in users:
+                        if (
+                            stop_rank is not None
+                            and self._get_rank(user) > stop_rank
+                        ):
+                            return
+                        if limit is not None and count >= limit:
+                            return
+                        count += 1
+                        yield user
+            finally:
+                if next_page is not None:
+                    next_page.cancel()
+
+    def iter_global_leaderboard_pages(
+        self,
+        pages: typing.Iterable[int],
+        type: str = "GENERAL",
+        group: str = "global",
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> typing.Iterator[GlobalLeaderboard]:
+        type = validate_leaderboard_type(type)
+        group = validate_leaderboard_group(group, self.logged_in)
+        if concurrency < 1:
+            raise ValueError("concurrency argument must be at least 1.")
+
+        pages = iter(pages)
+        pending: typing.Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+            def submit_next_page():
+                page = next(pages, None)
+                if page is not None:
+                    pending.append(
+                        submit(
+                            executor,
+                            self.get_global_leaderboard,
+                            page,
+                            type,
+                            group,
+                        )
+                    )
+
+            for _ in range(concurrency):
+                submit_next_page()
+
+            try:
+                while pending:
+                    if ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        future = done.pop()
+                        pending.remove(future)
+
+                    leaderboard = future.result()
+                    submit_next_page()
+                    yield leaderboard
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def get_challenge_leaderboard(
         self, challenge_id: str, group: str = "global"
@@ -274,7 +476,12 @@ class SyncClient(BaseClient):
                 ) from None
             raise  # pragma: no cover
 
-        return ChallengeLeaderboard(self._state, challenge_id, group, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model(
+            "Leaderboards", "getFilteredChallengeLeaderboard"
+        ):
+            return ChallengeLeaderboard(self._state, challenge_id, group, data)
 
     def get_puzzle_leaderboard(
         self, puzzle_id: str, group: str = "global"
@@ -294,4 +501,88 @@ class SyncClient(BaseClient):
                 ) from None
             raise  # pragma: no cover
 
-        return PuzzleLeaderboard(self._state, puzzle_id, group, data)
+        if self._is_raw():
+            return data
+        with self._state.http.measure_model(
+            "Leaderboards", "getFilteredPuzzleLeaderboard"
+        ):
+            return PuzzleLeaderboard(self._state, puzzle_id, group, data)
+
+    def iter_challenge_leaderboard(
+        self, challenge_id: str, group: str = "global"
+    ) -> typing.Iterator[ChallengeRankedCodinGamer]:
+        group = validate_leaderboard_group(group, self.logged_in)
+        leaderboard = None
+        prefixes = ("users.item",)
+        if not self._is_raw():
+            leaderboard = create_streamed_leaderboard(
+                ChallengeLeaderboard, self._state, challenge_id, group
+            )
+            prefixes = STREAM_PREFIXES
+
+        items = self._state.http.stream_challenge_leaderboard(
+            challenge_id,
+            group,
+            prefixes,
+            self.codingamer.public_handle if self.logged_in else "",
+        )
+
+        try:
+            for prefix, value in items:
+                if leaderboard is None:
+                    yield value
+                    continue
+
+                with self._state.http.measure_model(
+                    "Leaderboards", "getFilteredChallengeLeaderboard"
+                ):
+                    user = feed_streamed_leaderboard(leaderboard, prefix, value)
+                if user is not None:
+                    yield user
+        except HTTPError as error:
+            if (
+                error.data.get("id") == 702
+                or error.data.get("code") == "NOT_FOUND"
+            ):  # see issue #26
+                raise NotFound.from_type(
+                    "challenge", f"No Challenge named {challenge_id!r}"
+                ) from None
+            raise  # pragma: no cover
+
+    def iter_puzzle_leaderboard(
+        self, puzzle_id: str, group: str = "global"
+    ) -> typing.Iterator[PuzzleRankedCodinGamer]:
+        group = validate_leaderboard_group(group, self.logged_in)
+        leaderboard = None
+        prefixes = ("users.item",)
+        if not self._is_raw():
+            leaderboard = create_streamed_leaderboard(
+                PuzzleLeaderboard, self._state, puzzle_id, group
+            )
+            prefixes = STREAM_PREFIXES
+
+        items = self._state.http.stream_puzzle_leaderboard(
+            puzzle_id,
+            group,
+            prefixes,
+            self.codingamer.public_handle if self.logged_in else "",
+        )
+
+        try:
+            for prefix, value in items:
+                if leaderboard is None:
+                    yield value
+                    continue
+
+                with self._state.http.measure_model(
+                    "Leaderboards", "getFilteredPuzzleLeaderboard"
+                ):
+                    user = feed_streamed_leaderboard(leaderboard, prefix, value)
+                if user is not None:
+                    yield user
+        except HTTPError as error:
+            if error.data["code"] == "INVALID_PARAMETERS":
+                raise NotFound.from_type(
+                    "puzzle", f"No Puzzle named {puzzle_id!r}"
+                ) from None
+            raise  # pragma: no cover
@@ -1,7 +1,87 @@
-from .client import HTTPClient
-from .httperror import HTTPError
+import importlib
+import typing
+
+# the public names are imported on first access, see PEP 562
+if typing.TYPE_CHECKING:
+    from .breaker import CircuitBreaker, CircuitOpen
+    from .cache import BaseCache, MemoryCache, SQLiteCache
+    from .client import HTTPClient
+    from .decoder import get_json_loads
+    from .hedge import HedgePolicy
+    from .httperror import HTTPError
+    from .metrics import EndpointMetrics, Histogram, Metrics
+    from .middleware import Middleware, Request
+    from .ratelimit import RateLimiter, TokenBucket
+    from .retry import RetryPolicy
+    from .timeout import DeadlineExceeded, Timeout, deadline
+    from .transport import (
+        BaseTransport,
+        RecordReplayTransport,
+        ResponseNotRecorded,
+    )
+
+_LAZY_IMPORTS = {
+    "CircuitBreaker": ".breaker",
+    "CircuitOpen": ".breaker",
+    "BaseCache": ".cache",
+    "MemoryCache": ".cache",
+    "SQLiteCache": ".cache",
+    "HTTPClient": ".client",
+    "get_json_loads": ".decoder",
+    "HedgePolicy": ".hedge",
+    "HTTPError": ".httperror",
+    "EndpointMetrics": ".metrics",
+    "Histogram": ".metrics",
+    "Metrics": ".metrics",
+    "Middleware": ".middleware",
+    "Request": ".middleware",
+    "RateLimiter": ".ratelimit",
+    "TokenBucket": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "DeadlineExceeded": ".timeout",
+    "Timeout": ".timeout",
+    "deadline": ".timeout",
+    "BaseTransport": ".transport",
+    "RecordReplayTransport": ".transport",
+    "ResponseNotRecorded": ".transport",
+}
 
 __all__ = (
     "HTTPClient",
     "HTTPError",
+    "RetryPolicy",
+    "RateLimiter",
+    "TokenBucket",
+    "BaseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "get_json_loads",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "CircuitOpen",
+    "Metrics",
+    "EndpointMetrics",
+    "Histogram",
+    "Request",
+    "Middleware",
+    "Timeout",
+    "DeadlineExceeded",
+    "deadline",
+    "BaseTransport",
+    "RecordReplayTransport",
+    "ResponseNotRecorded",
 )
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,14 @@
+import asyncio
 import typing
 from http.cookies import Morsel
 from http.cookies import _quote as cookie_quote
 
 import aiohttp
 
-from .base import BaseHTTPClient
+from .base import BaseAsyncHTTPClient
 from .httperror import HTTPError
+from .stream import CHUNK_SIZE
+from .timeout import Timeout
 
 if typing.TYPE_CHECKING:
     from ..state import ConnectionState
@@ -13,39 +16,112 @@ if typing.TYPE_CHECKING:
 __all__ = ("AsyncHTTPClient",)
 
 
-class AsyncHTTPClient(BaseHTTPClient):
-    def __init__(self, state: "ConnectionState"):
-        self.state = state
-        self.__session: aiohttp.ClientSession = aiohttp.ClientSession(
-            headers=self.headers
-        )
+class AsyncHTTPClient(BaseAsyncHTTPClient):
+    """Asynchronous HTTP client using ``aiohttp``.
 
-    @property
-    def is_async(self):
-        return True
+    The session is created on the first request, in the running event loop."""
 
-    async def close(self):
-        await self.__session.close()
+    _retry_errors = (
+        HTTPError,
+        aiohttp.ClientConnectionError,
+        asyncio.TimeoutError,
+    )
 
-    async def request(
-        self, service: str, func: str, parameters: typing.Optional[list] = None
+    def __init__(
+        self,
+        state: "ConnectionState",
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: typing.Optional[int] = 10,
+        keepalive_timeout: float = 15.0,
+        connector: typing.Optional[aiohttp.BaseConnector] = None,
+        session: typing.Optional[aiohttp.ClientSession] = None,
+        **options,
+    ):
+        super().__init__(state, **options)
+
+        # a session or connector given by the user is closed by the user
+        self.__owns_session = session is None
+        self.__session: typing.Optional[aiohttp.ClientSession] = session
+        self.__connector = connector
+        self.__connector_options = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.__session is None:
+            connector = self.__connector
+            if connector is None:
+                connector = aiohttp.TCPConnector(**self.__connector_options)
+            self.__session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                connector_owner=self.__connector is None,
+            )
+            for (name, domain), value in self._cookies.items():
+                self._set_cookie(name, value, domain)
+        return self.__session
+
+    async def _close(self):
+        if self.__owns_session and self.__session is not None:
+            await self.__session.close()
+
+    async def _request(
+        self, service: str, func: str, parameters: list, timeout: Timeout
     ):
-        parameters = parameters or []
         url = self.API_URL + service + "/" + func
-        async with self.__session.post(url, json=parameters) as response:
-            data = await response.json()
+        async with self._get_session().post(
+            url,
+            json=parameters,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(
+                total=timeout.total,
+                sock_connect=timeout.connect,
+                sock_read=timeout.read,
+            ),
+        ) as response:
+            data = self._decode(await response.read(), response.ok)
             try:
                 response.raise_for_status()
             except aiohttp.ClientResponseError as error:
                 raise HTTPError.from_aiohttp(error, data) from None
             return data
 
-    def set_cookie(
+    async def _stream(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.AsyncIterator[bytes]:
+        url = self.API_URL + service + "/" + func
+        async with self._get_session().post(
+            url,
+            json=parameters,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(
+                total=timeout.total,
+                sock_connect=timeout.connect,
+                sock_read=timeout.read,
+            ),
+        ) as response:
+            if not response.ok:
+                data = self._decode(await response.read(), False)
+                try:
+                    response.raise_for_status()
+                except aiohttp.ClientResponseError as error:
+                    raise HTTPError.from_aiohttp(error, data) from None
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                yield chunk
+
+    def _set_cookie(
         self,
         name: str,
         value: typing.Optional[str] = None,
         domain: str = "www.codingame.com",
     ):
+        if self.__session is None:
+            return  # set when the session is created
         if value is not None:
             morsel = Morsel()
             morsel.set(name, value, cookie_quote(value))
@@ -1,3 +1,9 @@
+import asyncio
+import contextlib
+import functools
+import json
+import threading
+import time
 import typing
 from abc import ABC, abstractmethod
 
@@ -9,12 +15,58 @@ from ..types import (
     Notification,
     PointsStatsFromHandle,
 )
+from .breaker import CircuitBreaker
+from .cache import BaseCache, make_key
+from .decoder import JSONLoads, get_json_loads
+from .hedge import HedgePolicy
+from .httperror import HTTPError
+from .metrics import Metrics, current_endpoint
+from .middleware import Middleware, Request, is_async_middleware
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .stream import JSONStreamParser
+from .timeout import (
+    DEFAULT_TIMEOUT,
+    DeadlineExceeded,
+    Timeout,
+    get_deadline,
+    get_remaining,
+)
+from .tracing import get_tracer, request_span, stream_span
+from .transport import BaseTransport
 
 if typing.TYPE_CHECKING:
+    from opentelemetry.trace import Tracer, TracerProvider
+
     from ..state import ConnectionState
 
-__all__ = ("BaseHTTPClient",)
+__all__ = (
+    "BaseHTTPClient",
+    "BaseSyncHTTPClient",
+    "BaseAsyncHTTPClient",
+)
+
+
+NOT_CACHED = object()
 
+READ_ONLY_ENDPOINTS = frozenset(
+    {
+        "ProgrammingLanguage/findAllIds",
+        "Search/search",
+        "CodinGamer/findCodingamePointsStatsByHandle",
+        "CodinGamer/findCodinGamerPublicInformations",
+        "CodinGamer/findFollowers",
+        "CodinGamer/findFollowerIds",
+        "CodinGamer/findFollowing",
+        "CodinGamer/findFollowingIds",
+        "ClashOfCode/getClashRankByCodinGamerId",
+        "ClashOfCode/findClashByHandle",
+        "ClashOfCode/findPendingClashes",
+        "Leaderboards/getGlobalLeaderboard",
+        "Leaderboards/getFilteredChallengeLeaderboard",
+        "Leaderboards/getFilteredPuzzleLeaderboard",
+    }
+)
 
 DEFAULT_FILTER = {
     "active": False,
@@ -36,12 +88,90 @@ class BaseHTTPClient(ABC):
         )
     }
     state: "ConnectionState"
+    retry: RetryPolicy
+    rate_limiter: typing.Optional[RateLimiter]
+    cache: typing.Optional[BaseCache]
+    coalesce: bool
+    json_loads: JSONLoads
+    transport: typing.Optional[BaseTransport]
+    circuit_breaker: typing.Optional[CircuitBreaker]
+    middlewares: typing.List[Middleware]
+    metrics: typing.Optional[Metrics]
+    timeout: Timeout
+    timeouts: typing.Dict[str, Timeout]
+
+    def __init__(
+        self,
+        state: "ConnectionState",
+        *,
+        retry: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        cache: typing.Optional[BaseCache] = None,
+        coalesce: bool = False,
+        json_loads: typing.Optional[JSONLoads] = None,
+        transport: typing.Optional[BaseTransport] = None,
+        timeout: typing.Union[Timeout, float, None] = DEFAULT_TIMEOUT,
+        timeouts: typing.Optional[
+            typing.Mapping[str, typing.Union[Timeout, float, None]]
+        ] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        middlewares: typing.Iterable[Middleware] = (),
+        metrics: typing.Optional[Metrics] = None,
+        tracing: bool = True,
+        tracer_provider: typing.Optional["TracerProvider"] = None,
+    ):
+        if transport is not None and transport.is_async != self.is_async:
+            raise ValueError(
+                "An asynchronous client needs an asynchronous transport and a "
+                "synchronous client needs a synchronous transport."
+            )
+
+        self.state = state
+        self.retry = retry or RetryPolicy(max_attempts=1)
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.coalesce = coalesce
+        self.json_loads = json_loads or get_json_loads()
+        # requests being sent, by cache key and deadline, shared by identical
+        # requests with the same deadline
+        self._in_flight: typing.Dict[
+            typing.Tuple[str, typing.Optional[float]], typing.Any
+        ] = {}
+        self.timeout = Timeout.from_value(timeout)
+        self.timeouts = {
+            endpoint: Timeout.from_value(endpoint_timeout)
+            for endpoint, endpoint_timeout in (timeouts or {}).items()
+        }
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        # the tracer and the sessions are created on first use, so that
+        # creating a client is cheap
+        self._tracing = tracing
+        self._tracer_provider = tracer_provider
+        self._tracer: typing.Optional["Tracer"] = None
+        # cookies to set in the sessions when they are created
+        self._cookies: typing.Dict[typing.Tuple[str, str], str] = {}
+        self.middlewares = []
+        for middleware in middlewares:
+            self.add_middleware(middleware)
+        self.transport = transport
+        if transport is not None:
+            transport.attach(self)
 
     @property
     @abstractmethod
     def is_async(self) -> bool:
         ...  # pragma: no cover
 
+    @property
+    def tracer(self) -> typing.Optional["Tracer"]:
+        """The OpenTelemetry tracer, ``None`` if the tracing is disabled or if
+        ``opentelemetry-api`` isn't installed."""
+
+        if self._tracing and self._tracer is None:
+            self._tracer = get_tracer(self._tracer_provider)
+        return self._tracer
+
     @abstractmethod
     def close(self):
         ...  # pragma: no cover
@@ -53,14 +183,183 @@ class BaseHTTPClient(ABC):
         ...  # pragma: no cover
 
     @abstractmethod
+    def stream(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        prefixes: typing.Collection[str],
+    ):
+        """Send a request and parse its response while it's received,
+        yielding the ``(prefix, value)`` pairs of the values at the
+        ``prefixes``, see :class:`~codingame.http.stream.JSONStreamParser`.
+
+        The streamed requests go through the circuit breaker, the rate limiter
+        and the timeouts but they aren't cached, coalesced, retried nor passed
+        to the middlewares."""
+
+    def add_middleware(self, middleware: Middleware) -> Middleware:
+        """Add a middleware at the end of the chain of middlewares, so it's
+        called after the middlewares already added. It can be used as a
+        decorator.
+
+        Parameters
+        ----------
+            middleware : Callable[[Request, Callable[[Request], Any]], Any]
+                The middleware, called with the
+                :class:`~codingame.http.Request` and the function calling the
+                next middleware, and returning the response. It's a coroutine
+                function for asynchronous clients.
+
+        Returns
+        -------
+            Callable[[Request, Callable[[Request], Any]], Any]
+                The middleware.
+        """
+
+        if is_async_middleware(middleware) != self.is_async:
+            raise TypeError(
+                "An asynchronous client needs coroutine functions as "
+                "middlewares and a synchronous client needs functions."
+            )
+
+        self.middlewares.append(middleware)
+        return middleware
+
+    def remove_middleware(self, middleware: Middleware):
+        """Remove a middleware from the chain of middlewares."""
+
+        self.middlewares.remove(middleware)
+
     def set_cookie(
         self,
         name: str,
         value: typing.Optional[str] = None,
         domain: str = "www.codingame.com",
+    ):
+        if value is None:
+            self._cookies.pop((name, domain), None)
+        else:
+            self._cookies[(name, domain)] = value
+        if self.transport is not None:
+            self.transport.set_cookie(name, value, domain)
+        self._set_cookie(name, value, domain)
+
+    @abstractmethod
+    def _set_cookie(
+        self,
+        name: str,
+        value: typing.Optional[str] = None,
+        domain: str = "www.codingame.com",
     ):
         ...  # pragma: no cover
 
+    def _get_cached(
+        self, service: str, func: str, parameters: list
+    ) -> typing.Tuple[typing.Optional[str], typing.Optional[float], typing.Any]:
+        """Get the cache key, the time to live and the cached response of a
+        request. The key is ``None`` if the response isn't cacheable and the
+        response is ``NOT_CACHED`` if it isn't in the cache."""
+
+        if self.cache is None:
+            return None, None, NOT_CACHED
+
+        ttl = self.cache.get_ttl(service, func)
+        if ttl is None:
+            return None, None, NOT_CACHED
+
+        key = make_key(service, func, parameters)
+        return key, ttl, self.cache.get(key, NOT_CACHED)
+
+    def _get_timeout(self, service: str, func: str) -> Timeout:
+        """Get the timeout of the next attempt of a request, limited by the
+        current deadline.
+
+        Raises
+        ------
+            :exc:`~codingame.http.DeadlineExceeded`
+                The deadline is already reached.
+        """
+
+        timeout = self.timeouts.get(
+            service + "/" + func, self.timeouts.get(service, self.timeout)
+        )
+        return timeout.limit(get_remaining())
+
+    @staticmethod
+    def _limit_wait(delay: float) -> float:
+        """Check that waiting for ``delay`` seconds doesn't exceed the current
+        deadline."""
+
+        remaining = get_remaining()
+        if remaining is not None and delay >= remaining:
+            raise DeadlineExceeded(
+                f"Waiting {delay:.3f}s would exceed the deadline."
+            )
+        return delay
+
+    def _can_coalesce(self, service: str, func: str) -> bool:
+        return self.coalesce and service + "/" + func in READ_ONLY_ENDPOINTS
+
+    def _decode(self, body: bytes, ok: bool) -> typing.Any:
+        """Decode the JSON body of a response."""
+
+        endpoint = current_endpoint.get() if self.metrics else None
+        start = time.perf_counter()
+        try:
+            return self.json_loads(body)
+        except ValueError:
+            if ok:
+                raise
+            return None  # error pages of proxies aren't always JSON
+        finally:
+            if endpoint is not None:
+                self.metrics.record_decode(
+                    *endpoint, len(body), time.perf_counter() - start
+                )
+
+    def measure_model(
+        self, service: str, func: str
+    ) -> typing.ContextManager[None]:
+        """Context manager recording in the metrics the duration of the
+        creation of models from a response of an endpoint."""
+
+        if self.metrics is None:
+            return contextlib.nullcontext()
+        return self.metrics.measure_model(service, func)
+
+    def _trace_request(
+        self, service: str, func: str
+    ) -> typing.ContextManager[None]:
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return request_span(
+            self.tracer, service, func, self.API_URL + service + "/" + func
+        )
+
+    def _trace_stream(
+        self, service: str, func: str
+    ) -> typing.ContextManager[typing.Callable[[], typing.ContextManager]]:
+        if self.tracer is None:
+            return contextlib.nullcontext(contextlib.nullcontext)
+        return stream_span(
+            self.tracer, service, func, self.API_URL + service + "/" + func
+        )
+
+    def _measure_stream(
+        self, service: str, func: str
+    ) -> typing.ContextManager[typing.Callable[[int, float, float], None]]:
+        if self.metrics is None:
+            return contextlib.nullcontext(lambda *_: None)
+        return self.metrics.measure_stream(service, func)
+
+    def _measure_request(
+        self, service: str, func: str
+    ) -> typing.ContextManager[None]:
+        if self.metrics is None:
+            return contextlib.nullcontext()
+        return self.metrics.measure_request(service, func)
+
     def get_file_url(self, id: int, format: str = None) -> str:
         url = f"{self.STATIC_URL}/servlet/fileservlet?id={id}"
         if format:
@@ -196,3 +495,603 @@ class BaseHTTPClient(ABC):
             "getFilteredPuzzleLeaderboard",
             [puzzle_id, handle, group, filter],
         )
+
+    def stream_challenge_leaderboard(
+        self,
+        challenge_id: str,
+        group: str,
+        prefixes: typing.Collection[str],
+        handle: str = "",
+        filter: typing.Optional[dict] = None,
+    ):
+        filter = filter or DEFAULT_FILTER
+        return self.stream(
+            "Leaderboards",
+            "getFilteredChallengeLeaderboard",
+            [challenge_id, handle, group, filter],
+            prefixes,
+        )
+
+    def stream_puzzle_leaderboard(
+        self,
+        puzzle_id: str,
+        group: str,
+        prefixes: typing.Collection[str],
+        handle: str = "",
+        filter: typing.Optional[dict] = None,
+    ):
+        filter = filter or DEFAULT_FILTER
+        return self.stream(
+            "Leaderboards",
+            "getFilteredPuzzleLeaderboard",
+            [puzzle_id, handle, group, filter],
+            prefixes,
+        )
+
+
+class _InFlightRequest:
+    __slots__ = ("done", "data", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.data = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class BaseSyncHTTPClient(BaseHTTPClient):
+    """Base class of the synchronous HTTP clients.
+
+    Implements the cache, the coalescing of requests, the rate limit and the
+    retries on top of :meth:`_send` that sends a single request with the
+    transport or with :meth:`_request`."""
+
+    _retry_errors: typing.Tuple[typing.Type[Exception], ...] = (HTTPError,)
+    """Errors of :meth:`_request` that can be retried."""
+
+    def __init__(self, state: "ConnectionState", **options):
+        super().__init__(state, **options)
+        self._in_flight_lock = threading.Lock()
+
+    @property
+    def is_async(self) -> bool:
+        return False
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+        self._close()
+
+    @abstractmethod
+    def _close(self):
+        """Close the connection of the client."""
+
+    def request(
+        self, service: str, func: str, parameters: typing.Optional[list] = None
+    ):
+        parameters = parameters or []
+        if not self.middlewares:
+            return self._handle(service, func, parameters)
+        return self._call_middleware(0, Request(service, func, parameters))
+
+    def _call_middleware(self, index: int, request: Request):
+        if index == len(self.middlewares):
+            return self._handle(
+                request.service, request.func, request.parameters
+            )
+        return self.middlewares[index](
+            request, functools.partial(self._call_middleware, index + 1)
+        )
+
+    def stream(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        prefixes: typing.Collection[str],
+    ) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+        parser = JSONStreamParser(prefixes)
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(service)
+        try:
+            if self.rate_limiter is not None:
+                time.sleep(self._limit_wait(self.rate_limiter.reserve(service)))
+            timeout = self._get_timeout(service, func)
+            # the span is only current while reading the response, not while
+            # the caller handles the values
+            trace_stream = self._trace_stream(service, func)
+            measure_stream = self._measure_stream(service, func)
+            with trace_stream as use_span, measure_stream as record_chunk:
+                chunks = self._stream_chunks(service, func, parameters, timeout)
+                try:
+                    done = False
+                    while not done:
+                        with use_span():
+                            items, done = self._parse_next_chunk(
+                                chunks, parser, record_chunk
+                            )
+                        yield from items
+                finally:
+                    chunks.close()
+        except BaseException as error:
+            if breaker is not None:
+                breaker.after_request(service, error)
+            raise
+        if breaker is not None:
+            breaker.after_request(service)
+
+    def _handle(self, service: str, func: str, parameters: list):
+        key, ttl, data = self._get_cached(service, func, parameters)
+        if data is not NOT_CACHED:
+            return data
+
+        if self._can_coalesce(service, func):
+            data = self._request_coalesced(service, func, parameters)
+        else:
+            data = self._request_with_retry(service, func, parameters)
+        if key is not None:
+            self.cache.set(key, data, ttl)
+        return data
+
+    def _request_coalesced(self, service: str, func: str, parameters: list):
+        # the request is sent with the deadline of the first caller, so only
+        # the callers with the same deadline can share it
+        key = (make_key(service, func, parameters), get_deadline())
+        with self._in_flight_lock:
+            in_flight: _InFlightRequest = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlightRequest()
+
+        if not leader:
+            if not in_flight.done.wait(get_remaining()):
+                raise DeadlineExceeded(
+                    "The deadline of the request is exceeded."
+                )
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.data
+
+        try:
+            in_flight.data = self._request_with_retry(service, func, parameters)
+            return in_flight.data
+        except BaseException as error:
+            in_flight.error = error
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+
+    def _request_with_retry(self, service: str, func: str, parameters: list):
+        attempt = 1
+        while True:
+            try:
+                return self._attempt(service, func, parameters)
+            except DeadlineExceeded:
+                raise
+            except self._retry_errors as error:
+                delay = self.retry.get_delay(attempt, error)
+                if delay is None:
+                    raise
+                delay = self._limit_wait(delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt(self, service: str, func: str, parameters: list):
+        """Make an attempt of a request, if the circuit breaker and the
+        deadline allow it, after waiting for the rate limiter."""
+
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(service)
+        try:
+            if self.rate_limiter is not None:
+                time.sleep(self._limit_wait(self.rate_limiter.reserve(service)))
+            timeout = self._get_timeout(service, func)
+            with self._trace_request(service, func), self._measure_request(
+                service, func
+            ):
+                data = self._send(service, func, parameters, timeout)
+        except BaseException as error:
+            if breaker is not None:
+                breaker.after_request(service, error)
+            raise
+        if breaker is not None:
+            breaker.after_request(service)
+        return data
+
+    def _send(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ):
+        """Send a single request with the transport if there's one, or with
+        the connection of the client."""
+
+        if self.transport is not None:
+            return self.transport.request(service, func, parameters, timeout)
+        return self._request(service, func, parameters, timeout)
+
+    @abstractmethod
+    def _request(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ):
+        """Send a single request to the API and return the decoded response.
+
+        Raises
+        ------
+            :exc:`HTTPError`
+                The response has an error status code.
+        """
+
+    @staticmethod
+    def _parse_next_chunk(
+        chunks: typing.Iterator[bytes],
+        parser: JSONStreamParser,
+        record_chunk: typing.Callable[[int, float, float], None],
+    ) -> typing.Tuple[typing.List[typing.Tuple[str, typing.Any]], bool]:
+        """Read and parse the next chunk of a streamed response, returns the
+        parsed values and whether the response is finished."""
+
+        start = time.perf_counter()
+        chunk = next(chunks, None)
+        read = time.perf_counter()
+        items = parser.close() if chunk is None else parser.feed(chunk)
+        record_chunk(
+            len(chunk or b""), read - start, time.perf_counter() - read
+        )
+        return items, chunk is None
+
+    def _stream_chunks(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.Iterator[bytes]:
+        if self.transport is None:
+            yield from self._stream(service, func, parameters, timeout)
+        else:  # the transports give decoded responses
+            data = self.transport.request(service, func, parameters, timeout)
+            yield json.dumps(data).encode()
+
+    def _stream(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.Iterator[bytes]:
+        """Send a single request to the API and yield the chunks of the body
+        of the response, the whole encoded response of :meth:`_request` by
+        default.
+
+        Raises
+        ------
+            :exc:`HTTPError`
+                The response has an error status code.
+        """
+
+        yield json.dumps(
+            self._request(service, func, parameters, timeout)
+        ).encode()
+
+
+class BaseAsyncHTTPClient(BaseHTTPClient):
+    """Base class of the asynchronous HTTP clients.
+
+    Implements the cache, the coalescing of requests, the rate limit and the
+    retries on top of :meth:`_send` that sends a single request with the
+    transport or with :meth:`_request`."""
+
+    _retry_errors: typing.Tuple[typing.Type[Exception], ...] = (
+        HTTPError,
+        asyncio.TimeoutError,
+    )
+    """Errors of :meth:`_request` that can be retried."""
+
+    hedge: typing.Optional[HedgePolicy]
+
+    def __init__(
+        self,
+        state: "ConnectionState",
+        *,
+        hedge: typing.Optional[HedgePolicy] = None,
+        **options,
+    ):
+        super().__init__(state, **options)
+        self.hedge = hedge
+
+    @property
+    def is_async(self) -> bool:
+        return True
+
+    async def close(self):
+        if self.transport is not None:
+            await self.transport.close()
+        await self._close()
+
+    @abstractmethod
+    async def _close(self):
+        """Close the connection of the client."""
+
+    async def request(
+        self, service: str, func: str, parameters: typing.Optional[list] = None
+    ):
+        parameters = parameters or []
+        if not self.middlewares:
+            return await self._handle(service, func, parameters)
+        return await self._call_middleware(
+            0, Request(service, func, parameters)
+        )
+
+    async def _call_middleware(self, index: int, request: Request):
+        if index == len(self.middlewares):
+            return await self._handle(
+                request.service, request.func, request.parameters
+            )
+        return await self.middlewares[index](
+            request, functools.partial(self._call_middleware, index + 1)
+        )
+
+    async def stream(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        prefixes: typing.Collection[str],
+    ) -> typing.AsyncIterator[typing.Tuple[str, typing.Any]]:
+        parser = JSONStreamParser(prefixes)
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(service)
+        try:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(
+                    self._limit_wait(self.rate_limiter.reserve(service))
+                )
+            timeout = self._get_timeout(service, func)
+            # the span is only current while reading the response, not while
+            # the caller handles the values, which can be in other contexts
+            trace_stream = self._trace_stream(service, func)
+            measure_stream = self._measure_stream(service, func)
+            with trace_stream as use_span, measure_stream as record_chunk:
+                chunks = self._stream_chunks(service, func, parameters, timeout)
+                try:
+                    done = False
+                    while not done:
+                        with use_span():
+                            items, done = await self._parse_next_chunk(
+                                chunks, parser, record_chunk
+                            )
+                        for item in items:
+                            yield item
+                finally:
+                    await chunks.aclose()
+        except BaseException as error:
+            if breaker is not None:
+                breaker.after_request(service, error)
+            raise
+        if breaker is not None:
+            breaker.after_request(service)
+
+    async def _handle(self, service: str, func: str, parameters: list):
+        key, ttl, data = self._get_cached(service, func, parameters)
+        if data is not NOT_CACHED:
+            return data
+
+        if self._can_coalesce(service, func):
+            data = await self._request_coalesced(service, func, parameters)
+        else:
+            data = await self._request_with_retry(service, func, parameters)
+        if key is not None:
+            self.cache.set(key, data, ttl)
+        return data
+
+    async def _request_coalesced(
+        self, service: str, func: str, parameters: list
+    ):
+        # the request is sent with the deadline of the first caller, so only
+        # the callers with the same deadline can share it
+        key = (make_key(service, func, parameters), get_deadline())
+        in_flight: typing.Optional[asyncio.Future] = self._in_flight.get(key)
+        if in_flight is None:
+            # a task of its own so that no caller cancels it for the others
+            in_flight = asyncio.ensure_future(
+                self._request_with_retry(service, func, parameters)
+            )
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(
+                functools.partial(self._request_done, key)
+            )
+
+        # shielded so that a cancelled caller doesn't cancel the others
+        remaining = get_remaining()
+        try:
+            return await asyncio.wait_for(asyncio.shield(in_flight), remaining)
+        except asyncio.TimeoutError:
+            if remaining is None:
+                raise
+            raise DeadlineExceeded(
+                "The deadline of the request is exceeded."
+            ) from None
+
+    def _request_done(
+        self,
+        key: typing.Tuple[str, typing.Optional[float]],
+        in_flight: asyncio.Future,
+    ):
+        if self._in_flight.get(key) is in_flight:
+            del self._in_flight[key]
+        if not in_flight.cancelled():
+            in_flight.exception()  # retrieved, even if nobody was waiting
+
+    async def _request_with_retry(
+        self, service: str, func: str, parameters: list
+    ):
+        attempt = 1
+        while True:
+            try:
+                return await self._attempt(service, func, parameters)
+            except DeadlineExceeded:
+                raise
+            except self._retry_errors as error:
+                delay = self.retry.get_delay(attempt, error)
+                if delay is None:
+                    raise
+                delay = self._limit_wait(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt(self, service: str, func: str, parameters: list):
+        """Make an attempt of a request, if the circuit breaker and the
+        deadline allow it, after waiting for the rate limiter."""
+
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(service)
+        try:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(
+                    self._limit_wait(self.rate_limiter.reserve(service))
+                )
+            timeout = self._get_timeout(service, func)
+            send = (
+                self._send_hedged
+                if self._can_hedge(service, func)
+                else self._send
+            )
+            with self._trace_request(service, func), self._measure_request(
+                service, func
+            ):
+                data = await send(service, func, parameters, timeout)
+        except BaseException as error:
+            if breaker is not None:
+                breaker.after_request(service, error)
+            raise
+        if breaker is not None:
+            breaker.after_request(service)
+        return data
+
+    def _can_hedge(self, service: str, func: str) -> bool:
+        endpoint = service + "/" + func
+        return self.hedge is not None and self.hedge.can_hedge(
+            endpoint, endpoint in READ_ONLY_ENDPOINTS
+        )
+
+    async def _send_hedged(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ):
+        """Send a request, and send it again if it's slower than the delay of
+        the hedge policy. The first successful response is returned."""
+
+        endpoint = service + "/" + func
+        loop = asyncio.get_running_loop()
+        self.hedge.add_request()
+        delay = self.hedge.get_delay(endpoint)
+
+        async def send(rate_limited: bool):
+            if rate_limited and self.rate_limiter is not None:
+                await asyncio.sleep(
+                    self._limit_wait(self.rate_limiter.reserve(service))
+                )
+            start = loop.time()
+            data = await self._send(service, func, parameters, timeout)
+            return data, loop.time() - start
+
+        tasks = [asyncio.ensure_future(send(False))]
+        pending = set(tasks)
+        error: typing.Optional[BaseException] = None
+        try:
+            while pending:
+                can_hedge = len(tasks) <= self.hedge.max_hedges
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    if self.hedge.acquire():
+                        tasks.append(asyncio.ensure_future(send(True)))
+                        pending.add(tasks[-1])
+                    else:
+                        delay = None
+                    continue
+
+                for task in done:
+                    if task.exception() is None:
+                        data, latency = task.result()
+                        self.hedge.add_latency(
+                            endpoint, latency, task is not tasks[0]
+                        )
+                        return data
+                    if error is None:
+                        error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ):
+        """Send a single request with the transport if there's one, or with
+        the connection of the client."""
+
+        if self.transport is not None:
+            return await self.transport.request(
+                service, func, parameters, timeout
+            )
+        return await self._request(service, func, parameters, timeout)
+
+    @abstractmethod
+    async def _request(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ):
+        """Send a single request to the API and return the decoded response.
+
+        Raises
+        ------
+            :exc:`HTTPError`
+                The response has an error status code.
+        """
+
+    @staticmethod
+    async def _parse_next_chunk(
+        chunks: typing.AsyncIterator[bytes],
+        parser: JSONStreamParser,
+        record_chunk: typing.Callable[[int, float, float], None],
+    ) -> typing.Tuple[typing.List[typing.Tuple[str, typing.Any]], bool]:
+        """Read and parse the next chunk of a streamed response, returns the
+        parsed values and whether the response is finished."""
+
+        start = time.perf_counter()
+        try:
+            chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            chunk = None
+        read = time.perf_counter()
+        items = parser.close() if chunk is None else parser.feed(chunk)
+        record_chunk(
+            len(chunk or b""), read - start, time.perf_counter() - read
+        )
+        return items, chunk is None
+
+    async def _stream_chunks(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.AsyncIterator[bytes]:
+        if self.transport is None:
+            async for chunk in self._stream(service, func, parameters, timeout):
+                yield chunk
+        else:  # the transports give decoded responses
+            data = await self.transport.request(
+                service, func, parameters, timeout
+            )
+            yield json.dumps(data).encode()
+
+    async def _stream(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.AsyncIterator[bytes]:
+        """Send a single request to the API and yield the chunks of the body
+        of the response, the whole encoded response of :meth:`_request` by
+        default.
+
+        Raises
+        ------
+            :exc:`HTTPError`
+                The response has an error status code.
+        """
+
+        data = await self._request(service, func, parameters, timeout)
+        yield json.dumps(data).encode()
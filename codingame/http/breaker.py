@@ -0,0 +1,238 @@
+import threading
+import time
+import typing
+from collections import deque
+
+from .httperror import HTTPError
+from .timeout import DeadlineExceeded
+
+__all__ = (
+    "CircuitBreaker",
+    "CircuitOpen",
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpen(Exception):
+    """Raised instead of sending a request to a service whose circuit is open.
+
+    .. versionadded:: 1.5
+
+    Attributes
+    -----------
+        service : str
+            The CodinGame API service.
+        retry_after : float
+            Number of seconds until the circuit lets a request through again.
+    """
+
+    def __init__(self, service: str, retry_after: float):
+        super().__init__(
+            f"The circuit of the {service} service is open, retry in "
+            f"{retry_after:.1f}s"
+        )
+        self.service = service
+        self.retry_after = retry_after
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "opened_at", "probes", "successes")
+
+    def __init__(self):
+        self.state = CLOSED
+        # (time, failed) of the recent requests
+        self.outcomes: typing.Deque[typing.Tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.probes = 0
+        self.successes = 0
+
+
+class CircuitBreaker:
+    """Circuit breaker of each service of the API, so that the requests to a
+    service that fails fail fast instead of waiting for the service.
+
+    A circuit starts closed and lets the requests through. When the ratio of
+    failed requests in the last ``window`` seconds reaches
+    ``failure_threshold``, the circuit opens and the requests to the service
+    raise :exc:`CircuitOpen` right away. After ``cooldown`` seconds, the
+    circuit is half-open and lets ``half_open_requests`` requests through: if
+    they succeed, the circuit closes, otherwise it opens again.
+
+    Connection errors, timeouts and the HTTP errors with a status code of
+    ``429`` or ``5xx`` are failures. Other HTTP errors mean that the service
+    works.
+
+    It can be shared between clients, threads and coroutines.
+
+    Parameters
+    ----------
+        failure_threshold : float
+            Ratio of failed requests, between ``0`` and ``1``, that opens the
+            circuit. Defaults to ``0.5``.
+        min_requests : int
+            Minimum number of requests in the window before the circuit can
+            open. Defaults to ``10``.
+        window : float
+            Number of seconds of requests used to compute the failure ratio.
+            Defaults to ``60``.
+        cooldown : float
+            Number of seconds the circuit stays open. Defaults to ``30``.
+        half_open_requests : int
+            Number of requests let through by a half-open circuit.
+            Defaults to ``1``.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        min_requests: int = 10,
+        window: float = 60.0,
+        cooldown: float = 30.0,
+        half_open_requests: int = 1,
+    ):
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold argument must be in ]0, 1].")
+        if min_requests < 1:
+            raise ValueError("min_requests argument must be at least 1.")
+        if window <= 0 or cooldown <= 0:
+            raise ValueError("window and cooldown arguments must be positive.")
+        if half_open_requests < 1:
+            raise ValueError("half_open_requests argument must be at least 1.")
+
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.cooldown = cooldown
+        self.half_open_requests = half_open_requests
+        self._circuits: typing.Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} "
+            "failure_threshold={0.failure_threshold!r} "
+            "cooldown={0.cooldown!r} open={1!r}>".format(
+                self,
+                [
+                    service
+                    for service, circuit in self._circuits.items()
+                    if circuit.state != CLOSED
+                ],
+            )
+        )
+
+    def get_state(self, service: str) -> str:
+        """Get the state of the circuit of a service, either ``"closed"``,
+        ``"open"`` or ``"half-open"``."""
+
+        with self._lock:
+            circuit = self._circuits.get(service)
+            if circuit is None:
+                return CLOSED
+            if (
+                circuit.state == OPEN
+                and time.monotonic() - circuit.opened_at >= self.cooldown
+            ):
+                return HALF_OPEN
+            return circuit.state
+
+    def before_request(self, service: str):
+        """Check that a request to a service can be sent.
+
+        Raises
+        ------
+            :exc:`CircuitOpen`
+                The circuit of the service is open.
+        """
+
+        with self._lock:
+            circuit = self._circuits.get(service)
+            if circuit is None or circuit.state == CLOSED:
+                return
+
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                retry_after = circuit.opened_at + self.cooldown - now
+                if retry_after > 0:
+                    raise CircuitOpen(service, retry_after)
+                circuit.state = HALF_OPEN
+                circuit.probes = circuit.successes = 0
+
+            if circuit.probes >= self.half_open_requests:
+                raise CircuitOpen(service, 0.0)
+            circuit.probes += 1
+
+    def after_request(
+        self, service: str, error: typing.Optional[BaseException] = None
+    ):
+        """Record the result of a request to a service.
+
+        Parameters
+        ----------
+            service : str
+                The CodinGame API service of the request.
+            error : Optional[BaseException]
+                The error raised by the request, ``None`` if it succeeded.
+        """
+
+        # cancelled requests and deadlines don't tell if the service works
+        neutral = error is not None and (
+            isinstance(error, DeadlineExceeded)
+            or not isinstance(error, Exception)
+        )
+        failed = self.is_failure(error)
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(service)
+            if circuit is None:
+                circuit = self._circuits[service] = _Circuit()
+
+            if neutral:
+                if circuit.state == HALF_OPEN:
+                    circuit.probes -= 1
+            elif circuit.state == HALF_OPEN:
+                self._after_probe(circuit, failed, now)
+            elif circuit.state == CLOSED:
+                self._after_closed(circuit, failed, now)
+            # else the request was sent before the circuit opened
+
+    def _after_probe(self, circuit: _Circuit, failed: bool, now: float):
+        if failed:
+            self._open(circuit, now)
+            return
+
+        circuit.successes += 1
+        if circuit.successes >= self.half_open_requests:
+            circuit.state = CLOSED
+            circuit.outcomes.clear()
+
+    def _after_closed(self, circuit: _Circuit, failed: bool, now: float):
+        outcomes = circuit.outcomes
+        outcomes.append((now, failed))
+        while outcomes[0][0] <= now - self.window:
+            outcomes.popleft()
+        if failed and len(outcomes) >= self.min_requests:
+            failures = sum(outcome[1] for outcome in outcomes)
+            if failures / len(outcomes) >= self.failure_threshold:
+                self._open(circuit, now)
+
+    @staticmethod
+    def is_failure(error: typing.Optional[BaseException]) -> bool:
+        """Whether an error means that the service is failing."""
+
+        if error is None or isinstance(error, DeadlineExceeded):
+            return False
+        if isinstance(error, HTTPError):
+            return error.status_code == 429 or error.status_code >= 500
+        return isinstance(error, Exception)
+
+    @staticmethod
+    def _open(circuit: _Circuit, now: float):
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.outcomes.clear()
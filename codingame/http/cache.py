@@ -0,0 +1,284 @@
+import json
+import sqlite3
+import threading
+import time
+import typing
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+__all__ = (
+    "DEFAULT_TTLS",
+    "BaseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "make_key",
+)
+
+DEFAULT_TTLS: typing.Dict[str, float] = {
+    "ProgrammingLanguage/findAllIds": 3600,
+    "Search/search": 300,
+    "CodinGamer/findCodingamePointsStatsByHandle": 300,
+    "CodinGamer/findCodinGamerPublicInformations": 300,
+    "CodinGamer/findFollowers": 300,
+    "CodinGamer/findFollowerIds": 300,
+    "CodinGamer/findFollowing": 300,
+    "CodinGamer/findFollowingIds": 300,
+    "Leaderboards/getGlobalLeaderboard": 300,
+    "Leaderboards/getFilteredChallengeLeaderboard": 300,
+    "Leaderboards/getFilteredPuzzleLeaderboard": 300,
+}
+"""Default time to live in seconds of the responses of the read-only
+endpoints. The other endpoints aren't cached."""
+
+
+def make_key(service: str, func: str, parameters: list) -> str:
+    """Make the cache key of a request."""
+
+    return (
+        service
+        + "/"
+        + func
+        + json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+    )
+
+
+class BaseCache(ABC):
+    """Abstract base class for the caches of API responses.
+
+    Only the responses of the endpoints with a time to live are cached.
+
+    Parameters
+    ----------
+        ttls : Optional[Mapping[str, float]]
+            Time to live in seconds of the responses, by endpoint
+            (``"Service/func"``) or by service (``"Service"``).
+            Defaults to :data:`~codingame.http.cache.DEFAULT_TTLS`.
+
+    .. versionadded:: 1.5
+    """
+
+    hits: int
+    """Number of requests answered from the cache."""
+    misses: int
+    """Number of cacheable requests that weren't in the cache."""
+
+    def __init__(
+        self, ttls: typing.Optional[typing.Mapping[str, float]] = None
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+
+    def get_ttl(self, service: str, func: str) -> typing.Optional[float]:
+        """Get the time to live of the responses of an endpoint, or ``None`` if
+        they aren't cached."""
+
+        ttl = self.ttls.get(service + "/" + func, self.ttls.get(service))
+        return ttl if ttl and ttl > 0 else None
+
+    @abstractmethod
+    def get(self, key: str, default=None) -> typing.Any:
+        """Get a response from the cache, or ``default`` if it isn't cached or
+        has expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: typing.Any, ttl: float):
+        """Put a response in the cache for ``ttl`` seconds."""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every response from the cache."""
+
+    def close(self):
+        """Release the resources of the cache."""
+
+
+class MemoryCache(BaseCache):
+    """In-memory cache of API responses with least recently used eviction.
+
+    It can be shared between threads and between coroutines.
+
+    .. warning::
+        The cached responses are returned as is, so they must not be modified.
+
+    Parameters
+    ----------
+        maxsize : int
+            Maximum number of responses in the cache. Defaults to ``1024``.
+        ttls : Optional[Mapping[str, float]]
+            Time to live in seconds of the responses, by endpoint
+            (``"Service/func"``) or by service (``"Service"``).
+            Defaults to :data:`~codingame.http.cache.DEFAULT_TTLS`.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: typing.Optional[typing.Mapping[str, float]] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize argument must be at least 1.")
+
+        super().__init__(ttls)
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, typing.Tuple[float, typing.Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} size={1!r} maxsize={0.maxsize!r} "
+            "hits={0.hits!r} misses={0.misses!r}>".format(self, len(self))
+        )
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: str, default=None) -> typing.Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: typing.Any, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SQLiteCache(BaseCache):
+    """Persistent cache of API responses stored in an SQLite database.
+
+    The responses are stored as compressed JSON, so the cache survives restarts
+    of the program and can be shared between processes. When the cache is
+    bigger than ``max_size``, the expired responses and then the least recently
+    used ones are removed.
+
+    It can be shared between threads and between coroutines.
+
+    Parameters
+    ----------
+        path : str
+            Path of the database file, created if it doesn't exist.
+        max_size : int
+            Maximum size in bytes of the compressed responses.
+            Defaults to 100 MiB.
+        ttls : Optional[Mapping[str, float]]
+            Time to live in seconds of the responses, by endpoint
+            (``"Service/func"``) or by service (``"Service"``).
+            Defaults to :data:`~codingame.http.cache.DEFAULT_TTLS`.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 100 * 1024 * 1024,
+        ttls: typing.Optional[typing.Mapping[str, float]] = None,
+    ):
+        super().__init__(ttls)
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires REAL NOT NULL, accessed REAL NOT NULL, "
+                "size INTEGER NOT NULL)"
+            )
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} path={0.path!r} "
+            "max_size={0.max_size!r} hits={0.hits!r} "
+            "misses={0.misses!r}>".format(self)
+        )
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def get(self, key: str, default=None) -> typing.Any:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE key = ?", (key,)
+                    )
+                self.misses += 1
+                return default
+
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, value: typing.Any, ttl: float):
+        data = zlib.compress(
+            json.dumps(value, separators=(",", ":")).encode("utf-8")
+        )
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, data, now + ttl, now, len(data)),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if size <= self.max_size:
+            return
+
+        self._connection.execute(
+            "DELETE FROM responses WHERE expires <= ?", (now,)
+        )
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed DESC"
+        ).fetchall()
+        kept_size = 0
+        evicted = []
+        for key, entry_size in rows:
+            kept_size += entry_size
+            if kept_size > self.max_size:
+                evicted.append((key,))
+        self._connection.executemany(
+            "DELETE FROM responses WHERE key = ?", evicted
+        )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
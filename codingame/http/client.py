@@ -9,12 +9,31 @@ __all__ = ("HTTPClient",)
 
 
 class HTTPClient(BaseHTTPClient):
-    def __new__(cls, state: "ConnectionState", is_async: bool = False):
+    def __new__(
+        cls,
+        state: "ConnectionState",
+        is_async: bool = False,
+        http2: bool = False,
+        **options,
+    ):
+        if http2:
+            try:
+                from .http2 import AsyncHTTP2Client, SyncHTTP2Client
+            except ImportError as error:
+                raise ImportError(
+                    "httpx is needed for HTTP/2, install it with "
+                    "pip install codingame[http2]"
+                ) from error
+
+            if is_async:
+                return AsyncHTTP2Client(state, **options)
+            return SyncHTTP2Client(state, **options)
+
         if is_async:
             from .async_ import AsyncHTTPClient
 
-            return AsyncHTTPClient(state)
+            return AsyncHTTPClient(state, **options)
         else:
             from .sync import SyncHTTPClient
 
-            return SyncHTTPClient(state)
+            return SyncHTTPClient(state, **options)
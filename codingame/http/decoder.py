@@ -0,0 +1,34 @@
+import json
+import typing
+
+__all__ = (
+    "JSONLoads",
+    "get_json_loads",
+)
+
+JSONLoads = typing.Callable[[bytes], typing.Any]
+
+
+def get_json_loads() -> JSONLoads:
+    """Get the fastest available function to decode JSON from the raw bytes of
+    a response: :func:`orjson.loads` if ``orjson`` is installed, else
+    :func:`ujson.loads` if ``ujson`` is installed, else :func:`json.loads`.
+
+    .. versionadded:: 1.5
+    """
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return orjson.loads
+
+    try:
+        import ujson
+    except ImportError:
+        pass
+    else:
+        return ujson.loads
+
+    return json.loads
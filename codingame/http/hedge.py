@@ -0,0 +1,151 @@
+import math
+import threading
+import typing
+from collections import deque
+
+__all__ = ("HedgePolicy",)
+
+
+class HedgePolicy:
+    """Policy of the hedged requests of the asynchronous client.
+
+    When the response to a request to a read-only endpoint hasn't arrived after
+    a delay, the same request is sent again and the first response is used, so
+    that an occasional slow response doesn't slow down the whole operation.
+
+    The extra load is capped by a budget: every request adds ``max_ratio``
+    tokens to the budget, up to ``burst`` tokens, and every hedged request uses
+    a token.
+
+    Parameters
+    ----------
+        delay : float
+            Number of seconds to wait for a response before sending the hedged
+            request. Defaults to ``0.5``.
+        percentile : Optional[float]
+            Percentile of the latencies of the endpoint, between ``0`` and
+            ``100``, used as the delay instead of ``delay`` once ``min_samples``
+            responses were received, for example ``95``. Defaults to ``None``.
+        max_hedges : int
+            Maximum number of hedged requests sent for a single request.
+            Defaults to ``1``.
+        max_ratio : float
+            Maximum ratio of hedged requests to requests. Defaults to ``0.1``.
+        burst : float
+            Maximum number of hedged requests sent in a row. Defaults to ``10``.
+        endpoints : Optional[Iterable[str]]
+            Endpoints (``"Service/func"``) whose requests can be hedged. They
+            must be idempotent. Defaults to the read-only endpoints.
+        window : int
+            Number of latencies of each endpoint kept to compute the
+            percentile. Defaults to ``100``.
+        min_samples : int
+            Number of latencies needed to use the percentile.
+            Defaults to ``20``.
+
+    .. versionadded:: 1.5
+    """
+
+    sent: int
+    """Number of hedged requests sent."""
+    won: int
+    """Number of hedged requests that finished before the original request."""
+
+    def __init__(
+        self,
+        delay: float = 0.5,
+        percentile: typing.Optional[float] = None,
+        max_hedges: int = 1,
+        max_ratio: float = 0.1,
+        burst: float = 10,
+        endpoints: typing.Optional[typing.Iterable[str]] = None,
+        window: int = 100,
+        min_samples: int = 20,
+    ):
+        if delay < 0:
+            raise ValueError("delay argument must be positive or 0.")
+        if percentile is not None and not 0 < percentile <= 100:
+            raise ValueError("percentile argument must be between 0 and 100.")
+        if max_hedges < 1:
+            raise ValueError("max_hedges argument must be at least 1.")
+        if max_ratio <= 0:
+            raise ValueError("max_ratio argument must be positive.")
+        if burst < 1:
+            raise ValueError("burst argument must be at least 1.")
+
+        self.delay = delay
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self.endpoints: typing.Optional[typing.FrozenSet[str]] = (
+            frozenset(endpoints) if endpoints is not None else None
+        )
+        self.window = window
+        self.min_samples = min_samples
+        self.sent = 0
+        self.won = 0
+
+        self._tokens: float = burst
+        self._latencies: typing.Dict[str, typing.Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} delay={0.delay!r} "
+            "percentile={0.percentile!r} max_ratio={0.max_ratio!r} "
+            "sent={0.sent!r} won={0.won!r}>".format(self)
+        )
+
+    def can_hedge(self, endpoint: str, read_only: bool) -> bool:
+        """Whether the requests to an endpoint can be hedged."""
+
+        if self.endpoints is not None:
+            return endpoint in self.endpoints
+        return read_only
+
+    def get_delay(self, endpoint: str) -> float:
+        """Get the number of seconds to wait before hedging a request to an
+        endpoint."""
+
+        if self.percentile is None:
+            return self.delay
+
+        with self._lock:
+            latencies = sorted(self._latencies.get(endpoint, ()))
+        if len(latencies) < self.min_samples:
+            return self.delay
+        index = math.ceil(self.percentile / 100 * len(latencies)) - 1
+        return latencies[max(0, index)]
+
+    def add_request(self):
+        """Add the budget of a request."""
+
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.max_ratio)
+
+    def acquire(self) -> bool:
+        """Use a token of the budget to send a hedged request. Returns
+        ``False`` if the budget is exhausted."""
+
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.sent += 1
+            return True
+
+    def add_latency(self, endpoint: str, latency: float, hedged: bool):
+        """Record the latency of the request that answered first."""
+
+        with self._lock:
+            if hedged:
+                self.won += 1
+            if self.percentile is None:
+                return
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(
+                    maxlen=self.window
+                )
+            latencies.append(latency)
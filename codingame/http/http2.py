@@ -0,0 +1,215 @@
+import asyncio
+import threading
+import typing
+
+import httpx
+
+from .base import BaseAsyncHTTPClient, BaseSyncHTTPClient
+from .httperror import HTTPError
+from .stream import CHUNK_SIZE
+from .timeout import Timeout
+
+if typing.TYPE_CHECKING:
+    from ..state import ConnectionState
+
+__all__ = (
+    "SyncHTTP2Client",
+    "AsyncHTTP2Client",
+)
+
+
+def create_limits(
+    max_connections: typing.Optional[int],
+    max_keepalive_connections: typing.Optional[int],
+    keepalive_expiry: typing.Optional[float],
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def create_timeout(timeout: Timeout) -> httpx.Timeout:
+    # httpx has no total timeout
+    return httpx.Timeout(
+        None,
+        connect=timeout.connect_or_total,
+        read=timeout.read_or_total,
+        write=timeout.total,
+        pool=timeout.connect_or_total,
+    )
+
+
+def set_cookie(
+    cookies: httpx.Cookies,
+    name: str,
+    value: typing.Optional[str] = None,
+    domain: str = "www.codingame.com",
+):
+    if value is not None:
+        cookies.set(name, value, domain=domain)
+    else:  # pragma: no cover
+        cookies.delete(name, domain=domain)
+
+
+class SyncHTTP2Client(BaseSyncHTTPClient):
+    """Synchronous HTTP client multiplexing the requests over HTTP/2
+    connections with ``httpx``."""
+
+    _retry_errors = (HTTPError, httpx.TransportError)
+
+    def __init__(
+        self,
+        state: "ConnectionState",
+        *,
+        max_connections: typing.Optional[int] = 10,
+        max_keepalive_connections: typing.Optional[int] = 10,
+        keepalive_expiry: typing.Optional[float] = 15.0,
+        **options,
+    ):
+        super().__init__(state, **options)
+        self.__limits = create_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        )
+        self.__session: typing.Optional[httpx.Client] = None
+        self.__lock = threading.Lock()
+
+    def _get_session(self) -> httpx.Client:
+        with self.__lock:
+            if self.__session is None:
+                self.__session = httpx.Client(
+                    http2=True, headers=self.headers, limits=self.__limits
+                )
+                for (name, domain), value in self._cookies.items():
+                    set_cookie(self.__session.cookies, name, value, domain)
+            return self.__session
+
+    def _close(self):
+        if self.__session is not None:
+            self.__session.close()
+
+    def _request(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ):
+        response = self._get_session().post(
+            self.API_URL + service + "/" + func,
+            json=parameters,
+            timeout=create_timeout(timeout),
+        )
+        data = self._decode(response.content, response.is_success)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            raise HTTPError.from_httpx(error, data) from None
+        return data
+
+    def _stream(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.Iterator[bytes]:
+        with self._get_session().stream(
+            "POST",
+            self.API_URL + service + "/" + func,
+            json=parameters,
+            timeout=create_timeout(timeout),
+        ) as response:
+            if not response.is_success:
+                data = self._decode(response.read(), False)
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as error:
+                    raise HTTPError.from_httpx(error, data) from None
+            yield from response.iter_bytes(CHUNK_SIZE)
+
+    def _set_cookie(
+        self,
+        name: str,
+        value: typing.Optional[str] = None,
+        domain: str = "www.codingame.com",
+    ):
+        if self.__session is not None:  # else set when it's created
+            set_cookie(self.__session.cookies, name, value, domain)
+
+
+class AsyncHTTP2Client(BaseAsyncHTTPClient):
+    """Asynchronous HTTP client multiplexing the requests over HTTP/2
+    connections with ``httpx``."""
+
+    _retry_errors = (
+        HTTPError,
+        httpx.TransportError,
+        asyncio.TimeoutError,  # total timeout of asyncio.wait_for
+    )
+
+    def __init__(
+        self,
+        state: "ConnectionState",
+        *,
+        max_connections: typing.Optional[int] = 10,
+        max_keepalive_connections: typing.Optional[int] = 10,
+        keepalive_expiry: typing.Optional[float] = 15.0,
+        **options,
+    ):
+        super().__init__(state, **options)
+        self.__limits = create_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        )
+        self.__session: typing.Optional[httpx.AsyncClient] = None
+
+    def _get_session(self) -> httpx.AsyncClient:
+        if self.__session is None:
+            self.__session = httpx.AsyncClient(
+                http2=True, headers=self.headers, limits=self.__limits
+            )
+            for (name, domain), value in self._cookies.items():
+                set_cookie(self.__session.cookies, name, value, domain)
+        return self.__session
+
+    async def _close(self):
+        if self.__session is not None:
+            await self.__session.aclose()
+
+    async def _request(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ):
+        response = await asyncio.wait_for(
+            self._get_session().post(
+                self.API_URL + service + "/" + func,
+                json=parameters,
+                timeout=create_timeout(timeout),
+            ),
+            timeout.total,
+        )
+        data = self._decode(response.content, response.is_success)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            raise HTTPError.from_httpx(error, data) from None
+        return data
+
+    async def _stream(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.AsyncIterator[bytes]:
+        async with self._get_session().stream(
+            "POST",
+            self.API_URL + service + "/" + func,
+            json=parameters,
+            timeout=create_timeout(timeout),
+        ) as response:
+            if not response.is_success:
+                data = self._decode(await response.aread(), False)
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as error:
+                    raise HTTPError.from_httpx(error, data) from None
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                yield chunk
+
+    def _set_cookie(
+        self,
+        name: str,
+        value: typing.Optional[str] = None,
+        domain: str = "www.codingame.com",
+    ):
+        if self.__session is not None:  # else set when it's created
+            set_cookie(self.__session.cookies, name, value, domain)
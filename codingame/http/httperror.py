@@ -3,6 +3,7 @@ from http import HTTPStatus
 
 if typing.TYPE_CHECKING:
     import aiohttp
+    import httpx
     import requests
 
 
@@ -10,10 +11,17 @@ __all__ = ("HTTPError",)
 
 
 class HTTPError(Exception):
-    def __init__(self, status_code: int, reason: str, data):
+    def __init__(
+        self,
+        status_code: int,
+        reason: str,
+        data,
+        headers: typing.Optional[typing.Mapping[str, str]] = None,
+    ):
         self.status_code: int = status_code
         self.reason: str = reason or HTTPStatus(status_code).phrase
         self.data = data
+        self.headers: typing.Mapping[str, str] = headers or {}
 
     def __str__(self):
         return f"HTTPError: {self.status_code} {self.reason}, {self.data!r}"
@@ -27,7 +35,8 @@ class HTTPError(Exception):
     ) -> "HTTPError":
         status_code = http_error.response.status_code
         reason = http_error.response.reason
-        return cls(status_code, reason, data)
+        headers = http_error.response.headers
+        return cls(status_code, reason, data, headers)
 
     @classmethod
     def from_aiohttp(
@@ -35,4 +44,14 @@ class HTTPError(Exception):
     ) -> "HTTPError":
         status_code = http_error.status
         reason = http_error.message
-        return cls(status_code, reason, data)
+        headers = http_error.headers
+        return cls(status_code, reason, data, headers)
+
+    @classmethod
+    def from_httpx(
+        cls, http_error: "httpx.HTTPStatusError", data
+    ) -> "HTTPError":
+        status_code = http_error.response.status_code
+        reason = http_error.response.reason_phrase
+        headers = http_error.response.headers
+        return cls(status_code, reason, data, headers)
@@ -0,0 +1,430 @@
+import bisect
+import contextlib
+import contextvars
+import threading
+import time
+import typing
+
+from .httperror import HTTPError
+
+__all__ = (
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "EndpointMetrics",
+    "Metrics",
+)
+
+DEFAULT_BUCKETS: typing.Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Default upper bounds in seconds of the buckets of the histograms."""
+
+Endpoint = typing.Tuple[str, str]
+
+# endpoint of the request being sent, to attribute the decoding time
+current_endpoint: "contextvars.ContextVar[typing.Optional[Endpoint]]" = (
+    contextvars.ContextVar("codingame_endpoint", default=None)
+)
+
+
+class Histogram:
+    """Histogram of durations, with cumulative buckets like in Prometheus.
+
+    .. versionadded:: 1.5
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    buckets: typing.Tuple[float, ...]
+    """Upper bounds of the buckets."""
+    counts: typing.List[int]
+    """Number of values in each bucket, not cumulative, plus the number of
+    values bigger than the last bound."""
+    count: int
+    """Number of values."""
+    sum: float
+    """Sum of the values."""
+
+    def __init__(self, buckets: typing.Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} count={0.count!r} "
+            "mean={0.mean!r}>".format(self)
+        )
+
+    @property
+    def mean(self) -> float:
+        """Mean of the values, ``0`` if there are none."""
+        return self.sum / self.count if self.count else 0.0
+
+    def observe(self, value: float):
+        """Add a value to the histogram."""
+
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> typing.List[typing.Tuple[str, int]]:
+        """Get the cumulative count of values of each bucket, with the ``le``
+        label of the bucket."""
+
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(
+                ("+Inf" if bound == float("inf") else repr(bound), total)
+            )
+        return result
+
+
+class EndpointMetrics:
+    """Metrics of the requests to an endpoint of the API.
+
+    .. versionadded:: 1.5
+    """
+
+    __slots__ = (
+        "service",
+        "func",
+        "requests",
+        "errors",
+        "bytes_received",
+        "latency",
+        "decode_time",
+        "model_time",
+    )
+
+    service: str
+    """The CodinGame API service."""
+    func: str
+    """The function of the service."""
+    requests: int
+    """Number of requests sent, retries included."""
+    errors: typing.Dict[str, int]
+    """Number of failed requests, by HTTP status code or by name of the
+    exception for connection errors and timeouts."""
+    bytes_received: int
+    """Number of bytes of the bodies of the responses."""
+    latency: Histogram
+    """Durations of the requests, decoding included."""
+    decode_time: Histogram
+    """Durations of the decoding of the responses."""
+    model_time: Histogram
+    """Durations of the creation of the models from the responses."""
+
+    def __init__(
+        self,
+        service: str,
+        func: str,
+        buckets: typing.Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.service = service
+        self.func = func
+        self.requests = 0
+        self.errors = {}
+        self.bytes_received = 0
+        self.latency = Histogram(buckets)
+        self.decode_time = Histogram(buckets)
+        self.model_time = Histogram(buckets)
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} service={0.service!r} func={0.func!r} "
+            "requests={0.requests!r} errors={1!r}>".format(
+                self, sum(self.errors.values())
+            )
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Counters and latency histograms of the requests to each endpoint of the
+    API, readable in the program and exportable in the Prometheus or
+    OpenMetrics text format.
+
+    It can be shared between clients, threads and coroutines.
+
+    Parameters
+    ----------
+        buckets : Tuple[float, ...]
+            Upper bounds in seconds of the buckets of the histograms.
+            Defaults to :data:`~codingame.http.metrics.DEFAULT_BUCKETS`.
+        prefix : str
+            Prefix of the names of the exported metrics.
+            Defaults to ``"codingame"``.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(
+        self,
+        buckets: typing.Iterable[float] = DEFAULT_BUCKETS,
+        prefix: str = "codingame",
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._endpoints: typing.Dict[Endpoint, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<{0.__class__.__name__} endpoints={1!r}>".format(
+            self, len(self._endpoints)
+        )
+
+    @property
+    def endpoints(self) -> typing.List[EndpointMetrics]:
+        """Metrics of the endpoints that received requests."""
+
+        with self._lock:
+            return list(self._endpoints.values())
+
+    def get(self, service: str, func: str) -> EndpointMetrics:
+        """Get the metrics of an endpoint.
+
+        Parameters
+        ----------
+            service : str
+                The CodinGame API service.
+            func : str
+                The function of the service.
+
+        Returns
+        -------
+            :class:`EndpointMetrics`
+                The metrics of the endpoint, empty if it didn't receive
+                requests.
+        """
+
+        with self._lock:
+            return self._get(service, func)
+
+    def reset(self):
+        """Remove all the metrics."""
+
+        with self._lock:
+            self._endpoints.clear()
+
+    def _get(self, service: str, func: str) -> EndpointMetrics:
+        endpoint = self._endpoints.get((service, func))
+        if endpoint is None:
+            endpoint = self._endpoints[(service, func)] = EndpointMetrics(
+                service, func, self.buckets
+            )
+        return endpoint
+
+    def record_request(
+        self,
+        service: str,
+        func: str,
+        latency: float,
+        error: typing.Optional[BaseException] = None,
+    ):
+        """Record a request sent to an endpoint."""
+
+        with self._lock:
+            endpoint = self._get(service, func)
+            endpoint.requests += 1
+            endpoint.latency.observe(latency)
+            if error is not None:
+                label = (
+                    str(error.status_code)
+                    if isinstance(error, HTTPError)
+                    else error.__class__.__name__
+                )
+                endpoint.errors[label] = endpoint.errors.get(label, 0) + 1
+
+    def record_decode(
+        self, service: str, func: str, size: int, duration: float
+    ):
+        """Record the decoding of a response of an endpoint."""
+
+        with self._lock:
+            endpoint = self._get(service, func)
+            endpoint.bytes_received += size
+            endpoint.decode_time.observe(duration)
+
+    @contextlib.contextmanager
+    def measure_request(self, service: str, func: str) -> typing.Iterator[None]:
+        """Context manager recording a request sent to an endpoint, and the
+        decoding of its response."""
+
+        token = current_endpoint.set((service, func))
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as error:
+            self.record_request(
+                service, func, time.perf_counter() - start, error
+            )
+            raise
+        else:
+            self.record_request(service, func, time.perf_counter() - start)
+        finally:
+            current_endpoint.reset(token)
+
+    @contextlib.contextmanager
+    def measure_stream(
+        self, service: str, func: str
+    ) -> typing.Iterator[typing.Callable[[int, float, float], None]]:
+        """Context manager recording a streamed request sent to an endpoint,
+        and the incremental decoding of its response.
+
+        It gives a function to call with the size of each chunk of the
+        response and the durations of its read and of its decoding, so that
+        the time spent by the caller between the chunks isn't recorded."""
+
+        size = 0
+        read_time = decode_time = 0.0
+
+        def record_chunk(chunk_size: int, read: float, decode: float):
+            nonlocal size, read_time, decode_time
+            size += chunk_size
+            read_time += read
+            decode_time += decode
+
+        try:
+            yield record_chunk
+        except GeneratorExit:  # the caller stopped reading the response
+            self.record_request(service, func, read_time)
+            raise
+        except BaseException as error:
+            self.record_request(service, func, read_time, error)
+            raise
+        else:
+            self.record_request(service, func, read_time)
+        finally:
+            self.record_decode(service, func, size, decode_time)
+
+    @contextlib.contextmanager
+    def measure_model(self, service: str, func: str) -> typing.Iterator[None]:
+        """Context manager recording the duration of the creation of models
+        from a response of an endpoint."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self._get(service, func).model_time.observe(duration)
+
+    def export(self, openmetrics: bool = True) -> str:
+        """Export the metrics in the text format of Prometheus.
+
+        Parameters
+        ----------
+            openmetrics : bool
+                Whether to use the OpenMetrics text format, otherwise the
+                Prometheus text format version ``0.0.4`` is used.
+                Defaults to ``True``.
+
+        Returns
+        -------
+            :class:`str`
+                The exported metrics.
+        """
+
+        with self._lock:
+            endpoints = sorted(
+                self._endpoints.values(),
+                key=lambda endpoint: (endpoint.service, endpoint.func),
+            )
+            lines: typing.List[str] = []
+            self._export_counters(lines, endpoints, openmetrics)
+            for name, attribute, help in (
+                ("request_duration_seconds", "latency", "requests"),
+                ("decode_duration_seconds", "decode_time", "decoding"),
+                ("model_duration_seconds", "model_time", "model creation"),
+            ):
+                self._export_histogram(
+                    lines, endpoints, name, attribute, f"Duration of the {help}"
+                )
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _export_counters(
+        self,
+        lines: typing.List[str],
+        endpoints: typing.List[EndpointMetrics],
+        openmetrics: bool,
+    ):
+        for name, help in (
+            ("requests", "Number of requests"),
+            ("request_errors", "Number of failed requests"),
+            ("response_bytes", "Number of bytes received"),
+        ):
+            family = f"{self.prefix}_{name}"
+            lines.append(
+                f"# TYPE {family if openmetrics else family + '_total'} "
+                "counter"
+            )
+            lines.append(
+                f"# HELP {family if openmetrics else family + '_total'} {help}"
+            )
+            for endpoint in endpoints:
+                labels = (
+                    f'service="{_escape(endpoint.service)}",'
+                    f'func="{_escape(endpoint.func)}"'
+                )
+                if name == "requests":
+                    lines.append(
+                        f"{family}_total{{{labels}}} {endpoint.requests}"
+                    )
+                elif name == "response_bytes":
+                    lines.append(
+                        f"{family}_total{{{labels}}} {endpoint.bytes_received}"
+                    )
+                else:
+                    for error, count in sorted(endpoint.errors.items()):
+                        lines.append(
+                            f"{family}_total{{{labels},"
+                            f'error="{_escape(error)}"}} {count}'
+                        )
+
+    def _export_histogram(
+        self,
+        lines: typing.List[str],
+        endpoints: typing.List[EndpointMetrics],
+        name: str,
+        attribute: str,
+        help: str,
+    ):
+        family = f"{self.prefix}_{name}"
+        lines.append(f"# TYPE {family} histogram")
+        lines.append(f"# HELP {family} {help}")
+        for endpoint in endpoints:
+            histogram: Histogram = getattr(endpoint, attribute)
+            if not histogram.count:
+                continue
+            labels = (
+                f'service="{_escape(endpoint.service)}",'
+                f'func="{_escape(endpoint.func)}"'
+            )
+            for bound, count in histogram.cumulative():
+                lines.append(
+                    f'{family}_bucket{{{labels},le="{bound}"}} {count}'
+                )
+            lines.append(f"{family}_sum{{{labels}}} {histogram.sum!r}")
+            lines.append(f"{family}_count{{{labels}}} {histogram.count}")
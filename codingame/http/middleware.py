@@ -0,0 +1,75 @@
+import inspect
+import time
+import typing
+
+__all__ = (
+    "Request",
+    "Middleware",
+    "is_async_middleware",
+)
+
+
+class Request:
+    """Request to the API going through the middlewares of the HTTP client.
+
+    The middlewares can change the service, the function and the parameters
+    before calling the next middleware, and store their own data in
+    :attr:`extensions`.
+
+    .. versionadded:: 1.5
+
+    Attributes
+    -----------
+        service : str
+            The CodinGame API service, like ``"CodinGamer"``.
+        func : str
+            The function of the service, like ``"findFollowers"``.
+        parameters : list
+            The parameters of the function.
+        start : float
+            Value of :func:`time.perf_counter` when the request started.
+        extensions : dict
+            Data of the middlewares about the request.
+    """
+
+    __slots__ = ("service", "func", "parameters", "start", "extensions")
+
+    def __init__(self, service: str, func: str, parameters: list):
+        self.service = service
+        self.func = func
+        self.parameters = parameters
+        self.start = time.perf_counter()
+        self.extensions: typing.Dict[str, typing.Any] = {}
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} service={0.service!r} func={0.func!r} "
+            "parameters={0.parameters!r}>".format(self)
+        )
+
+    @property
+    def endpoint(self) -> str:
+        """The endpoint of the request, ``"Service/func"``."""
+        return self.service + "/" + self.func
+
+    @property
+    def elapsed(self) -> float:
+        """Number of seconds since the request started."""
+        return time.perf_counter() - self.start
+
+
+Middleware = typing.Callable[
+    [Request, typing.Callable[[Request], typing.Any]], typing.Any
+]
+"""A middleware is called with the request and the function calling the next
+middleware, and returns the response. Middlewares of asynchronous clients are
+coroutine functions."""
+
+
+def is_async_middleware(middleware: Middleware) -> bool:
+    """Whether a middleware is a coroutine function or a callable object with
+    a coroutine ``__call__`` method."""
+
+    return inspect.iscoroutinefunction(middleware) or (
+        inspect.iscoroutinefunction(getattr(middleware, "__call__", None))
+    )
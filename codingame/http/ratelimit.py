@@ -0,0 +1,145 @@
+import threading
+import time
+import typing
+
+__all__ = (
+    "TokenBucket",
+    "RateLimiter",
+)
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` requests per second on average, with
+    bursts of up to ``capacity`` requests.
+
+    Tokens are reserved in advance: a request that can't get a token right away
+    is given the time to wait until its token is available, so waiting
+    requests are served in order without polling the bucket.
+
+    It can be shared between threads and between coroutines.
+
+    Parameters
+    ----------
+        rate : float
+            Number of tokens added to the bucket every second.
+        capacity : Optional[int]
+            Maximum number of tokens in the bucket, so the maximum size of a
+            burst. Defaults to ``max(1, rate)``.
+
+    .. versionadded:: 1.5
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_last", "_lock")
+
+    def __init__(self, rate: float, capacity: typing.Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate argument must be positive.")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        if self.capacity < 1:
+            raise ValueError("capacity argument must be at least 1.")
+
+        self._tokens: float = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} rate={0.rate!r} "
+            "capacity={0.capacity!r}>".format(self)
+        )
+
+    def reserve(self) -> float:
+        """Reserve a token.
+
+        Returns
+        -------
+            :class:`float`
+                The number of seconds to wait before using the token, ``0`` if
+                it can be used right away.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Client-side rate limiter made of a global :class:`TokenBucket` and of
+    optional per-service buckets.
+
+    A request waits until it has a token from the global bucket and from the
+    bucket of its service.
+
+    Parameters
+    ----------
+        rate : Optional[float]
+            Number of requests per second allowed for all the services.
+            ``None`` to only limit the services given in ``services``.
+        burst : Optional[int]
+            Maximum size of a burst of requests for all the services. Defaults
+            to ``max(1, rate)``.
+        services : Optional[Mapping[str, Union[float, TokenBucket]]]
+            Limit of each service, like ``"Leaderboards"`` or ``"CodinGamer"``,
+            either a number of requests per second or a :class:`TokenBucket`.
+
+    .. versionadded:: 1.5
+    """
+
+    __slots__ = ("bucket", "services")
+
+    def __init__(
+        self,
+        rate: typing.Optional[float] = None,
+        burst: typing.Optional[int] = None,
+        services: typing.Optional[
+            typing.Mapping[str, typing.Union[float, TokenBucket]]
+        ] = None,
+    ):
+        self.bucket: typing.Optional[TokenBucket] = (
+            TokenBucket(rate, burst) if rate is not None else None
+        )
+        self.services: typing.Dict[str, TokenBucket] = {
+            service: (
+                bucket
+                if isinstance(bucket, TokenBucket)
+                else TokenBucket(bucket)
+            )
+            for service, bucket in (services or {}).items()
+        }
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} bucket={0.bucket!r} "
+            "services={0.services!r}>".format(self)
+        )
+
+    def reserve(self, service: str) -> float:
+        """Reserve a token for a request to a service.
+
+        Parameters
+        ----------
+            service : str
+                The CodinGame API service of the request.
+
+        Returns
+        -------
+            :class:`float`
+                The number of seconds to wait before sending the request.
+        """
+
+        delay = 0.0
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+        if service in self.services:
+            delay = max(delay, self.services[service].reserve())
+        return delay
@@ -0,0 +1,136 @@
+import random
+import typing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .httperror import HTTPError
+
+__all__ = ("RetryPolicy",)
+
+
+class RetryPolicy:
+    """Policy deciding if and when a failed request is retried.
+
+    The delay between attempts grows exponentially, with full jitter so that
+    many clients failing at the same time don't retry at the same time.
+
+    Parameters
+    ----------
+        max_attempts : int
+            Maximum number of attempts, including the first one. ``1`` disables
+            retries. Defaults to ``3``.
+        backoff_base : float
+            Delay in seconds before the first retry, doubled at each attempt.
+            Defaults to ``0.5``.
+        backoff_cap : float
+            Maximum delay in seconds between two attempts. Defaults to ``30``.
+        jitter : bool
+            Whether to pick a random delay between ``0`` and the computed
+            delay. Defaults to ``True``.
+        retry_statuses : Iterable[int]
+            HTTP status codes that are retried. Defaults to ``429``, ``500``,
+            ``502``, ``503`` and ``504``.
+        respect_retry_after : bool
+            Whether to wait for the delay given in the ``Retry-After`` header
+            of the response if there's one, up to ``backoff_cap``.
+            Defaults to ``True``.
+
+    .. versionadded:: 1.5
+    """
+
+    DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    __slots__ = (
+        "max_attempts",
+        "backoff_base",
+        "backoff_cap",
+        "jitter",
+        "retry_statuses",
+        "respect_retry_after",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: typing.Iterable[int] = DEFAULT_RETRY_STATUSES,
+        respect_retry_after: bool = True,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts argument must be at least 1.")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} max_attempts={0.max_attempts!r} "
+            "backoff_base={0.backoff_base!r} "
+            "backoff_cap={0.backoff_cap!r}>".format(self)
+        )
+
+    def get_delay(
+        self, attempt: int, error: Exception
+    ) -> typing.Optional[float]:
+        """Get the delay before retrying a failed attempt.
+
+        Parameters
+        ----------
+            attempt : int
+                The number of the attempt that failed, starting at ``1``.
+            error : Exception
+                The error raised by the attempt, either an :exc:`HTTPError` or
+                a connection error of the underlying library.
+
+        Returns
+        -------
+            Optional :class:`float`
+                The number of seconds to wait before retrying, or ``None`` if
+                the request must not be retried.
+        """
+
+        if attempt >= self.max_attempts:
+            return None
+
+        if isinstance(error, HTTPError):
+            if error.status_code not in self.retry_statuses:
+                return None
+
+            if self.respect_retry_after:
+                retry_after = parse_retry_after(
+                    error.headers.get("Retry-After")
+                )
+                if retry_after is not None:
+                    return min(retry_after, self.backoff_cap)
+
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def parse_retry_after(value: typing.Optional[str]) -> typing.Optional[float]:
+    """Parse the value of a ``Retry-After`` header, either a number of seconds
+    or an HTTP date."""
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,94 @@
+import typing
+
+__all__ = (
+    "CHUNK_SIZE",
+    "JSONStreamParser",
+)
+
+CHUNK_SIZE = 64 * 1024
+"""Number of bytes read at a time from the body of a streamed response."""
+
+# events ending the value that started at the same prefix
+_END_EVENTS = ("end_map", "end_array")
+
+
+class JSONStreamParser:
+    """Incremental JSON parser, fed with the chunks of a response and giving
+    the values at some prefixes as soon as they are complete.
+
+    The prefixes are the ones of ``ijson``: the keys of the objects and
+    ``item`` for the items of the arrays, separated by dots, like
+    ``"users.item"`` for each item of the ``users`` array.
+
+    Parameters
+    ----------
+        prefixes : Collection[str]
+            The prefixes of the values to get.
+
+    Raises
+    ------
+        :exc:`ImportError`
+            ``ijson`` isn't installed.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, prefixes: typing.Collection[str]):
+        try:
+            import ijson
+        except ImportError as error:
+            raise ImportError(
+                "ijson is needed to stream the responses, install it with "
+                "pip install codingame[streaming]"
+            ) from error
+
+        self._ijson = ijson
+        self._prefixes = frozenset(prefixes)
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        self._builder = None
+        self._prefix: typing.Optional[str] = None
+
+    def feed(self, chunk: bytes) -> typing.List[typing.Tuple[str, typing.Any]]:
+        """Parse a chunk of the response and get the ``(prefix, value)``
+        pairs completed by this chunk."""
+
+        if chunk:
+            try:
+                self._parser.send(chunk)
+            except self._ijson.JSONError as error:
+                raise ValueError(str(error)) from error
+        return self._get_values()
+
+    def close(self) -> typing.List[typing.Tuple[str, typing.Any]]:
+        """Finish the parsing and get the last ``(prefix, value)`` pairs.
+
+        Raises
+        ------
+            :exc:`ValueError`
+                The response is incomplete or isn't valid JSON.
+        """
+
+        try:
+            self._parser.close()
+        except self._ijson.JSONError as error:
+            raise ValueError(str(error)) from error
+        return self._get_values()
+
+    def _get_values(self) -> typing.List[typing.Tuple[str, typing.Any]]:
+        values = []
+        for prefix, event, value in self._events:
+            if self._builder is not None:
+                self._builder.event(event, value)
+                if prefix == self._prefix and event in _END_EVENTS:
+                    values.append((prefix, self._builder.value))
+                    self._builder = None
+            elif prefix in self._prefixes:
+                if event in ("start_map", "start_array"):
+                    self._builder = self._ijson.ObjectBuilder()
+                    self._builder.event(event, value)
+                    self._prefix = prefix
+                elif event != "map_key" and event not in _END_EVENTS:
+                    values.append((prefix, value))
+        del self._events[:]
+        return values
@@ -1,9 +1,16 @@
+import threading
 import typing
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import default_headers
 
-from .base import BaseHTTPClient
+from .base import BaseSyncHTTPClient
 from .httperror import HTTPError
+from .stream import CHUNK_SIZE
+from .timeout import Timeout
 
 if typing.TYPE_CHECKING:
     from ..state import ConnectionState
@@ -12,37 +19,104 @@ if typing.TYPE_CHECKING:
 __all__ = ("SyncHTTPClient",)
 
 
-class SyncHTTPClient(BaseHTTPClient):
-    def __init__(self, state: "ConnectionState"):
-        self.state = state
-        self.__session: requests.Session = requests.Session()
+class SyncHTTPClient(BaseSyncHTTPClient):
+    """Synchronous HTTP client using ``requests``.
+
+    It can be used by many threads at the same time: every thread has its own
+    session, and the sessions share the same connection pool, cookies and
+    headers. The connection pool is created on the first request."""
+
+    _retry_errors = (HTTPError, requests.ConnectionError, requests.Timeout)
+
+    def __init__(
+        self,
+        state: "ConnectionState",
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        **options,
+    ):
+        super().__init__(state, **options)
+
+        # one adapter for every URL so that all the threads share the same pool
+        self.__adapter: typing.Optional[HTTPAdapter] = None
+        self.__adapter_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+        }
+        self.__lock = threading.Lock()
+        self.__cookies = RequestsCookieJar()  # cookie jars have their own lock
+        self.__session_headers: CaseInsensitiveDict = default_headers()
+        if not keep_alive:
+            self.__session_headers["Connection"] = "close"
+        self.__local = threading.local()
 
     @property
-    def is_async(self) -> bool:
-        return False
+    def session(self) -> requests.Session:
+        """The session of the current thread."""
+
+        session: typing.Optional[requests.Session] = getattr(
+            self.__local, "session", None
+        )
+        if session is None:
+            with self.__lock:
+                if self.__adapter is None:
+                    self.__adapter = HTTPAdapter(**self.__adapter_options)
+            session = self.__local.session = requests.Session()
+            session.mount("https://", self.__adapter)
+            session.mount("http://", self.__adapter)
+            session.cookies = self.__cookies
+            session.headers = self.__session_headers
+        return session
 
-    def close(self):
-        self.__session.close()
+    def _close(self):
+        # the sessions only hold the shared adapter and cookies
+        if self.__adapter is not None:
+            self.__adapter.close()
 
-    def request(
-        self, service: str, func: str, parameters: typing.Optional[list] = None
+    def _request(
+        self, service: str, func: str, parameters: list, timeout: Timeout
     ):
-        parameters = parameters or []
         url = self.API_URL + service + "/" + func
-        with self.__session.post(
-            url, json=parameters, headers=self.headers
+        with self.session.post(
+            url,
+            json=parameters,
+            headers=self.headers,
+            timeout=(timeout.connect_or_total, timeout.read_or_total),
         ) as response:
-            data = response.json()
+            data = self._decode(response.content, response.ok)
             try:
                 response.raise_for_status()
             except requests.HTTPError as error:
                 raise HTTPError.from_requests(error, data) from None
             return data
 
-    def set_cookie(
+    def _stream(
+        self, service: str, func: str, parameters: list, timeout: Timeout
+    ) -> typing.Iterator[bytes]:
+        url = self.API_URL + service + "/" + func
+        with self.session.post(
+            url,
+            json=parameters,
+            headers=self.headers,
+            timeout=(timeout.connect_or_total, timeout.read_or_total),
+            stream=True,
+        ) as response:
+            if not response.ok:
+                data = self._decode(response.content, False)
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError as error:
+                    raise HTTPError.from_requests(error, data) from None
+            yield from response.iter_content(CHUNK_SIZE)
+
+    def _set_cookie(
         self,
         name: str,
         value: typing.Optional[str] = None,
         domain: str = "www.codingame.com",
     ):
-        return self.__session.cookies.set(name, value, domain=domain)
+        return self.__cookies.set(name, value, domain=domain)
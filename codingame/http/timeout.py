@@ -0,0 +1,186 @@
+import contextlib
+import contextvars
+import time
+import typing
+
+__all__ = (
+    "Timeout",
+    "DeadlineExceeded",
+    "deadline",
+    "get_remaining",
+    "get_deadline",
+)
+
+_deadline: "contextvars.ContextVar[typing.Optional[float]]" = (
+    contextvars.ContextVar("codingame_deadline", default=None)
+)
+
+
+def _min(*values: typing.Optional[float]) -> typing.Optional[float]:
+    values = [value for value in values if value is not None]
+    return min(values) if values else None
+
+
+class Timeout:
+    """Timeouts of a request to the API.
+
+    .. note::
+        The synchronous HTTP clients can't stop a request after a total
+        duration, the total timeout is then applied to the connection and to
+        each read of the response.
+
+    Parameters
+    ----------
+        total : Optional[float]
+            Maximum number of seconds for the whole request, ``None`` for no
+            limit.
+        connect : Optional[float]
+            Maximum number of seconds to connect to the server, ``None`` for no
+            limit.
+        read : Optional[float]
+            Maximum number of seconds to wait for data from the server, ``None``
+            for no limit.
+
+    .. versionadded:: 1.5
+    """
+
+    __slots__ = ("total", "connect", "read")
+
+    def __init__(
+        self,
+        total: typing.Optional[float] = None,
+        connect: typing.Optional[float] = None,
+        read: typing.Optional[float] = None,
+    ):
+        for name, value in (
+            ("total", total),
+            ("connect", connect),
+            ("read", read),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} argument must be positive.")
+
+        self.total = total
+        self.connect = connect
+        self.read = read
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} total={0.total!r} connect={0.connect!r} "
+            "read={0.read!r}>".format(self)
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Timeout):
+            return NotImplemented
+        return (self.total, self.connect, self.read) == (
+            other.total,
+            other.connect,
+            other.read,
+        )
+
+    @classmethod
+    def from_value(
+        cls, value: typing.Union["Timeout", float, None]
+    ) -> "Timeout":
+        """Make a timeout from a :class:`Timeout`, a total number of seconds or
+        ``None`` for no limit."""
+
+        if isinstance(value, Timeout):
+            return value
+        return cls(total=value)
+
+    def limit(self, remaining: typing.Optional[float]) -> "Timeout":
+        """Get this timeout limited to ``remaining`` seconds."""
+
+        if remaining is None:
+            return self
+        return Timeout(
+            _min(self.total, remaining),
+            _min(self.connect, remaining),
+            _min(self.read, remaining),
+        )
+
+    @property
+    def connect_or_total(self) -> typing.Optional[float]:
+        """Connection timeout, limited by the total timeout."""
+        return _min(self.connect, self.total)
+
+    @property
+    def read_or_total(self) -> typing.Optional[float]:
+        """Read timeout, limited by the total timeout."""
+        return _min(self.read, self.total)
+
+
+DEFAULT_TIMEOUT = Timeout(total=30.0, connect=10.0)
+"""Default timeout of the requests to the API."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request can't be sent or completed before the deadline
+    set with :func:`~codingame.http.deadline`.
+
+    .. versionadded:: 1.5
+    """
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> typing.Iterator[None]:
+    """Context manager limiting the duration of all the requests sent in it,
+    for example to bound the duration of a method of the client that sends
+    several requests.
+
+    The deadline applies to the current thread or task and to the tasks
+    started in it. Nested deadlines can only shorten the outer deadline.
+    When the deadline is reached, the requests raise :exc:`DeadlineExceeded`.
+
+    Parameters
+    ----------
+        seconds : float
+            Number of seconds from now until the deadline.
+
+    Example
+    -------
+        .. code:: python
+
+            with codingame.http.deadline(2):
+                codingamer = client.get_codingamer("takos")
+
+    .. versionadded:: 1.5
+    """
+
+    if seconds <= 0:
+        raise ValueError("seconds argument must be positive.")
+
+    token = _deadline.set(_min(_deadline.get(), time.monotonic() + seconds))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_deadline() -> typing.Optional[float]:
+    """Get the current deadline as a :func:`time.monotonic` time, or ``None``
+    if there's no deadline."""
+
+    return _deadline.get()
+
+
+def get_remaining() -> typing.Optional[float]:
+    """Get the number of seconds until the current deadline, or ``None`` if
+    there's no deadline.
+
+    Raises
+    ------
+        :exc:`DeadlineExceeded`
+            The deadline is already reached.
+    """
+
+    current = _deadline.get()
+    if current is None:
+        return None
+
+    remaining = current - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("The deadline of the request is exceeded.")
+    return remaining
@@ -0,0 +1,133 @@
+import contextlib
+import functools
+import inspect
+import typing
+
+from .httperror import HTTPError
+
+if typing.TYPE_CHECKING:
+    from opentelemetry.trace import Tracer, TracerProvider
+
+__all__ = (
+    "get_tracer",
+    "request_span",
+    "stream_span",
+    "trace_method",
+)
+
+
+def get_tracer(
+    tracer_provider: typing.Optional["TracerProvider"] = None,
+) -> typing.Optional["Tracer"]:
+    """Get the OpenTelemetry tracer of the library, or ``None`` if
+    ``opentelemetry-api`` isn't installed."""
+
+    # imported here so that it's only imported by the clients that trace
+    try:
+        from opentelemetry import trace
+    except ImportError:  # pragma: no cover
+        return None
+
+    from .. import __version__
+
+    return trace.get_tracer(
+        "codingame", __version__, tracer_provider=tracer_provider
+    )
+
+
+def _request_attributes(service: str, func: str, url: str) -> dict:
+    return {
+        "http.request.method": "POST",
+        "url.full": url,
+        "codingame.service": service,
+        "codingame.func": func,
+    }
+
+
+@contextlib.contextmanager
+def _record_error(span) -> typing.Iterator[None]:
+    try:
+        yield
+    except HTTPError as error:
+        span.set_attribute("http.response.status_code", error.status_code)
+        span.set_attribute("error.type", str(error.status_code))
+        raise
+    except Exception as error:
+        span.set_attribute("error.type", error.__class__.__name__)
+        raise
+
+
+@contextlib.contextmanager
+def request_span(
+    tracer: "Tracer", service: str, func: str, url: str
+) -> typing.Iterator[None]:
+    """Context manager tracing an HTTP request to the API in a span."""
+
+    from opentelemetry.trace import SpanKind
+
+    with tracer.start_as_current_span(
+        "POST " + service + "/" + func,
+        kind=SpanKind.CLIENT,
+        attributes=_request_attributes(service, func, url),
+    ) as span, _record_error(span):
+        yield
+
+
+@contextlib.contextmanager
+def stream_span(
+    tracer: "Tracer", service: str, func: str, url: str
+) -> typing.Iterator[typing.Callable[[], typing.ContextManager]]:
+    """Context manager tracing a streamed HTTP request to the API in a span.
+
+    The span isn't the current span while the values of the response are
+    yielded, it's only made current by the context managers returned by the
+    given function, around each read of the response."""
+
+    from opentelemetry import trace
+
+    span = tracer.start_span(
+        "POST " + service + "/" + func,
+        kind=trace.SpanKind.CLIENT,
+        attributes=_request_attributes(service, func, url),
+    )
+    try:
+        with _record_error(span):
+            yield functools.partial(trace.use_span, span)
+    finally:
+        span.end()
+
+
+def trace_method(method: typing.Callable, name: str) -> typing.Callable:
+    """Wrap a method of a client so that it's traced in a span, if the
+    tracing is enabled. Generators aren't traced, only the requests they
+    send are."""
+
+    if inspect.isgeneratorfunction(method) or inspect.isasyncgenfunction(
+        method
+    ):
+        return method
+
+    span_name = "Client." + name
+    attributes = {"codingame.method": name}
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def traced(self, *args, **kwargs):
+            tracer = self._state.http.tracer
+            if tracer is None:
+                return await method(self, *args, **kwargs)
+            with tracer.start_as_current_span(span_name, attributes=attributes):
+                return await method(self, *args, **kwargs)
+
+    else:
+
+        @functools.wraps(method)
+        def traced(self, *args, **kwargs):
+            tracer = self._state.http.tracer
+            if tracer is None:
+                return method(self, *args, **kwargs)
+            with tracer.start_as_current_span(span_name, attributes=attributes):
+                return method(self, *args, **kwargs)
+
+    return traced
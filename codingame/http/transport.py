@@ -0,0 +1,303 @@
+import asyncio
+import json
+import os
+import threading
+import time
+import typing
+from abc import ABC, abstractmethod
+
+from .cache import make_key
+from .httperror import HTTPError
+from .timeout import Timeout
+
+if typing.TYPE_CHECKING:
+    from .base import BaseHTTPClient
+
+__all__ = (
+    "BaseTransport",
+    "RecordReplayTransport",
+    "ResponseNotRecorded",
+)
+
+
+class ResponseNotRecorded(LookupError):
+    """Raised by a :class:`RecordReplayTransport` replaying a request that
+    wasn't recorded.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, key: str):
+        super().__init__(f"No recorded response for {key}")
+        self.key = key
+
+
+class BaseTransport(ABC):
+    """Interface of the transports sending a single request to the API.
+
+    A transport replaces the connection of the HTTP client, the cache, the
+    coalescing of requests, the rate limit and the retries are still done by
+    the HTTP client. Synchronous transports are used by synchronous clients and
+    asynchronous transports by asynchronous clients.
+
+    .. versionadded:: 1.5
+    """
+
+    @property
+    @abstractmethod
+    def is_async(self) -> bool:
+        """Whether :meth:`request` and :meth:`close` are coroutines."""
+
+    def attach(self, http: "BaseHTTPClient"):
+        """Called by the HTTP client when it starts using the transport.
+
+        Parameters
+        ----------
+            http : :class:`~codingame.http.base.BaseHTTPClient`
+                The HTTP client using the transport.
+        """
+
+    @abstractmethod
+    def request(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        timeout: typing.Optional[Timeout] = None,
+    ) -> typing.Any:
+        """Send a single request to the API and return the decoded response.
+
+        This is a |coroutine| for asynchronous transports.
+
+        Parameters
+        ----------
+            service : str
+                The CodinGame API service, like ``"CodinGamer"``.
+            func : str
+                The function of the service, like ``"findFollowers"``.
+            parameters : list
+                The parameters of the function.
+            timeout : Optional[:class:`~codingame.http.Timeout`]
+                The timeout of the request, already limited by the current
+                deadline.
+
+        Raises
+        ------
+            :exc:`~codingame.http.HTTPError`
+                The response has an error status code.
+        """
+
+    def set_cookie(
+        self,
+        name: str,
+        value: typing.Optional[str] = None,
+        domain: str = "www.codingame.com",
+    ):
+        """Set a cookie sent with the next requests. Does nothing by
+        default."""
+
+    def close(self):
+        """Close the transport.
+
+        This is a |coroutine| for asynchronous transports.
+        """
+
+
+class RecordReplayTransport(BaseTransport):
+    """Transport recording the responses of the API to a file and replaying
+    them, to run and benchmark the client without network access.
+
+    In ``"record"`` mode, the requests are sent with the connection of the HTTP
+    client, or with ``transport`` if it's given, and their responses, errors
+    included, are saved in the file when the transport is closed or when
+    :meth:`save` is called.
+
+    In ``"replay"`` mode, the responses are read from the file and decoded
+    again like real responses, after waiting for ``latency`` seconds. A request
+    that wasn't recorded raises :exc:`ResponseNotRecorded`.
+
+    Parameters
+    ----------
+        path : str
+            Path of the JSON file of the recorded responses.
+        mode : str
+            Either ``"record"`` or ``"replay"``. Defaults to ``"replay"``.
+        latency : float
+            Number of seconds every replayed request takes. Defaults to ``0``.
+        is_async : bool
+            Whether the transport is used by an asynchronous client.
+            Defaults to ``False``.
+        transport : Optional[:class:`BaseTransport`]
+            Transport sending the recorded requests, instead of the connection
+            of the HTTP client.
+
+    .. versionadded:: 1.5
+    """
+
+    MODES = ("record", "replay")
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        latency: float = 0.0,
+        is_async: bool = False,
+        transport: typing.Optional[BaseTransport] = None,
+    ):
+        if mode not in self.MODES:
+            raise ValueError("mode argument must be 'record' or 'replay'.")
+        if latency < 0:
+            raise ValueError("latency argument must be positive or 0.")
+        if transport is not None and transport.is_async != is_async:
+            raise ValueError("transport must be the same kind of transport.")
+
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.transport = transport
+        self._is_async = is_async
+        self._http: typing.Optional["BaseHTTPClient"] = None
+        self._lock = threading.Lock()
+        self.responses: typing.Dict[str, dict] = {}
+        """Recorded responses by cache key, with their ``status``,
+        ``reason`` and JSON ``body``."""
+
+        if mode == "replay" or os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                self.responses.update(json.load(file)["responses"])
+
+    def __repr__(self):
+        return (
+            "<{0.__class__.__name__} path={0.path!r} mode={0.mode!r} "
+            "responses={1!r}>".format(self, len(self.responses))
+        )
+
+    @property
+    def is_async(self) -> bool:
+        return self._is_async
+
+    def attach(self, http: "BaseHTTPClient"):
+        self._http = http
+        if self.transport is not None:
+            self.transport.attach(http)
+
+    def request(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        timeout: typing.Optional[Timeout] = None,
+    ) -> typing.Any:
+        if self.mode == "replay":
+            if self.is_async:
+                return self._replay_async(service, func, parameters)
+            if self.latency:
+                time.sleep(self.latency)
+            return self._replay(service, func, parameters)
+
+        if self.is_async:
+            return self._record_async(service, func, parameters, timeout)
+        try:
+            data = self._send(service, func, parameters, timeout)
+        except HTTPError as error:
+            self._record(service, func, parameters, error.data, error)
+            raise
+        self._record(service, func, parameters, data)
+        return data
+
+    def set_cookie(
+        self,
+        name: str,
+        value: typing.Optional[str] = None,
+        domain: str = "www.codingame.com",
+    ):
+        if self.transport is not None:
+            self.transport.set_cookie(name, value, domain)
+
+    def close(self):
+        if self.is_async:
+            return self._close_async()
+
+        if self.mode == "record":
+            self.save()
+        if self.transport is not None:
+            self.transport.close()
+
+    def save(self):
+        """Save the recorded responses in the file."""
+
+        with self._lock:
+            data = {"responses": dict(sorted(self.responses.items()))}
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+            file.write("\n")
+
+    def _send(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        timeout: typing.Optional[Timeout],
+    ):
+        if self.transport is not None:
+            return self.transport.request(service, func, parameters, timeout)
+        if self._http is None:
+            raise RuntimeError("The transport isn't used by an HTTP client.")
+        return self._http._request(
+            service, func, parameters, timeout or self._http.timeout
+        )
+
+    async def _close_async(self):
+        if self.mode == "record":
+            self.save()
+        if self.transport is not None:
+            await self.transport.close()
+
+    async def _record_async(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        timeout: typing.Optional[Timeout],
+    ):
+        try:
+            data = await self._send(service, func, parameters, timeout)
+        except HTTPError as error:
+            self._record(service, func, parameters, error.data, error)
+            raise
+        self._record(service, func, parameters, data)
+        return data
+
+    def _record(
+        self,
+        service: str,
+        func: str,
+        parameters: list,
+        data: typing.Any,
+        error: typing.Optional[HTTPError] = None,
+    ):
+        response = {
+            "status": error.status_code if error is not None else 200,
+            "reason": error.reason if error is not None else "OK",
+            "body": json.dumps(data, separators=(",", ":")),
+        }
+        with self._lock:
+            self.responses[make_key(service, func, parameters)] = response
+
+    async def _replay_async(self, service: str, func: str, parameters: list):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._replay(service, func, parameters)
+
+    def _replay(self, service: str, func: str, parameters: list):
+        key = make_key(service, func, parameters)
+        response = self.responses.get(key)
+        if response is None:
+            raise ResponseNotRecorded(key)
+
+        ok = response["status"] < 400
+        body = response["body"].encode("utf-8")
+        data = self._http._decode(body, ok) if self._http else json.loads(body)
+        if not ok:
+            raise HTTPError(response["status"], response["reason"], data)
+        return data
@@ -276,6 +276,26 @@ class League(BaseObject):
         )
 
 
+def _get_league(
+    leaderboard: typing.Union["ChallengeLeaderboard", "PuzzleLeaderboard"],
+    data: dict,
+) -> League:
+    """Get the league of a leaderboard, adding it if it isn't known yet, for
+    example when the users of a streamed leaderboard come before its
+    leagues."""
+
+    index = data["divisionIndex"]
+    for league in leaderboard.leagues:
+        if league.index == index:
+            return league
+
+    league = League(leaderboard._state, data)
+    leaderboard.leagues.append(league)
+    leaderboard.leagues.sort(key=lambda league: league.index)
+    leaderboard._setattr("has_leagues", True)
+    return league
+
+
 class ChallengeRankedCodinGamer(BaseRankedCodinGamer):
     """Ranked CodinGamer in challenge leaderboards."""
 
@@ -323,8 +343,7 @@ class ChallengeRankedCodinGamer(BaseRankedCodinGamer):
         self.global_rank = data.get("globalRank")
         self.league = None
         if "league" in data:
-            self.league = leaderboard.leagues[data["league"]["divisionIndex"]]
-            self.league.users.append(self)
+            self.league = _get_league(leaderboard, data["league"])
 
         super().__init__(state, leaderboard, data)
 
@@ -359,16 +378,21 @@ class ChallengeLeaderboard(BaseLeaderboard):
     def __init__(
         self, state: "ConnectionState", name: str, group: str, data: dict
     ):
-        self.leagues = [
-            League(state, league) for league in data.get("leagues", {}).values()
-        ]
-        self.has_leagues = bool(self.leagues)
+        self._state = state
+        self.leagues = []
+        self.has_leagues = False
+        for league in data.get("leagues", {}).values():
+            _get_league(self, league)
         self.name = name
         self.group = group
         self.programming_languages = data["programmingLanguages"]
 
         super().__init__(state, data)
 
+        for user in self.users:
+            if user.league is not None:
+                user.league.users.append(user)
+
     def __repr__(self):
         return (
             "<{0.__class__.__name__} name={0.name!r} count={0.count!r} "
@@ -423,8 +447,7 @@ class PuzzleRankedCodinGamer(BaseRankedCodinGamer):
         self.global_rank = data.get("globalRank")
         self.league = None
         if "league" in data:
-            self.league = leaderboard.leagues[data["league"]["divisionIndex"]]
-            self.league.users.append(self)
+            self.league = _get_league(leaderboard, data["league"])
 
         super().__init__(state, leaderboard, data)
 
@@ -459,18 +482,71 @@ class PuzzleLeaderboard(BaseLeaderboard):
     def __init__(
         self, state: "ConnectionState", name: str, group: str, data: dict
     ):
-        self.leagues = [
-            League(state, league) for league in data.get("leagues", {}).values()
-        ]
-        self.has_leagues = bool(self.leagues)
+        self._state = state
+        self.leagues = []
+        self.has_leagues = False
+        for league in data.get("leagues", {}).values():
+            _get_league(self, league)
         self.name = name
         self.group = group
         self.programming_languages = data["programmingLanguages"]
 
         super().__init__(state, data)
 
+        for user in self.users:
+            if user.league is not None:
+                user.league.users.append(user)
+
     def __repr__(self):
         return (
             "<{0.__class__.__name__} name={0.name!r} count={0.count!r} "
             "group={0.group!r}>".format(self)
         )
+
+
+STREAM_PREFIXES = ("count", "programmingLanguages", "leagues", "users.item")
+"""Prefixes of the values of a streamed challenge or puzzle leaderboard."""
+
+LeagueLeaderboard = typing.Union[ChallengeLeaderboard, PuzzleLeaderboard]
+
+
+def create_streamed_leaderboard(
+    cls: typing.Type[LeagueLeaderboard],
+    state: "ConnectionState",
+    name: str,
+    group: str,
+) -> LeagueLeaderboard:
+    """Create an empty challenge or puzzle leaderboard, filled by
+    :func:`feed_streamed_leaderboard` while its response is received. Its
+    users aren't kept in :attr:`~ChallengeLeaderboard.users` nor in the
+    :attr:`League.users`."""
+
+    return cls(
+        state,
+        name,
+        group,
+        {"count": 0, "users": [], "programmingLanguages": {}},
+    )
+
+
+def feed_streamed_leaderboard(
+    leaderboard: LeagueLeaderboard, prefix: str, value: typing.Any
+) -> typing.Optional[
+    typing.Union[ChallengeRankedCodinGamer, PuzzleRankedCodinGamer]
+]:
+    """Add a value of the streamed response of a leaderboard, see
+    :data:`STREAM_PREFIXES`. Returns the ranked CodinGamer if the value is a
+    user."""
+
+    if prefix == "users.item":
+        return leaderboard._USER_CLASS(leaderboard._state, leaderboard, value)
+
+    if prefix == "count":
+        leaderboard._setattr("count", value)
+    elif prefix == "programmingLanguages":
+        leaderboard._setattr("programming_languages", value)
+    elif prefix == "leagues":
+        for data in value.values():
+            league = _get_league(leaderboard, data)
+            league._setattr("count", data["divisionAgentsCount"])
+    return None
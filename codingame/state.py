@@ -1,3 +1,4 @@
+import threading
 import typing
 
 from .http import HTTPClient
@@ -9,17 +10,33 @@ __all__ = ("ConnectionState",)
 
 
 class ConnectionState:
-    """Saves information about the state of the connection to the API."""
+    """Saves information about the state of the connection to the API.
+
+    Every keyword argument is passed to the HTTP client, see :class:`Client`
+    for the available options.
+
+    The state can be shared between threads, its changes are made while
+    holding :attr:`lock`."""
 
     http: "HTTPClient"
     logged_in: bool
     codingamer: typing.Optional["CodinGamer"]
+    lock: threading.RLock
 
-    def __init__(self, is_async: bool = False):
-        self.http = HTTPClient(self, is_async)
+    def __init__(self, is_async: bool = False, **http_options):
+        self.http = HTTPClient(self, is_async, **http_options)
 
         self.logged_in = False
         self.codingamer = None
+        self.lock = threading.RLock()
+
+    def set_logged_in(self, codingamer: "CodinGamer"):
+        """Set the CodinGamer that is logged in."""
+
+        with self.lock:
+            # codingamer first so that it's set when logged_in is True
+            self.codingamer = codingamer
+            self.logged_in = True
 
     @property
     def is_async(self) -> bool:
@@ -52,6 +52,10 @@ def get_requirements(filename: str = "requirements.txt") -> typing.List[str]:
 
 extra_requires = {
     "async": get_requirements("async-requirements.txt"),
+    "speedups": get_requirements("speedups-requirements.txt"),
+    "http2": get_requirements("http2-requirements.txt"),
+    "tracing": get_requirements("tracing-requirements.txt"),
+    "streaming": get_requirements("streaming-requirements.txt"),
 }
 
 setup(
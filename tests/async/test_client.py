@@ -1,13 +1,15 @@
 import datetime
 import os
 
+import aiohttp
 import pytest
 
 from codingame import exceptions
 from codingame.clash_of_code import ClashOfCode
-from codingame.client import Client
+from codingame.client import Client, raw
 from codingame.client.async_ import AsyncClient
 from codingame.codingamer import CodinGamer
+from codingame.http import HTTPError
 from codingame.leaderboard import (
     ChallengeLeaderboard,
     ChallengeRankedCodinGamer,
@@ -29,6 +31,22 @@ async def test_client_create():
     assert client.is_async is True
 
 
+async def test_client_create_connector_options():
+    client = Client(is_async=True, limit=10, limit_per_host=5)
+    connector = client._state.http._get_session().connector
+    assert connector.limit == 10
+    assert connector.limit_per_host == 5
+    await client.close()
+
+
+async def test_client_create_with_session():
+    session = aiohttp.ClientSession()
+    async with Client(is_async=True, session=session) as client:
+        assert client._state.http._AsyncHTTPClient__session is session
+    assert session.closed is False
+    await session.close()
+
+
 async def test_client_context_manager():
     async with Client(is_async=True) as client:
         assert client.logged_in is False
@@ -131,6 +149,37 @@ async def test_client_get_codingamer_error(
         await client.get_codingamer(codingamer_query)
 
 
+async def test_client_get_codingamers(client: AsyncClient, mock_http):
+    mock_http(client._state.http, "search")
+    mock_http(client._state.http, "get_codingamer_from_id")
+    mock_http(client._state.http, "get_codingamer_from_handle")
+
+    queries = [
+        int(os.environ.get("TEST_CODINGAMER_ID")),
+        os.environ.get("TEST_CODINGAMER_PSEUDO"),
+        os.environ.get("TEST_CODINGAMER_PUBLIC_HANDLE"),
+        os.environ.get("TEST_CODINGAMER_PSEUDO"),
+    ]
+    codingamers = await client.get_codingamers(queries, concurrency=2)
+    assert list(codingamers) == queries[:3]
+    assert all(isinstance(c, CodinGamer) for c in codingamers.values())
+
+
+async def test_client_get_codingamers_error(
+    client: AsyncClient, mock_http, mock_httperror
+):
+    mock_http(client._state.http, "search", [])
+    mock_httperror(client._state.http, "get_codingamer_from_id", {"id": 404})
+
+    codingamers = await client.get_codingamers([0, "nonexistent"])
+    assert all(
+        isinstance(c, exceptions.CodinGamerNotFound)
+        for c in codingamers.values()
+    )
+    with pytest.raises(ValueError):
+        await client.get_codingamers([0], concurrency=0)
+
+
 async def test_client_get_clash_of_code(client: AsyncClient, mock_http):
     mock_http(client._state.http, "get_clash_of_code_from_handle")
     clash_of_code = await client.get_clash_of_code(
@@ -387,6 +436,64 @@ async def test_client_get_global_leaderboard_error(client: AsyncClient):
         await client.get_global_leaderboard(group="country")
 
 
+async def test_client_iter_global_leaderboard(
+    client: AsyncClient, mock_global_leaderboard
+):
+    pages = mock_global_leaderboard(client._state.http, count=250)
+    users = [user async for user in client.iter_global_leaderboard()]
+    assert [user.rank for user in users] == list(range(1, 251))
+    assert isinstance(users[0], GlobalRankedCodinGamer)
+    assert pages == [1, 2, 3]
+
+
+async def test_client_iter_global_leaderboard_stop(
+    client: AsyncClient, mock_global_leaderboard
+):
+    pages = mock_global_leaderboard(client._state.http, count=1000)
+    users = [
+        user async for user in client.iter_global_leaderboard(stop_rank=150)
+    ]
+    assert [user.rank for user in users] == list(range(1, 151))
+    assert pages == [1, 2]
+
+    pages.clear()
+    users = [
+        user
+        async for user in client.iter_global_leaderboard(start_page=2, limit=50)
+    ]
+    assert [user.rank for user in users] == list(range(101, 151))
+    assert pages == [2]
+
+
+async def test_client_iter_global_leaderboard_pages(
+    client: AsyncClient, mock_global_leaderboard
+):
+    mock_global_leaderboard(client._state.http, count=1000, page_size=10)
+    leaderboards = [
+        lb
+        async for lb in client.iter_global_leaderboard_pages(
+            range(1, 21), concurrency=4
+        )
+    ]
+    assert [lb.page for lb in leaderboards] == list(range(1, 21))
+    assert isinstance(leaderboards[0], GlobalLeaderboard)
+
+    leaderboards = [
+        lb
+        async for lb in client.iter_global_leaderboard_pages(
+            range(1, 21), ordered=False
+        )
+    ]
+    assert sorted(lb.page for lb in leaderboards) == list(range(1, 21))
+
+
+async def test_client_iter_global_leaderboard_pages_error(client: AsyncClient):
+    with pytest.raises(ValueError):
+        await client.iter_global_leaderboard_pages(
+            [1], concurrency=0
+        ).__anext__()
+
+
 @pytest.mark.parametrize(
     "challenge_id", ["coders-strike-back", "spring-challenge-2021"]
 )
@@ -443,3 +550,115 @@ async def test_client_get_puzzle_leaderboard_error(client: AsyncClient):
         await client.get_puzzle_leaderboard("codingame-optim", group="country")
     with pytest.raises(exceptions.PuzzleNotFound):
         await client.get_puzzle_leaderboard("nonexistent")
+
+
+async def test_client_iter_challenge_leaderboard(
+    client: AsyncClient, mock_stream, streamed_leaderboard: dict
+):
+    mock_stream(client._state.http, streamed_leaderboard)
+    users = [
+        user
+        async for user in client.iter_challenge_leaderboard(
+            "spring-challenge-2021"
+        )
+    ]
+    assert [user.rank for user in users] == [1, 2, 3, 4, 5]
+    assert isinstance(users[0], ChallengeRankedCodinGamer)
+
+    leaderboard = users[0].leaderboard
+    assert isinstance(leaderboard, ChallengeLeaderboard)
+    assert leaderboard.count == 5
+    assert leaderboard.programming_languages == {"Python3": 5}
+    assert [league.count for league in leaderboard.leagues] == [3, 2]
+    assert users[3].league is leaderboard.leagues[0]
+
+
+async def test_client_iter_puzzle_leaderboard(
+    client: AsyncClient, mock_stream, streamed_leaderboard: dict
+):
+    mock_stream(client._state.http, streamed_leaderboard, chunk_size=1)
+    users = [
+        user async for user in client.iter_puzzle_leaderboard("codingame-optim")
+    ]
+    assert [user.rank for user in users] == [1, 2, 3, 4, 5]
+    assert isinstance(users[0], PuzzleRankedCodinGamer)
+    assert isinstance(users[0].leaderboard, PuzzleLeaderboard)
+
+
+async def test_client_iter_leaderboard_error(client: AsyncClient, mocker):
+    with pytest.raises(ValueError):
+        await client.iter_challenge_leaderboard(
+            "x", group="nonexistent"
+        ).__anext__()
+    with pytest.raises(exceptions.LoginRequired):
+        await client.iter_puzzle_leaderboard("x", group="country").__anext__()
+
+    def mock_httperror(api_data: dict):
+        async def fake_stream(*_):
+            raise HTTPError(422, "", api_data)
+            yield  # pragma: no cover
+
+        mocker.patch.object(client._state.http, "_stream", new=fake_stream)
+
+    mock_httperror({"id": 702})
+    with pytest.raises(exceptions.ChallengeNotFound):
+        await client.iter_challenge_leaderboard("nonexistent").__anext__()
+    mock_httperror({"code": "INVALID_PARAMETERS"})
+    with pytest.raises(exceptions.PuzzleNotFound):
+        await client.iter_puzzle_leaderboard("nonexistent").__anext__()
+
+
+async def test_client_raw(mock_http, mock_global_leaderboard):
+    async with Client(is_async=True, raw=True) as client:
+        mock_http(client._state.http, "get_codingamer_from_handle")
+        codingamer = await client.get_codingamer(
+            os.environ.get("TEST_CODINGAMER_PUBLIC_HANDLE")
+        )
+        assert isinstance(codingamer, dict)
+
+        with raw(False):
+            codingamer = await client.get_codingamer(
+                os.environ.get("TEST_CODINGAMER_PUBLIC_HANDLE")
+            )
+            assert isinstance(codingamer, CodinGamer)
+
+        mock_global_leaderboard(client._state.http, count=250)
+        users = [
+            user async for user in client.iter_global_leaderboard(stop_rank=150)
+        ]
+        assert all(isinstance(user, dict) for user in users)
+        assert [user["rank"] for user in users] == list(range(1, 151))
+
+
+async def test_client_raw_login(mock_http):
+    async with Client(is_async=True, raw=True) as client:
+        mock_http(client._state.http, "get_codingamer_from_id")
+        mock_http(client._state.http, "get_codingamer_from_handle")
+        mock_http(
+            client._state.http,
+            "get_global_leaderboard",
+            {"count": 0, "users": []},
+        )
+        codingamer = await client.login(
+            remember_me_cookie=os.environ.get("TEST_LOGIN_REMEMBER_ME_COOKIE"),
+        )
+        assert isinstance(codingamer, CodinGamer)
+        assert client.codingamer is codingamer
+
+        # logged in methods use the public handle of the CodinGamer
+        leaderboard = await client.get_global_leaderboard()
+        assert isinstance(leaderboard, dict)
+
+
+async def test_client_raw_stream(
+    client: AsyncClient, mock_stream, streamed_leaderboard: dict
+):
+    mock_stream(client._state.http, streamed_leaderboard)
+    with raw():
+        users = [
+            user
+            async for user in client.iter_challenge_leaderboard(
+                "spring-challenge-2021"
+            )
+        ]
+    assert users == streamed_leaderboard["users"]
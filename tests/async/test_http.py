@@ -0,0 +1,432 @@
+import asyncio
+import json
+
+import pytest
+
+from codingame.client import Client
+from codingame.http import (
+    CircuitBreaker,
+    CircuitOpen,
+    DeadlineExceeded,
+    HedgePolicy,
+    HTTPError,
+    MemoryCache,
+    Metrics,
+    RecordReplayTransport,
+    RetryPolicy,
+    Timeout,
+    deadline,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_http_request_retry(mocker):
+    client = Client(is_async=True, retry=RetryPolicy(backoff_base=0))
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[HTTPError(503, "", None), {"ok": True}],
+    )
+    assert await client.request("Service", "func") == {"ok": True}
+    assert send.call_count == 2
+    await client.close()
+
+
+async def test_http2_request_retry_timeout(mocker):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    client = Client(
+        is_async=True, http2=True, retry=RetryPolicy(backoff_base=0)
+    )
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[asyncio.TimeoutError(), {"ok": True}],
+    )
+    assert await client.request("Service", "func") == {"ok": True}
+    assert send.call_count == 2
+    await client.close()
+
+
+async def test_http_request_retry_exhausted(mocker):
+    client = Client(
+        is_async=True, retry=RetryPolicy(max_attempts=2, backoff_base=0)
+    )
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=HTTPError(503, "", None)
+    )
+    with pytest.raises(HTTPError):
+        await client.request("Service", "func")
+    assert send.call_count == 2
+    await client.close()
+
+
+async def test_http_request_cache(mocker):
+    cache = MemoryCache(ttls={"Service": 60})
+    client = Client(is_async=True, cache=cache)
+    send = mocker.patch.object(
+        client._state.http, "_request", return_value={"ok": True}
+    )
+    assert await client.request("Service", "func") == {"ok": True}
+    assert await client.request("Service", "func") == {"ok": True}
+    assert send.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    await client.close()
+
+
+async def test_http_request_coalesce(mocker):
+    client = Client(is_async=True, coalesce=True)
+
+    async def fake_request(*_):
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=fake_request
+    )
+    results = await asyncio.gather(
+        *(client.request("Search", "search", ["pseudo"]) for _ in range(10))
+    )
+    assert results == [{"ok": True}] * 10
+    assert send.call_count == 1
+    await client.close()
+
+
+async def test_http_request_coalesce_error(mocker):
+    client = Client(is_async=True, coalesce=True)
+
+    async def fake_request(*_):
+        await asyncio.sleep(0.1)
+        raise HTTPError(422, "", None)
+
+    mocker.patch.object(
+        client._state.http, "_request", side_effect=fake_request
+    )
+    results = await asyncio.gather(
+        *(client.request("Search", "search", ["pseudo"]) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, HTTPError) for result in results)
+    await client.close()
+
+
+async def test_http_request_coalesce_cancel(mocker):
+    client = Client(is_async=True, coalesce=True)
+
+    async def fake_request(*_):
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=fake_request
+    )
+    leader = asyncio.ensure_future(
+        client.request("Search", "search", ["pseudo"])
+    )
+    await asyncio.sleep(0)  # let the leader send the request
+    follower = asyncio.ensure_future(
+        client.request("Search", "search", ["pseudo"])
+    )
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == {"ok": True}
+    assert leader.cancelled()
+    assert send.call_count == 1
+    await client.close()
+
+
+async def test_http_request_coalesce_deadline(mocker):
+    client = Client(is_async=True, coalesce=True)
+
+    async def fake_request(*_):
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=fake_request
+    )
+
+    async def request_with_deadline():
+        with deadline(0.1):
+            return await client.request("Search", "search", ["pseudo"])
+
+    leader = asyncio.ensure_future(request_with_deadline())
+    await asyncio.sleep(0)  # let the leader send the request
+    follower = client.request("Search", "search", ["pseudo"])
+
+    assert await follower == {"ok": True}
+    with pytest.raises(DeadlineExceeded):
+        await leader
+    assert send.call_count == 2
+    await client.close()
+
+
+@pytest.mark.parametrize("http2", [False, True])
+async def test_http_json_loads(mocker, echo_server, http2: bool):
+    json_loads = mocker.Mock(return_value={"ok": True})
+    client = Client(is_async=True, json_loads=json_loads, http2=http2)
+    assert client._state.http.json_loads is json_loads
+
+    client._state.http.API_URL = echo_server
+    assert await client.request("Echo", "echo", ["a"]) == {"ok": True}
+    (body,), _ = json_loads.call_args
+    assert isinstance(body, bytes)
+    assert json.loads(body)["parameters"] == ["a"]
+    await client.close()
+
+
+async def test_http2():
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    def handler(request: "httpx.Request"):
+        if request.url.path.endswith("/fail"):
+            return httpx.Response(503, json={"id": 503})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = Client(is_async=True, http2=True)
+    http = client._state.http
+    assert http.__class__.__name__ == "AsyncHTTP2Client"
+    assert http._AsyncHTTP2Client__session is None  # created on first request
+    http._AsyncHTTP2Client__session = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    assert await client.request("Service", "func") == {
+        "path": "/services/Service/func"
+    }
+    with pytest.raises(HTTPError) as error:
+        await client.request("Service", "fail")
+    assert error.value.status_code == 503
+    assert error.value.data == {"id": 503}
+    await client.close()
+
+
+async def test_record_replay_transport(mocker, tmp_path):
+    path = str(tmp_path / "responses.json")
+    transport = RecordReplayTransport(path, mode="record", is_async=True)
+    client = Client(is_async=True, transport=transport)
+    mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[{"ok": True}, HTTPError(404, "Not Found", {"id": 404})],
+    )
+    assert await client.request("Service", "func", [1]) == {"ok": True}
+    with pytest.raises(HTTPError):
+        await client.request("Service", "func", [2])
+    await client.close()
+
+    transport = RecordReplayTransport(path, latency=0.01, is_async=True)
+    client = Client(is_async=True, transport=transport)
+    send = mocker.patch.object(client._state.http, "_request")
+    results = await asyncio.gather(
+        *(client.request("Service", "func", [1]) for _ in range(10))
+    )
+    assert results == [{"ok": True}] * 10
+    with pytest.raises(HTTPError) as error:
+        await client.request("Service", "func", [2])
+    assert error.value.status_code == 404
+    assert send.call_count == 0
+    await client.close()
+
+
+async def test_http_request_timeout(mocker):
+    client = Client(is_async=True, timeouts={"Service/func": 5})
+    send = mocker.patch.object(
+        client._state.http, "_request", return_value={"ok": True}
+    )
+    await client.request("Service", "func")
+    assert send.call_args.args[3] == Timeout(5)
+    await client.close()
+
+
+async def test_deadline_exceeded(mocker):
+    client = Client(
+        is_async=True, retry=RetryPolicy(backoff_base=0.05, jitter=False)
+    )
+
+    async def slow_request(*_):
+        await asyncio.sleep(0.05)
+        raise HTTPError(503, "", None)
+
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=slow_request
+    )
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0.08):
+            await asyncio.gather(
+                client.request("Service", "func"),
+                client.request("Service", "func"),
+            )
+    assert send.call_count == 2
+    await client.close()
+
+
+def slow_first_request(delays):
+    delays = iter(delays)
+
+    async def request(*_):
+        await asyncio.sleep(next(delays))
+        return {"ok": True}
+
+    return request
+
+
+async def test_http_request_hedge(mocker):
+    hedge = HedgePolicy(delay=0.02)
+    client = Client(is_async=True, hedge=hedge)
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=slow_first_request([1, 0]),
+    )
+    start = asyncio.get_running_loop().time()
+    assert await client.request("Search", "search", ["a"]) == {"ok": True}
+    assert asyncio.get_running_loop().time() - start < 0.5
+    assert send.call_count == 2
+    assert hedge.sent == hedge.won == 1
+    await client.close()
+
+
+async def test_http_request_hedge_not_read_only(mocker):
+    hedge = HedgePolicy(delay=0)
+    client = Client(is_async=True, hedge=hedge)
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=slow_first_request([0.02]),
+    )
+    assert await client.request("Service", "func") == {"ok": True}
+    assert send.call_count == 1
+    assert hedge.sent == 0
+    await client.close()
+
+
+async def test_http_request_hedge_budget(mocker):
+    hedge = HedgePolicy(delay=0, max_ratio=0.5, burst=1)
+    client = Client(is_async=True, hedge=hedge)
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=slow_first_request([0.02] * 5),
+    )
+    for _ in range(3):
+        assert await client.request("Search", "search", ["a"]) == {"ok": True}
+    assert hedge.sent == 2
+    assert send.call_count == 5
+    await client.close()
+
+
+async def test_http_request_hedge_error(mocker):
+    hedge = HedgePolicy(delay=0.01)
+    client = Client(is_async=True, hedge=hedge)
+
+    async def request(*_):
+        await asyncio.sleep(0.02)
+        raise HTTPError(404, "", None)
+
+    mocker.patch.object(client._state.http, "_request", side_effect=request)
+    with pytest.raises(HTTPError):
+        await client.request("Search", "search", ["a"])
+    assert hedge.sent == 1
+    assert hedge.won == 0
+    await client.close()
+
+
+async def test_circuit_breaker(mocker):
+    breaker = CircuitBreaker(min_requests=2, cooldown=60)
+    client = Client(
+        is_async=True,
+        circuit_breaker=breaker,
+        retry=RetryPolicy(max_attempts=5, backoff_base=0),
+    )
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=HTTPError(502, "", None)
+    )
+    # the retries stop as soon as the circuit opens
+    with pytest.raises(CircuitOpen):
+        await client.request("Leaderboards", "func")
+    assert send.call_count == 2
+    await client.close()
+
+
+async def test_http_middlewares(mocker):
+    client = Client(is_async=True)
+
+    @client.add_middleware
+    async def short_circuit(request, call_next):
+        if request.service == "Cached":
+            return {"cached": True}
+        return await call_next(request)
+
+    send = mocker.patch.object(
+        client._state.http, "_request", return_value={"ok": True}
+    )
+    assert await client.request("Cached", "func") == {"cached": True}
+    assert await client.request("Service", "func") == {"ok": True}
+    assert send.call_count == 1
+
+    with pytest.raises(TypeError):
+        client.add_middleware(lambda request, call_next: None)
+    await client.close()
+
+
+async def test_metrics(mocker):
+    metrics = Metrics(buckets=[1, 0.1])
+    client = Client(is_async=True, metrics=metrics, hedge=HedgePolicy(1))
+    mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[{"ok": True}, asyncio.TimeoutError()],
+    )
+    await client.request("Search", "search", ["a"])
+    with pytest.raises(asyncio.TimeoutError):
+        await client.request("Search", "search", ["b"])
+    await client.close()
+
+    endpoint = metrics.get("Search", "search")
+    assert endpoint.requests == 2
+    assert endpoint.errors == {"TimeoutError": 1}
+    assert endpoint.latency.buckets == (0.1, 1)
+    assert endpoint.latency.counts == [2, 0, 0]
+
+
+async def test_tracing(mocker, span_exporter, tracer_provider):
+    client = Client(is_async=True, tracer_provider=tracer_provider)
+    mocker.patch.object(
+        client._state.http, "_request", return_value=["Python3"]
+    )
+    assert await client.get_language_ids() == ["Python3"]
+    await client.close()
+
+    request, method = span_exporter.get_finished_spans()
+    assert method.name == "Client.get_language_ids"
+    assert request.name == "POST ProgrammingLanguage/findAllIds"
+    assert request.parent.span_id == method.context.span_id
+
+
+def test_http_lazy_session():
+    # no running event loop is needed to create and close the client
+    client = Client(is_async=True)
+    http = client._state.http
+    assert http._AsyncHTTPClient__session is None
+    asyncio.run(client.close())  # nothing to close
+    assert http._AsyncHTTPClient__session is None
+
+
+async def test_http_lazy_session_cookies():
+    client = Client(is_async=True)
+    http = client._state.http
+    http.set_cookie("rememberMe", "cookie")
+    assert http._AsyncHTTPClient__session is None
+
+    session = http._get_session()
+    assert session is http._get_session()
+    cookies = {cookie.key: cookie for cookie in session.cookie_jar}
+    assert cookies["rememberMe"].value == "cookie"
+    assert cookies["rememberMe"]["domain"] == "www.codingame.com"
+    await client.close()
+    assert session.closed
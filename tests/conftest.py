@@ -1,6 +1,8 @@
+import http.server
 import json
 import os
 import sys
+import threading
 import typing
 
 import pytest
@@ -185,3 +187,177 @@ def mock_httperror_fixture(mocker: MockerFixture):
         )
 
     return mock_httperror
+
+
+@pytest.fixture(name="mock_global_leaderboard")
+def mock_global_leaderboard_fixture(mocker: MockerFixture):
+    def fake_user(rank: int) -> dict:
+        return {
+            "rank": rank,
+            "score": 1000.0 - rank,
+            "xp": 0,
+            "achievements": 0,
+            "clash": 0,
+            "codegolf": 0,
+            "contests": 0,
+            "multiTraining": 0,
+            "optim": 0,
+            "codingamer": {
+                "publicHandle": f"{rank:032x}{rank:07}",
+                "userId": rank,
+                "level": 1,
+            },
+        }
+
+    def mock_global_leaderboard(
+        http_client: "HTTPClient", count: int, page_size: int = 100
+    ):
+        """Mock a global leaderboard of ``count`` users, returns the list of
+        the requested pages."""
+
+        pages = []
+
+        def fake_api_call(page: int, *_):
+            pages.append(page)
+            first = (page - 1) * page_size + 1
+            data = {
+                "count": count,
+                "users": [
+                    fake_user(rank)
+                    for rank in range(first, min(first + page_size, count + 1))
+                ],
+            }
+            return awaitable(data) if http_client.is_async else data
+
+        mocker.patch.object(
+            http_client, "get_global_leaderboard", new=fake_api_call
+        )
+        return pages
+
+    return mock_global_leaderboard
+
+
+@pytest.fixture(name="span_exporter")
+def span_exporter_fixture():
+    """Exporter keeping the spans of the ``tracer_provider`` fixture."""
+
+    pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    yield exporter
+    exporter.shutdown()
+
+
+@pytest.fixture(name="tracer_provider")
+def tracer_provider_fixture(span_exporter):
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    return provider
+
+
+@pytest.fixture(name="mock_stream")
+def mock_stream_fixture(mocker: MockerFixture):
+    def mock_stream(http_client: "HTTPClient", data, chunk_size: int = 16):
+        """Mock the streamed responses with ``data`` encoded and sent in
+        chunks of ``chunk_size`` bytes."""
+
+        body = json.dumps(data).encode()
+        chunks = [
+            body[i : i + chunk_size]  # noqa: E203
+            for i in range(0, len(body), chunk_size)
+        ]
+
+        if http_client.is_async:
+
+            async def fake_stream(*_):
+                for chunk in chunks:
+                    yield chunk
+
+        else:
+
+            def fake_stream(*_):
+                yield from chunks
+
+        mocker.patch.object(http_client, "_stream", new=fake_stream)
+
+    return mock_stream
+
+
+@pytest.fixture(name="streamed_leaderboard")
+def streamed_leaderboard_fixture() -> dict:
+    def fake_user(rank: int) -> dict:
+        return {
+            "rank": rank,
+            "score": 100.0 - rank,
+            "programmingLanguage": "Python3",
+            "testSessionHandle": f"{rank:039}",
+            "localRank": rank,
+            "league": {
+                "divisionCount": 2,
+                "divisionIndex": 1 if rank <= 2 else 0,
+                "divisionAgentsCount": 0,
+            },
+            "codingamer": {
+                "publicHandle": f"{rank:032x}{rank:07}",
+                "userId": rank,
+                "level": 1,
+            },
+        }
+
+    # the leagues come after the users to check that they are merged
+    return {
+        "count": 5,
+        "users": [fake_user(rank) for rank in range(1, 6)],
+        "programmingLanguages": {"Python3": 5},
+        "leagues": {
+            "0": {
+                "divisionCount": 2,
+                "divisionIndex": 0,
+                "divisionAgentsCount": 3,
+            },
+            "1": {
+                "divisionCount": 2,
+                "divisionIndex": 1,
+                "divisionAgentsCount": 2,
+            },
+        },
+    }
+
+
+class EchoHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        response = json.dumps(
+            {"parameters": json.loads(body), "cookie": self.headers["Cookie"]}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def echo_server():
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), EchoHandler, bind_and_activate=False
+    )
+    server.request_queue_size = 128
+    server.server_bind()
+    server.server_activate()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}/services/".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
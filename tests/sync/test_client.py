@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import os
 
@@ -5,9 +6,12 @@ import pytest
 
 from codingame import exceptions
 from codingame.clash_of_code import ClashOfCode
-from codingame.client import Client
+from codingame.client import Client, raw
+from codingame.client.background import BackgroundClient
 from codingame.client.sync import SyncClient
 from codingame.codingamer import CodinGamer
+from codingame.http import Metrics, deadline
+from codingame.http.timeout import get_remaining
 from codingame.leaderboard import (
     ChallengeLeaderboard,
     ChallengeRankedCodinGamer,
@@ -27,6 +31,16 @@ def test_client_create():
     assert client.is_async is False
 
 
+def test_client_create_pool_options():
+    client = Client(pool_maxsize=64, pool_block=True, keep_alive=False)
+    session = client._state.http.session
+    adapter = session.get_adapter("https://www.codingame.com")
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert session.headers["Connection"] == "close"
+    client.close()
+
+
 def test_client_context_manager():
     with Client() as client:
         assert client.logged_in is False
@@ -122,6 +136,37 @@ def test_client_get_codingamer_error(
         client.get_codingamer(codingamer_query)
 
 
+def test_client_get_codingamers(client: SyncClient, mock_http):
+    mock_http(client._state.http, "search")
+    mock_http(client._state.http, "get_codingamer_from_id")
+    mock_http(client._state.http, "get_codingamer_from_handle")
+
+    queries = [
+        int(os.environ.get("TEST_CODINGAMER_ID")),
+        os.environ.get("TEST_CODINGAMER_PSEUDO"),
+        os.environ.get("TEST_CODINGAMER_PUBLIC_HANDLE"),
+        os.environ.get("TEST_CODINGAMER_PSEUDO"),
+    ]
+    codingamers = client.get_codingamers(queries, concurrency=2)
+    assert list(codingamers) == queries[:3]
+    assert all(isinstance(c, CodinGamer) for c in codingamers.values())
+
+
+def test_client_get_codingamers_error(
+    client: SyncClient, mock_http, mock_httperror
+):
+    mock_http(client._state.http, "search", [])
+    mock_httperror(client._state.http, "get_codingamer_from_id", {"id": 404})
+
+    codingamers = client.get_codingamers([0, "nonexistent"])
+    assert all(
+        isinstance(c, exceptions.CodinGamerNotFound)
+        for c in codingamers.values()
+    )
+    with pytest.raises(ValueError):
+        client.get_codingamers([0], concurrency=0)
+
+
 def test_client_get_clash_of_code(client: SyncClient, mock_http):
     mock_http(client._state.http, "get_clash_of_code_from_handle")
     clash_of_code = client.get_clash_of_code(
@@ -358,6 +403,51 @@ def test_client_get_global_leaderboard_error(client: SyncClient):
         client.get_global_leaderboard(group="country")
 
 
+def test_client_iter_global_leaderboard(
+    client: SyncClient, mock_global_leaderboard
+):
+    pages = mock_global_leaderboard(client._state.http, count=250)
+    users = list(client.iter_global_leaderboard())
+    assert [user.rank for user in users] == list(range(1, 251))
+    assert isinstance(users[0], GlobalRankedCodinGamer)
+    assert pages == [1, 2, 3]
+
+
+def test_client_iter_global_leaderboard_stop(
+    client: SyncClient, mock_global_leaderboard
+):
+    pages = mock_global_leaderboard(client._state.http, count=1000)
+    users = list(client.iter_global_leaderboard(stop_rank=150))
+    assert [user.rank for user in users] == list(range(1, 151))
+    assert pages == [1, 2]
+
+    pages.clear()
+    users = list(client.iter_global_leaderboard(start_page=2, limit=50))
+    assert [user.rank for user in users] == list(range(101, 151))
+    assert pages == [2]
+
+
+def test_client_iter_global_leaderboard_pages(
+    client: SyncClient, mock_global_leaderboard
+):
+    mock_global_leaderboard(client._state.http, count=1000, page_size=10)
+    leaderboards = list(
+        client.iter_global_leaderboard_pages(range(1, 21), concurrency=4)
+    )
+    assert [lb.page for lb in leaderboards] == list(range(1, 21))
+    assert isinstance(leaderboards[0], GlobalLeaderboard)
+
+    leaderboards = client.iter_global_leaderboard_pages(
+        range(1, 21), ordered=False
+    )
+    assert sorted(lb.page for lb in leaderboards) == list(range(1, 21))
+
+
+def test_client_iter_global_leaderboard_pages_error(client: SyncClient):
+    with pytest.raises(ValueError):
+        next(client.iter_global_leaderboard_pages([1], concurrency=0))
+
+
 @pytest.mark.parametrize(
     "challenge_id", ["coders-strike-back", "spring-challenge-2021"]
 )
@@ -410,3 +500,241 @@ def test_client_get_puzzle_leaderboard_error(client: SyncClient):
         client.get_puzzle_leaderboard("codingame-optim", group="country")
     with pytest.raises(exceptions.PuzzleNotFound):
         client.get_puzzle_leaderboard("nonexistent")
+
+
+def test_client_iter_challenge_leaderboard(
+    client: SyncClient, mock_stream, streamed_leaderboard: dict
+):
+    mock_stream(client._state.http, streamed_leaderboard)
+    users = client.iter_challenge_leaderboard("spring-challenge-2021")
+    user = next(users)
+    assert isinstance(user, ChallengeRankedCodinGamer)
+    assert user.rank == 1
+    assert user.league.index == 1
+
+    users = [user, *users]
+    assert [user.rank for user in users] == [1, 2, 3, 4, 5]
+
+    leaderboard = user.leaderboard
+    assert isinstance(leaderboard, ChallengeLeaderboard)
+    assert leaderboard.count == 5
+    assert leaderboard.programming_languages == {"Python3": 5}
+    assert leaderboard.has_leagues is True
+    assert [league.index for league in leaderboard.leagues] == [0, 1]
+    assert [league.count for league in leaderboard.leagues] == [3, 2]
+    assert users[3].league is leaderboard.leagues[0]
+
+
+def test_client_iter_puzzle_leaderboard(
+    client: SyncClient, mock_stream, streamed_leaderboard: dict
+):
+    mock_stream(client._state.http, streamed_leaderboard, chunk_size=1)
+    users = list(client.iter_puzzle_leaderboard("codingame-optim"))
+    assert [user.rank for user in users] == [1, 2, 3, 4, 5]
+    assert isinstance(users[0], PuzzleRankedCodinGamer)
+    assert isinstance(users[0].leaderboard, PuzzleLeaderboard)
+    assert users[0].leaderboard.leagues[1].count == 2
+
+
+def test_client_model_metrics(mock_http, mock_stream, streamed_leaderboard):
+    metrics = Metrics()
+    with Client(metrics=metrics) as client:
+        mock_http(client._state.http, "get_codingamer_from_id")
+        mock_http(client._state.http, "get_codingamer_from_handle")
+        client.login(
+            remember_me_cookie=os.environ.get("TEST_LOGIN_REMEMBER_ME_COOKIE"),
+        )
+        mock_http(client._state.http, "get_unseen_notifications")
+        list(client.get_unseen_notifications())
+
+        mock_stream(client._state.http, streamed_leaderboard)
+        list(client.iter_challenge_leaderboard("spring-challenge-2021"))
+
+    notifications = metrics.get("Notification", "findUnseenNotifications")
+    assert notifications.model_time.count == 1
+    leaderboard = metrics.get("Leaderboards", "getFilteredChallengeLeaderboard")
+    # the users, the count, the programming languages and the leagues
+    assert (
+        leaderboard.model_time.count == len(streamed_leaderboard["users"]) + 3
+    )
+
+
+def test_client_iter_leaderboard_error(client: SyncClient, mock_httperror):
+    with pytest.raises(ValueError):
+        next(client.iter_challenge_leaderboard("x", group="nonexistent"))
+    with pytest.raises(exceptions.LoginRequired):
+        next(client.iter_puzzle_leaderboard("x", group="country"))
+
+    mock_httperror(client._state.http, "_stream", {"id": 702})
+    with pytest.raises(exceptions.ChallengeNotFound):
+        next(client.iter_challenge_leaderboard("nonexistent"))
+    mock_httperror(
+        client._state.http, "_stream", {"code": "INVALID_PARAMETERS"}
+    )
+    with pytest.raises(exceptions.PuzzleNotFound):
+        next(client.iter_puzzle_leaderboard("nonexistent"))
+
+
+def test_client_iter_leaderboard_truncated(client: SyncClient, mocker):
+    mocker.patch.object(
+        client._state.http, "_stream", new=lambda *_: iter([b'{"count": 1, "u'])
+    )
+    with pytest.raises(ValueError):
+        list(client.iter_challenge_leaderboard("spring-challenge-2021"))
+
+
+def test_background_client(echo_server: str):
+    with Client(background=True) as client:
+        assert isinstance(client, BackgroundClient)
+        assert client.is_async is False
+        assert client.client.is_async is True
+        client.client._state.http.API_URL = echo_server
+
+        assert client.request("Echo", "echo", [1])["parameters"] == [1]
+
+        future = client.submit(client.request, "Echo", "echo", [2])
+        assert future.result()["parameters"] == [2]
+
+        results = client.map(
+            client.request,
+            ["Echo"] * 100,
+            ["echo"] * 100,
+            [[index] for index in range(100)],
+            concurrency=16,
+        )
+        assert [result["parameters"] for result in results] == [
+            [index] for index in range(100)
+        ]
+
+    with pytest.raises(RuntimeError):
+        client.request("Echo", "echo", [3])
+
+
+def test_background_client_context():
+    async def remaining(index: int = 0):
+        await asyncio.sleep(0)
+        return get_remaining()
+
+    with Client(background=True) as client:
+        assert client.run(remaining()) is None
+        with deadline(10):
+            assert 0 < client.submit(remaining).result() <= 10
+            results = list(client.map(remaining, range(10)))
+            assert len(results) == 10
+            assert all(0 < result <= 10 for result in results)
+
+
+def test_background_client_iter_leaderboard(
+    mock_stream, streamed_leaderboard: dict
+):
+    with Client(background=True) as client:
+        mock_stream(client.client._state.http, streamed_leaderboard)
+        users = list(client.iter_challenge_leaderboard("spring-challenge-2021"))
+        assert [user.rank for user in users] == [1, 2, 3, 4, 5]
+        assert users[0].leaderboard.count == 5
+
+
+def test_client_raw(mock_http, mock_global_leaderboard):
+    with Client(raw=True) as client:
+        mock_http(client._state.http, "get_codingamer_from_handle")
+        codingamer = client.get_codingamer(
+            os.environ.get("TEST_CODINGAMER_PUBLIC_HANDLE")
+        )
+        assert isinstance(codingamer, dict)
+        assert codingamer["publicHandle"] == os.environ.get(
+            "TEST_CODINGAMER_PUBLIC_HANDLE"
+        )
+
+        with raw(False):
+            codingamer = client.get_codingamer(
+                os.environ.get("TEST_CODINGAMER_PUBLIC_HANDLE")
+            )
+            assert isinstance(codingamer, CodinGamer)
+
+        mock_global_leaderboard(client._state.http, count=250)
+        users = list(client.iter_global_leaderboard(stop_rank=150))
+        assert all(isinstance(user, dict) for user in users)
+        assert [user["rank"] for user in users] == list(range(1, 151))
+
+
+def test_client_raw_login(mock_http):
+    with Client(raw=True) as client:
+        mock_http(client._state.http, "get_codingamer_from_id")
+        mock_http(client._state.http, "get_codingamer_from_handle")
+        mock_http(
+            client._state.http,
+            "get_global_leaderboard",
+            {"count": 0, "users": []},
+        )
+        codingamer = client.login(
+            remember_me_cookie=os.environ.get("TEST_LOGIN_REMEMBER_ME_COOKIE"),
+        )
+        assert isinstance(codingamer, CodinGamer)
+        assert client.codingamer is codingamer
+
+        # logged in methods use the public handle of the CodinGamer
+        leaderboard = client.get_global_leaderboard()
+        assert isinstance(leaderboard, dict)
+
+
+def test_client_raw_notifications(auth_client: SyncClient, mock_http):
+    mock_http(auth_client._state.http, "get_unseen_notifications")
+    with raw():
+        notifications = list(auth_client.get_unseen_notifications())
+    assert notifications
+    assert all(isinstance(n, dict) for n in notifications)
+    assert all("typeGroup" in n for n in notifications)
+
+
+def test_client_raw_stream(
+    client: SyncClient, mock_stream, streamed_leaderboard: dict
+):
+    mock_stream(client._state.http, streamed_leaderboard)
+    with raw():
+        users = list(client.iter_challenge_leaderboard("spring-challenge-2021"))
+    assert users == streamed_leaderboard["users"]
+
+
+def test_background_client_raw(mock_stream, streamed_leaderboard: dict):
+    with Client(background=True, raw=True) as client:
+        mock_stream(client.client._state.http, streamed_leaderboard)
+        users = list(client.iter_puzzle_leaderboard("codingame-optim"))
+        assert users == streamed_leaderboard["users"]
+
+        with raw(False):
+            users = list(client.iter_puzzle_leaderboard("codingame-optim"))
+        assert isinstance(users[0], PuzzleRankedCodinGamer)
+
+
+def test_background_client_tracing_stream(
+    caplog,
+    mock_stream,
+    streamed_leaderboard: dict,
+    span_exporter,
+    tracer_provider,
+):
+    with Client(background=True, tracer_provider=tracer_provider) as client:
+        mock_stream(client.client._state.http, streamed_leaderboard)
+        users = list(client.iter_challenge_leaderboard("spring-challenge-2021"))
+        assert len(users) == 5
+
+    # each item is read in another context by the background client
+    assert "Failed to detach context" not in caplog.text
+    (request,) = span_exporter.get_finished_spans()
+    assert request.name.startswith("POST Leaderboards/")
+
+
+def test_background_client_error():
+    async def fail(value):
+        raise ValueError(value)
+
+    with pytest.raises(ValueError):
+        Client(is_async=True, background=True)
+
+    with Client(background=True) as client:
+        with pytest.raises(ValueError, match="1"):
+            client.run(fail(1))
+        with pytest.raises(ValueError, match="2"):
+            list(client.map(fail, [2, 3]))
+        with pytest.raises(ValueError):
+            client.map(fail, [4], concurrency=0)
@@ -0,0 +1,722 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from codingame.client import Client
+from codingame.client.sync import submit
+from codingame.http import (
+    CircuitBreaker,
+    CircuitOpen,
+    DeadlineExceeded,
+    HedgePolicy,
+    HTTPError,
+    MemoryCache,
+    Metrics,
+    RateLimiter,
+    RecordReplayTransport,
+    Request,
+    ResponseNotRecorded,
+    RetryPolicy,
+    SQLiteCache,
+    Timeout,
+    TokenBucket,
+    deadline,
+    get_json_loads,
+)
+from codingame.http.timeout import get_remaining
+
+
+def test_retry_policy_delay():
+    retry = RetryPolicy(max_attempts=3, backoff_base=1, jitter=False)
+    assert retry.get_delay(1, HTTPError(503, "", None)) == 1
+    assert retry.get_delay(2, HTTPError(503, "", None)) == 2
+    assert retry.get_delay(3, HTTPError(503, "", None)) is None
+    assert retry.get_delay(1, HTTPError(422, "", None)) is None
+    assert retry.get_delay(1, ConnectionError()) == 1
+
+
+def test_retry_policy_retry_after():
+    retry = RetryPolicy(backoff_cap=10)
+    error = HTTPError(429, "", None, {"Retry-After": "4"})
+    assert retry.get_delay(1, error) == 4
+    error = HTTPError(429, "", None, {"Retry-After": "60"})
+    assert retry.get_delay(1, error) == 10
+
+
+def test_retry_policy_error():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_http_request_retry(mocker):
+    client = Client(retry=RetryPolicy(backoff_base=0))
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[HTTPError(503, "", None), {"ok": True}],
+    )
+    assert client.request("Service", "func") == {"ok": True}
+    assert send.call_count == 2
+    client.close()
+
+
+def test_http_request_retry_exhausted(mocker):
+    client = Client(retry=RetryPolicy(max_attempts=2, backoff_base=0))
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=HTTPError(503, "", None)
+    )
+    with pytest.raises(HTTPError):
+        client.request("Service", "func")
+    assert send.call_count == 2
+    client.close()
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=1, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(1, abs=0.1)
+    assert bucket.reserve() == pytest.approx(2, abs=0.1)
+
+
+def test_rate_limiter_services():
+    limiter = RateLimiter(rate=100, services={"Leaderboards": 1})
+    assert limiter.reserve("Leaderboards") == 0
+    assert limiter.reserve("Leaderboards") == pytest.approx(1, abs=0.1)
+    assert limiter.reserve("CodinGamer") == 0
+
+
+def test_http_request_rate_limit(mocker):
+    client = Client(rate_limiter=RateLimiter(services={"Service": 1}))
+    mocker.patch.object(client._state.http, "_request", return_value=None)
+    sleep = mocker.patch("time.sleep")
+    client.request("Service", "func")
+    client.request("Service", "func")
+    assert sleep.call_args_list[0].args[0] == 0
+    assert sleep.call_args_list[1].args[0] == pytest.approx(1, abs=0.1)
+    client.close()
+
+
+def test_memory_cache():
+    cache = MemoryCache(maxsize=2, ttls={"Service/func": 60})
+    assert cache.get_ttl("Service", "func") == 60
+    assert cache.get_ttl("Service", "other") is None
+
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    assert cache.get("a") == 1
+    cache.set("c", 3, 60)  # evicts b, the least recently used
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    cache.set("d", None, -1)  # already expired
+    assert cache.get("d", "default") == "default"
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_http_request_cache(mocker):
+    cache = MemoryCache(ttls={"Service": 60})
+    client = Client(cache=cache)
+    send = mocker.patch.object(
+        client._state.http, "_request", return_value={"ok": True}
+    )
+    assert client.request("Service", "func", [1]) == {"ok": True}
+    assert client.request("Service", "func", [1]) == {"ok": True}
+    assert client.request("Service", "func", [2]) == {"ok": True}
+    client.request("Other", "func")
+    client.request("Other", "func")
+    assert send.call_count == 4
+    assert (cache.hits, cache.misses) == (1, 2)
+    client.close()
+
+
+def test_sqlite_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCache(path)
+    cache.set("a", {"data": [1, 2, 3]}, 60)
+    cache.set("b", None, -1)  # already expired
+    assert cache.get("a") == {"data": [1, 2, 3]}
+    assert cache.get("b", "default") == "default"
+    cache.close()
+
+    cache = SQLiteCache(path)  # persisted between instances
+    assert cache.get("a") == {"data": [1, 2, 3]}
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_sqlite_cache_eviction(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_size=50)
+    cache.set("a", "a" * 20, 60)
+    cache.set("b", "b" * 20, 60)
+    cache.set("c", "".join(map(str, range(15))), 60)  # too big to keep all
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
+    cache.close()
+
+
+def test_http_request_coalesce(mocker):
+    client = Client(coalesce=True)
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_request(*_):
+        started.set()
+        release.wait(5)
+        return {"ok": True}
+
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=fake_request
+    )
+    with ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(client.request, "Search", "search", ["pseudo"])
+            for _ in range(4)
+        ]
+        started.wait(5)
+        time.sleep(0.1)  # let the other threads wait for the first request
+        release.set()
+        assert [f.result() for f in futures] == [{"ok": True}] * 4
+
+    assert send.call_count == 1
+    client.close()
+
+
+def test_http_request_coalesce_deadline(mocker):
+    client = Client(coalesce=True)
+    started = threading.Event()
+
+    def fake_request(service, func, parameters, timeout):
+        started.set()
+        if timeout.total < 1:  # limited by the deadline
+            time.sleep(timeout.total)
+            raise TimeoutError()
+        time.sleep(0.2)
+        return {"ok": True}
+
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=fake_request
+    )
+
+    def request_with_deadline():
+        with deadline(0.1):
+            return client.request("Search", "search", ["pseudo"])
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(request_with_deadline)
+        started.wait(5)
+        follower = executor.submit(
+            client.request, "Search", "search", ["pseudo"]
+        )
+        with pytest.raises(TimeoutError):
+            leader.result()
+        assert follower.result() == {"ok": True}
+
+    assert send.call_count == 2
+    client.close()
+
+
+def test_get_json_loads():
+    json_loads = get_json_loads()
+    assert json_loads(b'{"a": [1, null]}') == {"a": [1, None]}
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_http_json_loads(mocker, echo_server, http2: bool):
+    json_loads = mocker.Mock(return_value={"ok": True})
+    client = Client(json_loads=json_loads, http2=http2)
+    assert client._state.http.json_loads is json_loads
+
+    client._state.http.API_URL = echo_server
+    assert client.request("Echo", "echo", ["a"]) == {"ok": True}
+    (body,), _ = json_loads.call_args
+    assert isinstance(body, bytes)
+    assert json.loads(body)["parameters"] == ["a"]
+    client.close()
+
+
+def test_http2():
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    def handler(request: "httpx.Request"):
+        if request.url.path.endswith("/fail"):
+            return httpx.Response(503, json={"id": 503})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = Client(http2=True)
+    http = client._state.http
+    assert http.__class__.__name__ == "SyncHTTP2Client"
+    assert http._SyncHTTP2Client__session is None  # created on first request
+    http._SyncHTTP2Client__session = httpx.Client(
+        transport=httpx.MockTransport(handler)
+    )
+
+    assert client.request("Service", "func") == {
+        "path": "/services/Service/func"
+    }
+    with pytest.raises(HTTPError) as error:
+        client.request("Service", "fail")
+    assert error.value.status_code == 503
+    assert error.value.data == {"id": 503}
+    client.close()
+
+
+def test_record_replay_transport(mocker, tmp_path):
+    path = str(tmp_path / "responses.json")
+    transport = RecordReplayTransport(path, mode="record")
+    client = Client(transport=transport)
+    mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[{"ok": True}, HTTPError(404, "Not Found", {"id": 404})],
+    )
+    assert client.request("Service", "func", [1]) == {"ok": True}
+    with pytest.raises(HTTPError):
+        client.request("Service", "func", [2])
+    client.close()
+
+    client = Client(transport=RecordReplayTransport(path, latency=0.01))
+    send = mocker.patch.object(client._state.http, "_request")
+    start = time.perf_counter()
+    assert client.request("Service", "func", [1]) == {"ok": True}
+    assert time.perf_counter() - start >= 0.01
+    with pytest.raises(HTTPError) as error:
+        client.request("Service", "func", [2])
+    assert error.value.status_code == 404
+    assert error.value.data == {"id": 404}
+    with pytest.raises(ResponseNotRecorded):
+        client.request("Service", "func", [3])
+    assert send.call_count == 0
+    client.close()
+
+
+def test_record_replay_transport_error(tmp_path):
+    path = str(tmp_path / "responses.json")
+    with pytest.raises(ValueError):
+        RecordReplayTransport(path, mode="mock")
+    with pytest.raises(FileNotFoundError):
+        RecordReplayTransport(path)
+    with pytest.raises(ValueError):
+        Client(transport=RecordReplayTransport(path, "record", is_async=True))
+
+
+def test_http_timeouts():
+    client = Client(
+        timeout=5,
+        timeouts={"Leaderboards": 20, "Search/search": Timeout(connect=1)},
+    )
+    http = client._state.http
+    assert http._get_timeout("CodinGamer", "findFollowers") == Timeout(5)
+    assert http._get_timeout("Leaderboards", "getGlobalLeaderboard") == (
+        Timeout(20)
+    )
+    assert http._get_timeout("Search", "search") == Timeout(connect=1)
+    client.close()
+
+
+def test_http_request_timeout(mocker):
+    client = Client(timeout=Timeout(total=5, connect=1))
+    send = mocker.patch.object(
+        client._state.http, "_request", return_value={"ok": True}
+    )
+    client.request("Service", "func")
+    assert send.call_args.args[3] == Timeout(total=5, connect=1)
+
+    with deadline(2):
+        client.request("Service", "func")
+    timeout: Timeout = send.call_args.args[3]
+    assert 1.9 < timeout.total <= 2
+    assert timeout.connect == 1
+    client.close()
+
+
+def test_deadline_exceeded(mocker):
+    client = Client(retry=RetryPolicy(backoff_base=0.05, jitter=False))
+
+    def slow_request(*_):
+        time.sleep(0.05)
+        raise HTTPError(503, "", None)
+
+    send = mocker.patch.object(
+        client._state.http, "_request", side_effect=slow_request
+    )
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0.08):
+            client.request("Service", "func")
+    assert send.call_count == 1
+    client.close()
+
+
+def test_deadline_nested():
+    assert get_remaining() is None
+    with deadline(1):
+        with deadline(5):
+            assert get_remaining() <= 1
+        with ThreadPoolExecutor() as executor:
+            assert executor.submit(get_remaining).result() is None
+            assert submit(executor, get_remaining).result() <= 1
+    assert get_remaining() is None
+
+
+def test_hedge_policy():
+    hedge = HedgePolicy(delay=1, percentile=50, min_samples=4, window=4)
+    assert hedge.can_hedge("Search/search", True)
+    assert not hedge.can_hedge("Service/func", False)
+    assert hedge.get_delay("Search/search") == 1
+    for latency in (0.1, 0.4, 0.2, 0.3, 5):
+        hedge.add_latency("Search/search", latency, False)
+    assert hedge.get_delay("Search/search") == 0.3
+    assert hedge.get_delay("CodinGamer/findFollowers") == 1
+
+    hedge = HedgePolicy(max_ratio=0.5, burst=1, endpoints=["Service/func"])
+    assert hedge.can_hedge("Service/func", False)
+    assert not hedge.can_hedge("Search/search", True)
+    hedge.add_request()
+    assert hedge.acquire()
+    hedge.add_request()
+    assert not hedge.acquire()
+    hedge.add_request()
+    assert hedge.acquire()
+    assert hedge.sent == 2
+
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=0)
+
+
+def test_circuit_breaker(mocker):
+    breaker = CircuitBreaker(min_requests=4, cooldown=0.05)
+    client = Client(circuit_breaker=breaker)
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[
+            {"ok": True},
+            HTTPError(404, "", None),
+            HTTPError(503, "", None),
+            HTTPError(503, "", None),
+            {"ok": True},
+        ],
+    )
+    client.request("Leaderboards", "func")
+    for _ in range(3):
+        with pytest.raises(HTTPError):
+            client.request("Leaderboards", "func")
+    assert breaker.get_state("Leaderboards") == "open"
+    assert breaker.get_state("CodinGamer") == "closed"
+
+    with pytest.raises(CircuitOpen) as error:
+        client.request("Leaderboards", "func")
+    assert error.value.service == "Leaderboards"
+    assert 0 < error.value.retry_after <= 0.05
+    assert send.call_count == 4
+
+    time.sleep(0.05)
+    assert breaker.get_state("Leaderboards") == "half-open"
+    assert client.request("Leaderboards", "func") == {"ok": True}
+    assert breaker.get_state("Leaderboards") == "closed"
+    client.close()
+
+
+def test_circuit_breaker_half_open():
+    breaker = CircuitBreaker(min_requests=1, cooldown=0.01)
+    breaker.before_request("Service")
+    breaker.after_request("Service", ConnectionError())
+    assert breaker.get_state("Service") == "open"
+
+    time.sleep(0.01)
+    breaker.before_request("Service")
+    with pytest.raises(CircuitOpen):
+        breaker.before_request("Service")  # a single request is let through
+    breaker.after_request("Service", HTTPError(500, "", None))
+    assert breaker.get_state("Service") == "open"
+
+    time.sleep(0.01)
+    breaker.before_request("Service")
+    breaker.after_request("Service", KeyboardInterrupt())
+    breaker.before_request("Service")
+    breaker.after_request("Service")
+    assert breaker.get_state("Service") == "closed"
+
+
+def test_http_middlewares(mocker):
+    calls = []
+
+    def log(request: Request, call_next):
+        calls.append(("log", request.endpoint))
+        try:
+            response = call_next(request)
+        except HTTPError as error:
+            calls.append(("error", error.status_code))
+            raise
+        calls.append(("response", response, request.elapsed >= 0))
+        return response
+
+    client = Client(middlewares=[log])
+
+    @client.add_middleware
+    def rewrite(request: Request, call_next):
+        request.parameters = [request.parameters[0] * 2]
+        return call_next(request)
+
+    send = mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=[{"ok": True}, HTTPError(404, "", None)],
+    )
+    assert client.request("Service", "func", [1]) == {"ok": True}
+    assert send.call_args.args[:3] == ("Service", "func", [2])
+    with pytest.raises(HTTPError):
+        client.request("Service", "func", [1])
+    assert calls == [
+        ("log", "Service/func"),
+        ("response", {"ok": True}, True),
+        ("log", "Service/func"),
+        ("error", 404),
+    ]
+
+    client.remove_middleware(log)
+    assert client._state.http.middlewares == [rewrite]
+
+    async def async_middleware(request, call_next):
+        return await call_next(request)  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        client.add_middleware(async_middleware)
+    client.close()
+
+
+def test_metrics(tmp_path):
+    with open("tests/mock/responses/get_codingamer_from_handle.json") as f:
+        codingamer = f.read()
+    handle = json.loads(codingamer)["codingamer"]["publicHandle"]
+    path = tmp_path / "responses.json"
+    path.write_text(
+        json.dumps(
+            {
+                "responses": {
+                    "CodinGamer/findCodingamePointsStatsByHandle"
+                    f'["{handle}"]': {
+                        "status": 200,
+                        "reason": "OK",
+                        "body": codingamer,
+                    },
+                    'Service/func["fail"]': {
+                        "status": 503,
+                        "reason": "Service Unavailable",
+                        "body": "{}",
+                    },
+                }
+            }
+        )
+    )
+
+    metrics = Metrics()
+    client = Client(transport=RecordReplayTransport(str(path)), metrics=metrics)
+    client.get_codingamer(handle)
+    with pytest.raises(HTTPError):
+        client.request("Service", "func", ["fail"])
+    client.close()
+
+    endpoint = metrics.get("CodinGamer", "findCodingamePointsStatsByHandle")
+    assert endpoint.requests == 1
+    assert endpoint.errors == {}
+    assert endpoint.bytes_received == len(codingamer.encode())
+    assert endpoint.latency.count == endpoint.decode_time.count == 1
+    assert endpoint.model_time.count == 1
+    assert metrics.get("Service", "func").errors == {"503": 1}
+    assert len(metrics.endpoints) == 2
+
+    exported = metrics.export()
+    assert "# TYPE codingame_requests counter" in exported
+    assert (
+        'codingame_request_errors_total{service="Service",func="func",'
+        'error="503"} 1'
+    ) in exported
+    assert (
+        'codingame_request_duration_seconds_bucket{service="Service",'
+        'func="func",le="+Inf"} 1'
+    ) in exported
+    assert exported.endswith("# EOF\n")
+    exported = metrics.export(openmetrics=False)
+    assert "# TYPE codingame_requests_total counter" in exported
+    assert "# EOF" not in exported
+
+    metrics.reset()
+    assert metrics.endpoints == []
+
+
+def mock_responses(service: str, func: str, parameters: list, timeout):
+    method = {
+        "search": "search",
+        "findCodingamePointsStatsByHandle": "get_codingamer_from_handle",
+        "findCodinGamerPublicInformations": "get_codingamer_from_id",
+    }[func]
+    with open(f"tests/mock/responses/{method}.json") as f:
+        return json.load(f)
+
+
+def test_tracing(mocker, span_exporter, tracer_provider):
+    client = Client(tracer_provider=tracer_provider)
+    mocker.patch.object(
+        client._state.http, "_request", side_effect=mock_responses
+    )
+    client.get_codingamer("Takos")
+    client.close()
+
+    search, stats, method = span_exporter.get_finished_spans()
+    assert method.name == "Client.get_codingamer"
+    assert method.parent is None
+    assert search.name == "POST Search/search"
+    assert stats.name == "POST CodinGamer/findCodingamePointsStatsByHandle"
+    for span in (search, stats):
+        assert span.parent.span_id == method.context.span_id
+        assert span.attributes["http.request.method"] == "POST"
+    assert stats.attributes["codingame.service"] == "CodinGamer"
+
+
+def test_tracing_error(mocker, span_exporter, tracer_provider):
+    client = Client(tracer_provider=tracer_provider)
+    mocker.patch.object(
+        client._state.http,
+        "_request",
+        side_effect=HTTPError(503, "", None),
+    )
+    with pytest.raises(HTTPError):
+        client.request("Service", "func")
+    client.close()
+
+    (request,) = span_exporter.get_finished_spans()
+    assert request.attributes["http.response.status_code"] == 503
+    assert request.attributes["error.type"] == "503"
+    assert not request.status.is_ok
+
+    span_exporter.clear()
+    client = Client(tracer_provider=tracer_provider, tracing=False)
+    mocker.patch.object(client._state.http, "_request", return_value={})
+    client.request("Service", "func")
+    client.close()
+    assert span_exporter.get_finished_spans() == ()
+
+
+def test_http_threads(echo_server):
+    client = Client(pool_maxsize=16)
+    http_client = client._state.http
+    http_client.API_URL = echo_server
+    http_client.set_cookie("rememberMe", "cookie", domain="127.0.0.1")
+
+    def send(index: int):
+        return http_client.request("Echo", "echo", [index, str(index)])
+
+    with ThreadPoolExecutor(64) as executor:
+        results = list(executor.map(send, range(1000)))
+
+    for index, result in enumerate(results):
+        assert result == {
+            "parameters": [index, str(index)],
+            "cookie": "rememberMe=cookie",
+        }
+    client.close()
+
+
+def test_client_login_threads(mocker):
+    client = Client()
+    with open("tests/mock/responses/get_codingamer_from_handle.json") as f:
+        data = json.load(f)
+
+    def get_codingamer_from_handle(handle: str):
+        codingamer = dict(data["codingamer"], userId=int(handle[-7:]))
+        return dict(data, codingamer=codingamer)
+
+    mocker.patch.object(
+        client._state.http,
+        "get_codingamer_from_id",
+        side_effect=lambda id: {"publicHandle": "0" * 32 + str(id)},
+    )
+    mocker.patch.object(
+        client._state.http,
+        "get_codingamer_from_handle",
+        side_effect=get_codingamer_from_handle,
+    )
+
+    def login(index: int):
+        codingamer = client.login(
+            remember_me_cookie=str(1000000 + index) + "0" * 32
+        )
+        with client._state.lock:
+            assert client.logged_in
+            assert client.codingamer is not None
+        return codingamer.id
+
+    with ThreadPoolExecutor(16) as executor:
+        ids = list(executor.map(login, range(100)))
+
+    assert ids == list(range(1000000, 1000100))
+    assert client.codingamer.id in ids
+    client.close()
+
+
+def test_http_lazy_session(echo_server):
+    client = Client()
+    http_client = client._state.http
+    assert http_client._SyncHTTPClient__adapter is None
+    assert http_client._tracer is None
+    client.close()  # nothing to close
+
+    http_client.API_URL = echo_server
+    http_client.set_cookie("rememberMe", "cookie", domain="127.0.0.1")
+    assert http_client.request("Echo", "echo") == {
+        "parameters": [],
+        "cookie": "rememberMe=cookie",
+    }
+    assert http_client._SyncHTTPClient__adapter is not None
+    client.close()
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_http_stream(echo_server, http2: bool):
+    with Client(http2=http2) as client:
+        http_client = client._state.http
+        http_client.API_URL = echo_server
+        items = http_client.stream(
+            "Echo", "echo", [1, {"a": [2]}, 3], ("parameters.item",)
+        )
+        assert list(items) == [
+            ("parameters.item", 1),
+            ("parameters.item", {"a": [2]}),
+            ("parameters.item", 3),
+        ]
+
+
+def test_tracing_stream(echo_server, span_exporter, tracer_provider):
+    from opentelemetry import trace
+
+    with Client(tracer_provider=tracer_provider) as client:
+        http_client = client._state.http
+        http_client.API_URL = echo_server
+        items = http_client.stream("Echo", "echo", [1, 2], ("parameters.item",))
+        for _ in items:
+            # the request span isn't the parent of the spans of the caller
+            assert not trace.get_current_span().is_recording()
+
+    (request,) = span_exporter.get_finished_spans()
+    assert request.name == "POST Echo/echo"
+    assert request.attributes["codingame.func"] == "echo"
+
+
+def test_metrics_stream(echo_server):
+    metrics = Metrics()
+    with Client(metrics=metrics) as client:
+        http_client = client._state.http
+        http_client.API_URL = echo_server
+        items = http_client.stream("Echo", "echo", [1, 2], ("parameters.item",))
+        assert [value for _, value in items] == [1, 2]
+
+    endpoint = metrics.get("Echo", "echo")
+    assert endpoint.requests == 1
+    assert endpoint.errors == {}
+    assert endpoint.bytes_received > 0
+    assert endpoint.latency.count == endpoint.decode_time.count == 1
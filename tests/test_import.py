@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import pytest
+
+import codingame
+import codingame.http
+
+# maximum number of microseconds to import the package, the public names are
+# imported lazily so this only covers codingame/__init__.py
+IMPORT_TIME_BUDGET = 50_000
+
+
+def get_import_time(module: str) -> int:
+    """Import a module in a new interpreter and get the cumulative import time
+    of the module in microseconds, measured with ``-X importtime``."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        if name == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} wasn't imported")  # pragma: no cover
+
+
+def test_import_time():
+    # the best of a few runs to ignore the noise of the machine
+    import_time = min(get_import_time("codingame") for _ in range(5))
+    assert import_time < IMPORT_TIME_BUDGET, (
+        f"import codingame took {import_time / 1000:.1f}ms, more than the "
+        f"budget of {IMPORT_TIME_BUDGET / 1000:.1f}ms"
+    )
+
+
+def test_import_lazy():
+    code = (
+        "import sys, codingame; "
+        "print(' '.join(m for m in sys.modules if m.startswith("
+        "('codingame.', 'asyncio', 'requests', 'aiohttp', 'opentelemetry'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == []
+
+
+@pytest.mark.parametrize("module", [codingame, codingame.http])
+def test_lazy_names(module):
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+    with pytest.raises(AttributeError):
+        module.DoesNotExist